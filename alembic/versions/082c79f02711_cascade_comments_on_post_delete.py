@@ -0,0 +1,85 @@
+"""delete comments with their post via ON DELETE CASCADE
+
+Revision ID: 082c79f02711
+Revises: 76efa710280b
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "082c79f02711"
+down_revision: Union[str, Sequence[str], None] = "76efa710280b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# PostgreSQL이 이름 없는 외래 키에 붙이는 기본 이름
+FK_NAME = "comments_post_id_fkey"
+# SQLite의 이름 없는 외래 키를 batch 모드에서 찾기 위한 이름 규칙
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+# SQLite에서 테이블을 다시 만들면 comments 테이블의 트리거도 함께 삭제되므로,
+# 전문 검색(76efa710280b) 동기화 트리거를 다시 만듭니다.
+SQLITE_COMMENT_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_fts_ai AFTER INSERT ON comments BEGIN
+        INSERT INTO comments_fts(rowid, content, post_id)
+        VALUES (new.id, new.content, new.post_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_fts_ad AFTER DELETE ON comments BEGIN
+        INSERT INTO comments_fts(comments_fts, rowid, content, post_id)
+        VALUES ('delete', old.id, old.content, old.post_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_fts_au
+    AFTER UPDATE OF content, post_id ON comments BEGIN
+        INSERT INTO comments_fts(comments_fts, rowid, content, post_id)
+        VALUES ('delete', old.id, old.content, old.post_id);
+        INSERT INTO comments_fts(rowid, content, post_id)
+        VALUES (new.id, new.content, new.post_id);
+    END
+    """,
+]
+
+
+def _replace_post_fk(ondelete: str | None) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint(FK_NAME, "comments", type_="foreignkey")
+        op.create_foreign_key(
+            FK_NAME, "comments", "posts", ["post_id"], ["id"], ondelete=ondelete
+        )
+        return
+
+    # SQLite는 제약 조건을 변경할 수 없으므로 batch 모드로 테이블을 다시 만듭니다.
+    with op.batch_alter_table(
+        "comments", naming_convention=NAMING_CONVENTION
+    ) as batch_op:
+        batch_op.drop_constraint(FK_NAME, type_="foreignkey")
+        batch_op.create_foreign_key(
+            FK_NAME, "posts", ["post_id"], ["id"], ondelete=ondelete
+        )
+    # 전문 검색 마이그레이션이 적용된 DB에서만 트리거를 다시 만듭니다.
+    has_fts = op.get_bind().exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE name = 'comments_fts'"
+    )
+    if has_fts.first() is not None:
+        for statement in SQLITE_COMMENT_TRIGGERS:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_post_fk(ondelete="CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_post_fk(ondelete=None)
@@ -0,0 +1,127 @@
+"""add full-text search index over posts and comments
+
+Revision ID: 76efa710280b
+Revises: b8c78afea32c
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "76efa710280b"
+down_revision: Union[str, Sequence[str], None] = "b8c78afea32c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite: 원본 테이블을 참조하는(external content) FTS5 가상 테이블 + 동기화 트리거
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE posts_fts USING fts5(
+        title, content, content='posts', content_rowid='id'
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE comments_fts USING fts5(
+        content, post_id UNINDEXED, content='comments', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO posts_fts(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER comments_fts_ai AFTER INSERT ON comments BEGIN
+        INSERT INTO comments_fts(rowid, content, post_id)
+        VALUES (new.id, new.content, new.post_id);
+    END
+    """,
+    """
+    CREATE TRIGGER comments_fts_ad AFTER DELETE ON comments BEGIN
+        INSERT INTO comments_fts(comments_fts, rowid, content, post_id)
+        VALUES ('delete', old.id, old.content, old.post_id);
+    END
+    """,
+    """
+    CREATE TRIGGER comments_fts_au AFTER UPDATE OF content, post_id ON comments BEGIN
+        INSERT INTO comments_fts(comments_fts, rowid, content, post_id)
+        VALUES ('delete', old.id, old.content, old.post_id);
+        INSERT INTO comments_fts(rowid, content, post_id)
+        VALUES (new.id, new.content, new.post_id);
+    END
+    """,
+    # 기존 데이터로 색인을 채웁니다.
+    "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')",
+    "INSERT INTO comments_fts(comments_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS comments_fts_au",
+    "DROP TRIGGER IF EXISTS comments_fts_ad",
+    "DROP TRIGGER IF EXISTS comments_fts_ai",
+    "DROP TRIGGER IF EXISTS posts_fts_au",
+    "DROP TRIGGER IF EXISTS posts_fts_ad",
+    "DROP TRIGGER IF EXISTS posts_fts_ai",
+    "DROP TABLE IF EXISTS comments_fts",
+    "DROP TABLE IF EXISTS posts_fts",
+]
+
+# PostgreSQL: 생성 컬럼(tsvector) + GIN 인덱스
+POSTGRESQL_UPGRADE = [
+    """
+    ALTER TABLE posts ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    """
+    ALTER TABLE comments ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(content, ''))
+    ) STORED
+    """,
+    "CREATE INDEX ix_posts_search_vector ON posts USING gin (search_vector)",
+    "CREATE INDEX ix_comments_search_vector ON comments USING gin (search_vector)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_comments_search_vector",
+    "DROP INDEX IF EXISTS ix_posts_search_vector",
+    "ALTER TABLE comments DROP COLUMN IF EXISTS search_vector",
+    "ALTER TABLE posts DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRESQL_UPGRADE}
+    for statement in statements.get(dialect, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRESQL_DOWNGRADE}
+    for statement in statements.get(dialect, []):
+        op.execute(statement)
@@ -0,0 +1,34 @@
+"""add posts.version for strong ETags
+
+Revision ID: 786b04b7f5bf
+Revises: bcf761eeb829
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "786b04b7f5bf"
+down_revision: Union[str, Sequence[str], None] = "bcf761eeb829"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "posts",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("posts") as batch_op:
+        batch_op.drop_column("version")
@@ -0,0 +1,56 @@
+"""add listing indexes on posts and comments
+
+Revision ID: 7fc3cc386241
+Revises:
+Create Date: 2026-10-18 09:45:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7fc3cc386241"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_comments_post_id_id", "comments", ["post_id", "id"]),
+    ("ix_comments_user_id_id", "comments", ["user_id", "id"]),
+    ("ix_posts_user_id_id_desc", "posts", ["user_id", sa.text("id DESC")]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL에서는 CONCURRENTLY로 생성하여 운영 중에도 쓰기를 막지 않습니다.
+    # CONCURRENTLY는 트랜잭션 밖에서 실행되어야 하므로 autocommit 블록을 사용합니다.
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=concurrently,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=concurrently,
+            )
@@ -0,0 +1,39 @@
+"""add denormalized comment_count to posts
+
+Revision ID: b8c78afea32c
+Revises: 7fc3cc386241
+Create Date: 2026-10-18 10:05:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c78afea32c"
+down_revision: Union[str, Sequence[str], None] = "7fc3cc386241"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "posts",
+        sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # 기존 댓글 수로 채웁니다.
+    op.execute(
+        "UPDATE posts SET comment_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("posts") as batch_op:
+        batch_op.drop_column("comment_count")
@@ -1,22 +1,33 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import Depends, HTTPException, Path, status
+from fastapi import Depends, HTTPException, Path, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import user_cache
+from app.core.rate_limit import rate_limiter
 from app.core.security import verify_access_token
-from app.crud.user import get_user_by_id
-from app.db.session import get_db
-from app.models import User
+from app.crud.comment import COMMENT_FIELDS
+from app.crud.post import POST_FIELDS
+from app.crud.user import get_user_by_id_async
+from app.db.session import get_async_db, get_db
+from app.schema.user import UserSnapshot
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login")
 
 DbSession = Annotated[Session, Depends(get_db)]
+AsyncDbSession = Annotated[AsyncSession, Depends(get_async_db)]
 
 
-def get_current_user(
-    db: DbSession, token: Annotated[str, Depends(oauth2_scheme)]
-) -> User:
+async def get_current_token(
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> dict[str, Any]:
+    """
+    액세스 토큰을 검증하고 클레임을 반환합니다.
+
+    검증된 클레임은 만료 시각까지 캐시되며, 로그아웃으로 폐기된 토큰은 거절합니다.
+    """
     payload = verify_access_token(token)
     if payload is None:
         raise HTTPException(
@@ -25,21 +36,154 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id = payload.get("sub")
-    if not user_id:
+    if not payload.get("sub"):
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token payload invalid"
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token payload invalid",
         )
 
-    user = get_user_by_id(db, int(user_id))
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
-        )
+    return payload
+
+
+TokenPayload = Annotated[dict[str, Any], Depends(get_current_token)]
+
+
+async def get_current_user(db: AsyncDbSession, payload: TokenPayload) -> UserSnapshot:
+    """
+    토큰으로 인증된 회원을 반환합니다.
+
+    회원 스냅샷(id, role)은 프로세스 내 캐시에 보관되어, 캐시 적중 시 DB 조회를 건너뜁니다.
+    """
+    user_id = int(payload["sub"])
+    user = user_cache.get(user_id)
+    if user is None:
+        db_user = await get_user_by_id_async(db, user_id)
+        if not db_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+            )
+
+        user = UserSnapshot.model_validate(db_user)
+        user_cache.set(user_id, user)
 
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[UserSnapshot, Depends(get_current_user)]
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(scope: str, per_user: bool = False):
+    """
+    `RATE_LIMITS[scope]` 한도를 적용하는 의존성을 만듭니다.
+
+    라우트 데코레이터의 `dependencies`에 넣으면 본문 처리(DB 조회, bcrypt 등) 전에 실행되며,
+    한도를 넘으면 `429 Too Many Requests`와 `Retry-After` 헤더를 반환합니다.
+    `per_user`이면 인증된 회원 단위로, 아니면 클라이언트 IP 단위로 셉니다.
+    """
+    if per_user:
+
+        async def limit_user(user: CurrentUser) -> None:
+            rate_limiter.check(scope, f"user:{user.id}")
+
+        return Depends(limit_user)
+
+    async def limit_ip(request: Request) -> None:
+        rate_limiter.check(scope, f"ip:{client_ip(request)}")
+
+    return Depends(limit_ip)
+
+
 PostId = Annotated[int, Path(title="게시글 ID", ge=1)]
 CommentId = Annotated[int, Path(title="댓글 ID", ge=1)]
+PageCursor = Annotated[
+    str | None,
+    Query(description="이전 응답의 `X-Next-Cursor` 헤더 값 (지정 시 skip은 무시)"),
+]
+
+
+POST_INCLUDES = frozenset({"comments", "author"})
+
+
+def _split_names(values: list[str] | None) -> frozenset[str]:
+    """쉼표로 구분되었거나 반복 지정된 쿼리 파라미터 값을 이름 집합으로 만듭니다."""
+    return frozenset(
+        name.strip()
+        for value in values or []
+        for name in value.split(",")
+        if name.strip()
+    )
+
+
+def get_post_includes(
+    include: Annotated[
+        list[str] | None,
+        Query(description="함께 조회할 관계 (`comments`, `author`, 쉼표로 구분)"),
+    ] = None,
+) -> frozenset[str]:
+    includes = _split_names(include)
+    if not includes <= POST_INCLUDES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid include: {', '.join(sorted(includes - POST_INCLUDES))}",
+        )
+
+    return includes
+
+
+def _sparse_fields(
+    values: list[str] | None, allowed: tuple[str, ...]
+) -> tuple[str, ...] | None:
+    """
+    `fields` 파라미터를 허용된 필드 순서대로 정렬한 튜플로 만듭니다.
+
+    지정하지 않으면 None(기본 필드 전체)을 반환하며, `id`는 항상 포함됩니다.
+    """
+    if not values:
+        return None
+
+    fields = _split_names(values)
+    if unknown := fields - set(allowed):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid fields: {', '.join(sorted(unknown))}",
+        )
+
+    return tuple(name for name in allowed if name in fields or name == "id")
+
+
+def get_post_fields(
+    fields: Annotated[
+        list[str] | None,
+        Query(
+            description=(
+                "응답에 포함할 게시글 필드 (쉼표로 구분, `content_preview` 사용 가능)"
+            )
+        ),
+    ] = None,
+) -> tuple[str, ...] | None:
+    return _sparse_fields(fields, POST_FIELDS)
+
+
+def get_comment_fields(
+    fields: Annotated[
+        list[str] | None,
+        Query(
+            description=(
+                "응답에 포함할 댓글 필드 (쉼표로 구분, `content_preview` 사용 가능)"
+            )
+        ),
+    ] = None,
+) -> tuple[str, ...] | None:
+    return _sparse_fields(fields, COMMENT_FIELDS)
+
+
+PostIncludes = Annotated[frozenset[str], Depends(get_post_includes)]
+PostFields = Annotated[tuple[str, ...] | None, Depends(get_post_fields)]
+CommentFields = Annotated[tuple[str, ...] | None, Depends(get_comment_fields)]
+CommentsLimit = Annotated[
+    int, Query(ge=1, le=100, description="게시글마다 함께 조회할 최대 댓글 수")
+]
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, status
+
+from app.api.deps import AsyncDbSession, CurrentUser
+from app.core.jobs import job_queue
+from app.crud.job import get_job_queue_stats_async, utcnow
+from app.models.job import JOB_DEAD, JOB_PENDING
+from app.schema.job import JobQueueEntry, JobQueueStats
+
+router = APIRouter()
+
+
+@router.get("/jobs", response_model=JobQueueStats, summary="작업 큐 상태 조회")
+async def read_job_queue_stats(user: CurrentUser, db: AsyncDbSession):
+    """
+    백그라운드 작업 큐의 종류/상태별 작업 수와 이 프로세스 워커의 처리 통계를 반환합니다.
+
+    `dead`는 최대 재시도 횟수를 넘겨 실행을 멈춘 작업 수입니다.
+    관리자만 호출할 수 있으며, 권한이 없으면 `403 Forbidden`을 반환합니다.
+    """
+    if user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+
+    queues = [
+        JobQueueEntry.model_validate(row, from_attributes=True)
+        for row in await get_job_queue_stats_async(db)
+    ]
+    pending = [entry for entry in queues if entry.status == JOB_PENDING]
+    oldest = min((entry.oldest_run_at for entry in pending), default=None)
+    return JobQueueStats(
+        pending=sum(entry.count for entry in pending),
+        dead=sum(entry.count for entry in queues if entry.status == JOB_DEAD),
+        oldest_pending_age_seconds=(
+            max(0.0, (utcnow() - oldest).total_seconds()) if oldest else 0.0
+        ),
+        queues=queues,
+        workers_running=job_queue.running,
+        processed=job_queue.stats["processed"],
+        failed=job_queue.stats["failed"],
+        batches=job_queue.stats["batches"],
+    )
@@ -3,10 +3,21 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.deps import DbSession
-from app.core.security import create_access_token, verify_password
-from app.crud.user import create_user, get_user_by_email
-from app.schema.token import Token
+from app.api.deps import AsyncDbSession, TokenPayload, rate_limit
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    revoke_token,
+    verify_and_update_password_async,
+    verify_refresh_token,
+)
+from app.crud.user import (
+    create_user_async,
+    get_user_by_email_async,
+    get_user_by_id_async,
+    update_password_hash_async,
+)
+from app.schema.token import LogoutRequest, RefreshRequest, Token
 from app.schema.user import UserCreate
 
 router = APIRouter()
@@ -14,14 +25,30 @@ router = APIRouter()
 AuthForm = Annotated[OAuth2PasswordRequestForm, Depends()]
 
 
-@router.post("/login", response_model=Token, summary="로그인")
-def login(db: DbSession, form_data: AuthForm) -> dict[str, str]:
+def _issue_tokens(user_id: int) -> dict[str, str]:
+    data = {"sub": str(user_id)}
+    return {
+        "access_token": create_access_token(data),
+        "refresh_token": create_refresh_token(data),
+        "token_type": "bearer",
+    }
+
+
+@router.post(
+    "/login",
+    response_model=Token,
+    summary="로그인",
+    dependencies=[rate_limit("login")],
+)
+async def login(db: AsyncDbSession, form_data: AuthForm) -> dict[str, str]:
     """
-    회원 로그인을 진행하여 액세스 토큰을 반환합니다.
+    회원 로그인을 진행하여 액세스 토큰과 refresh 토큰을 반환합니다.
 
     이메일이나 비밀번호가 틀린 경우, `400 BAD REQUEST` 에러를 반환합니다.
+    비밀번호 검증 작업이 밀려 있는 경우 `503 Service Unavailable`을 반환합니다.
+    IP별 요청 한도를 넘으면 `429 Too Many Requests`를 반환합니다.
     """
-    user = get_user_by_email(db, form_data.username)
+    user = await get_user_by_email_async(db, form_data.username)
 
     if not user:
         raise HTTPException(
@@ -29,29 +56,91 @@ def login(db: DbSession, form_data: AuthForm) -> dict[str, str]:
             detail="Incorrect email or password",
         )
 
-    if not verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = await verify_and_update_password_async(
+        form_data.password, user.hashed_password
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect password"
         )
 
-    access_token = create_access_token(data={"sub": str(user.id)})
+    # 저장된 해시가 오래된 설정으로 만들어졌다면 현재 설정으로 다시 저장합니다.
+    if new_hash:
+        await update_password_hash_async(db, user, new_hash)
+
+    return _issue_tokens(user.id)
+
+
+@router.post(
+    "/refresh",
+    response_model=Token,
+    summary="토큰 재발급",
+    dependencies=[rate_limit("refresh")],
+)
+async def refresh(db: AsyncDbSession, body: RefreshRequest) -> dict[str, str]:
+    """
+    refresh 토큰으로 새 액세스 토큰과 refresh 토큰을 발급합니다.
+
+    사용한 refresh 토큰은 폐기되므로 한 번만 쓸 수 있습니다.
+    토큰이 유효하지 않거나 이미 사용되었으면 `401 Unauthorized`를 반환합니다.
+    """
+    payload = verify_refresh_token(body.refresh_token)
+    # 폐기에 실패하면 동시에 들어온 다른 요청이 먼저 사용한 토큰입니다.
+    if payload is None or not payload.get("sub") or not revoke_token(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+
+    user_id = int(payload["sub"])
+    if await get_user_by_id_async(db, user_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+        )
+
+    return _issue_tokens(user_id)
+
+
+@router.post("/logout", summary="로그아웃")
+async def logout(payload: TokenPayload, body: LogoutRequest | None = None):
+    """
+    현재 액세스 토큰을 만료 시각까지 폐기합니다.
+
+    `refresh_token`을 함께 보내면 같은 회원의 refresh 토큰도 폐기합니다.
+    토큰 ID(jti)가 없는 이전 형식의 토큰은 폐기할 수 없으므로 `400 BAD REQUEST`를 반환하며,
+    이 토큰은 만료될 때까지 유효합니다.
+    """
+    if "jti" not in payload:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Token cannot be revoked. It stays valid until it expires.",
+        )
+
+    revoke_token(payload)
+    if body is not None and body.refresh_token:
+        refresh_payload = verify_refresh_token(body.refresh_token)
+        if refresh_payload is not None and refresh_payload.get("sub") == payload["sub"]:
+            revoke_token(refresh_payload)
 
-    return {"access_token": access_token, "token_type": "bearer"}
+    return {"detail": "Logout Success"}
 
 
-@router.post("/signup", status_code=status.HTTP_201_CREATED, summary="회원가입")
-def signup(user: UserCreate, db: DbSession):
+@router.post(
+    "/signup",
+    status_code=status.HTTP_201_CREATED,
+    summary="회원가입",
+    dependencies=[rate_limit("signup")],
+)
+async def signup(user: UserCreate, db: AsyncDbSession):
     """
     회원가입을 진행합니다.
 
     이미 가입된 회원이면 `400 BAD REQUEST`를 반환합니다.
     """
-    existing_user = get_user_by_email(db, user.email)
-    if existing_user:
+    # 중복 확인용 SELECT 없이 E-mail 유니크 제약으로 판단합니다.
+    if await create_user_async(db, user) is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered."
         )
 
-    create_user(db, user)
-
     return {"detail": "Signup Success"}
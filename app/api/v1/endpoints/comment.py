@@ -1,28 +1,53 @@
-from typing import Annotated
-
-from fastapi import APIRouter, HTTPException, Query, status
-
-from app.api.deps import CommentId, CurrentUser, DbSession, PostId
+from typing import Annotated, Any, NoReturn
+
+from fastapi import APIRouter, Body, HTTPException, Query, Request, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import (
+    AsyncDbSession,
+    CommentFields,
+    CommentId,
+    CurrentUser,
+    PageCursor,
+    PostId,
+    rate_limit,
+)
+from app.core.conditional import body_etag, conditional_response
+from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_id_cursor, encode_cursor
+from app.core.response_cache import comments_namespace, response_cache
+from app.core.serialization import dump_rows
 from app.crud.comment import (
-    create_comment,
-    delete_comment,
-    get_comment,
-    get_comments_by_post,
-    update_comment,
+    create_comment_async,
+    create_comments_bulk_async,
+    delete_comment_if_permitted_async,
+    get_comment_async,
+    get_comment_post_id_async,
+    get_comment_rows_by_post_async,
+    update_comment_if_permitted_async,
 )
 from app.models import Comment
-from app.schema.comment import CommentCreate, CommentRead, CommentUpdate
+from app.schema.bulk import validate_bulk_items
+from app.schema.comment import (
+    CommentBulkResult,
+    CommentCreate,
+    CommentRead,
+    CommentUpdate,
+)
 
 router = APIRouter()
 
+CommentReadListAdapter = TypeAdapter(list[CommentRead])
+
 
 @router.get("/{comment_id}", response_model=CommentRead, summary="특정 댓글 조회")
-def read_comment(comment_id: CommentId, db: DbSession) -> Comment:
+async def read_comment(comment_id: CommentId, db: AsyncDbSession) -> Comment:
     """
     댓글 ID를 이용하여 특정 댓글을 조회합니다.
     해당 댓글이 없으면 `404 Not Found`를 반환합니다.
     """
-    db_comment = get_comment(db, comment_id)
+    db_comment = await get_comment_async(db, comment_id)
 
     if not db_comment:
         raise HTTPException(
@@ -33,14 +58,45 @@ def read_comment(comment_id: CommentId, db: DbSession) -> Comment:
 
 
 @router.get("/", response_model=list[CommentRead], summary="게시글 댓글 목록 조회")
-def read_comments(
+async def read_comments(
     post_id: PostId,
-    db: DbSession,
+    db: AsyncDbSession,
+    request: Request,
+    fields: CommentFields,
     skip: Annotated[int, Query(ge=0, description="건너뛸 댓글 수")] = 0,
     limit: Annotated[int, Query(ge=1, le=100, description="가져올 최대 댓글 수")] = 10,
+    cursor: PageCursor = None,
 ):
-    """게시글 ID에 해당하는 댓글 목록을 페이지네이션하여 반환합니다."""
-    return get_comments_by_post(db, post_id, skip, limit)
+    """
+    게시글 ID에 해당하는 댓글 목록을 페이지네이션하여 반환합니다.
+    `fields`를 지정하면 해당 필드만 DB에서 읽어 반환합니다.
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더에 커서를 담아 반환합니다.
+    응답 본문 해시로 만든 `ETag`가 `If-None-Match`와 일치하면 `304 Not Modified`를 반환합니다.
+    """
+    cache_key = response_cache.key(request, comments_namespace(post_id))
+    if cached := response_cache.get(cache_key):
+        return conditional_response(request, cached)
+
+    after_id = None
+    if cursor is not None:
+        after_id = decode_id_cursor(cursor)
+        if after_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+    rows = await get_comment_rows_by_post_async(
+        db, post_id, skip, limit, after_id=after_id, fields=fields
+    )
+    headers = {}
+    if len(rows) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(id=rows[-1]["id"])
+
+    # ORM 객체와 스키마 검증을 거치지 않고 행을 바로 직렬화합니다.
+    body = dump_rows(rows)
+    headers["ETag"] = body_etag(body)
+    return conditional_response(request, response_cache.store(cache_key, body, headers))
 
 
 @router.post(
@@ -48,27 +104,76 @@ def read_comments(
     response_model=CommentRead,
     status_code=status.HTTP_201_CREATED,
     summary="새로운 댓글 작성",
+    dependencies=[rate_limit("comment_create", per_user=True)],
 )
-def create_new_comment(
+async def create_new_comment(
     post_id: PostId,
     user: CurrentUser,
-    db: DbSession,
+    db: AsyncDbSession,
     comment_in: CommentCreate,
 ) -> Comment:
     """
     특정 게시글에 새로운 댓글을 등록합니다.
 
     API 호출 시 인증(로그인)이 필요합니다.
+    게시글이 없으면 `404 Not Found`를,
+    회원별 작성 한도를 넘으면 `429 Too Many Requests`를 반환합니다.
     """
-    return create_comment(db, user.id, post_id, comment_in)
+    db_comment = await create_comment_async(db, user.id, post_id, comment_in)
+    if not db_comment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found."
+        )
+
+    return db_comment
+
+
+@router.post(
+    "/bulk",
+    response_model=CommentBulkResult,
+    status_code=status.HTTP_201_CREATED,
+    summary="댓글 일괄 작성",
+    dependencies=[rate_limit("bulk", per_user=True)],
+)
+async def create_comments_bulk(
+    post_id: PostId,
+    user: CurrentUser,
+    db: AsyncDbSession,
+    items: Annotated[
+        list[Any],
+        Body(max_length=settings.BULK_MAX_ITEMS, description="작성할 댓글 목록"),
+    ],
+) -> CommentBulkResult:
+    """
+    특정 게시글에 여러 댓글을 한 번에 등록합니다. (기존 데이터 이전용)
+
+    항목마다 `CommentCreate` 형식으로 검증하며, 검증에 실패한 항목은 건너뛰고
+    `errors`에 인덱스와 오류 내용을 담아 반환합니다.
+    게시글이 없으면 `404 Not Found`를 반환합니다.
+    """
+    comments_in, errors = validate_bulk_items(CommentCreate, items)
+    db_comments = await create_comments_bulk_async(
+        db, user.id, post_id, comments_in, chunk_size=settings.BULK_CHUNK_SIZE
+    )
+    if db_comments is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found."
+        )
+
+    return CommentBulkResult(
+        created=CommentReadListAdapter.validate_python(
+            db_comments, from_attributes=True
+        ),
+        errors=errors,
+    )
 
 
 @router.put("/{comment_id}", response_model=CommentRead, summary="기존 댓글 수정")
-def update_existing_comment(
+async def update_existing_comment(
     post_id: PostId,
     comment_id: CommentId,
     user: CurrentUser,
-    db: DbSession,
+    db: AsyncDbSession,
     comment_in: CommentUpdate,
 ) -> Comment:
     """
@@ -76,57 +181,50 @@ def update_existing_comment(
 
     댓글은 작성자 혹은 관리자만 수정할 수 있으며, 권한이 없는 경우 `403 Forbidden` 에러를 반환합니다.
     """
-    db_comment = get_comment(db, comment_id)
-
-    if not db_comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found."
-        )
-
-    if db_comment.post_id != post_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Wrong Access."
-        )
-
-    if db_comment.user_id != user.id or user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions."
-        )
+    db_comment = await update_comment_if_permitted_async(
+        db, post_id, comment_id, comment_in, user.id, is_admin=user.role == "admin"
+    )
+    if db_comment is None:
+        await _raise_comment_write_error(db, post_id, comment_id)
 
-    return update_comment(db, db_comment, comment_in)
+    return db_comment
 
 
 @router.delete(
     "/{comment_id}", status_code=status.HTTP_204_NO_CONTENT, summary="기존 댓글 삭제"
 )
-def delete_existing_comment(
+async def delete_existing_comment(
     post_id: PostId,
     comment_id: CommentId,
     user: CurrentUser,
-    db: DbSession,
+    db: AsyncDbSession,
 ):
     """
     특정 댓글을 삭제합니다.
 
     댓글은 작성자와 관리자만 삭제할 수 있으며, 권한이 없으면 `403 Forbidden` 에러를 반환합니다.
     """
-    db_comment = get_comment(db, comment_id)
+    if not await delete_comment_if_permitted_async(
+        db, post_id, comment_id, user.id, is_admin=user.role == "admin"
+    ):
+        await _raise_comment_write_error(db, post_id, comment_id)
 
-    if not db_comment:
+    return None
+
+
+async def _raise_comment_write_error(
+    db: AsyncSession, post_id: int, comment_id: int
+) -> NoReturn:
+    """조건부 수정/삭제가 아무 행도 바꾸지 못한 경우, 그 원인에 맞는 오류를 발생시킵니다."""
+    comment_post_id = await get_comment_post_id_async(db, comment_id)
+    if comment_post_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found."
         )
-
-    if db_comment.post_id != post_id:
+    if comment_post_id != post_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Wrong Access."
         )
-
-    if db_comment.user_id != user.id or user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions."
-        )
-
-    delete_comment(db, db_comment)
-
-    return None
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions."
+    )
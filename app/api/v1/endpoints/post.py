@@ -1,36 +1,434 @@
-from typing import Annotated
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Annotated, Any, Literal, NoReturn
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Body, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import CurrentUser, DbSession, PostId
+from app.api.deps import (
+    AsyncDbSession,
+    CommentsLimit,
+    CurrentUser,
+    PageCursor,
+    PostFields,
+    PostId,
+    PostIncludes,
+    rate_limit,
+)
+from app.api.v1.endpoints.comment import CommentReadListAdapter
 from app.api.v1.endpoints.comment import router as comment_router
-from app.crud.post import create_post, delete_post, get_post, get_posts, update_post
+from app.core.conditional import (
+    body_etag,
+    conditional_response,
+    http_date,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from app.core.config import settings
+from app.core.export import (
+    GZIP_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    gzip_stream,
+    ndjson_stream,
+)
+from app.core.feed import ACTIVE_FEED, feed_index
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    decode_feed_cursor,
+    decode_id_cursor,
+    encode_cursor,
+)
+from app.core.response_cache import (
+    ALL_COMMENTS_NAMESPACE,
+    POSTS_NAMESPACE,
+    comments_namespace,
+    post_namespace,
+    response_cache,
+)
+from app.core.serialization import dump_row, dump_rows
+from app.crud.comment import get_comments_for_posts_async
+from app.crud.export import stream_posts_for_export_async
+from app.crud.feed import ensure_feed_index_async
+from app.crud.post import (
+    create_post_async,
+    create_posts_bulk_async,
+    delete_post_if_permitted_async,
+    get_post_async,
+    get_post_row_async,
+    get_post_rows_async,
+    get_post_rows_by_ids_async,
+    get_post_version_async,
+    get_posts_async,
+    get_posts_by_ids_async,
+    post_exists_async,
+    update_post_if_permitted_async,
+)
+from app.crud.search import search_posts_async
+from app.db.session import AsyncSessionLocal
 from app.models.post import Post
-from app.schema.post import PostCreate, PostRead, PostUpdate
+from app.schema.bulk import validate_bulk_items
+from app.schema.post import (
+    PostBulkResult,
+    PostCreate,
+    PostRead,
+    PostReadWithRelations,
+    PostSearchResult,
+    PostUpdate,
+)
+from app.schema.user import UserSummary
 
 router = APIRouter()
 
+PostReadListAdapter = TypeAdapter(list[PostRead])
+PostSearchResultListAdapter = TypeAdapter(list[PostSearchResult])
 
-@router.get("/", response_model=list[PostRead], summary="게시글 목록 조회")
-def read_posts(
-    db: DbSession,
+
+async def _with_relations(
+    db: AsyncSession,
+    db_posts: Sequence[Post],
+    includes: frozenset[str],
+    comments_limit: int,
+    fields: tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """요청한 필드와 관계(comments, author)만 담은 게시글 응답 목록을 만듭니다."""
+    comments = {}
+    if "comments" in includes:
+        comments = await get_comments_for_posts_async(
+            db, [db_post.id for db_post in db_posts], comments_limit
+        )
+
+    posts = []
+    for db_post in db_posts:
+        post = {
+            name: getattr(db_post, name) for name in fields or PostRead.model_fields
+        }
+        if "comments" in includes:
+            post["comments"] = CommentReadListAdapter.dump_python(
+                CommentReadListAdapter.validate_python(
+                    comments[db_post.id], from_attributes=True
+                )
+            )
+        if "author" in includes:
+            post["author"] = UserSummary.model_validate(db_post.user).model_dump()
+        posts.append(post)
+
+    return posts
+
+
+@router.get(
+    "/",
+    response_model=list[PostReadWithRelations],
+    response_model_exclude_none=True,
+    summary="게시글 목록 조회",
+)
+async def read_posts(
+    db: AsyncDbSession,
+    request: Request,
+    includes: PostIncludes,
+    fields: PostFields,
     skip: Annotated[int, Query(ge=0, description="건너뛸 게시글의 수")] = 0,
     limit: Annotated[
         int, Query(ge=1, le=100, description="한 번에 가져올 최대 게시글의 수")
     ] = 10,
+    cursor: PageCursor = None,
+    comments_limit: CommentsLimit = 10,
+    sort: Annotated[
+        Literal["latest", "active"],
+        Query(description="정렬 순서 (`latest`: 최신 작성순, `active`: 최근 댓글순)"),
+    ] = "latest",
 ):
-    """게시글을 페이지네이션하여 반환합니다."""
-    return get_posts(db, skip, limit)
+    """
+    게시글을 페이지네이션하여 반환합니다.
+
+    `sort=active`이면 마지막 댓글(없으면 작성) 시각 기준 최근 활동순으로 반환하며,
+    미리 정렬해 둔 피드 인덱스에서 ID를 고른 뒤 기본 키로만 조회합니다.
+
+    `include=comments,author`를 지정하면 게시글마다 댓글(최대 `comments_limit`개)과
+    작성자 정보를 함께 반환하며, 게시글 수와 관계없이 최대 두 번의 쿼리로 조회합니다.
+    `fields=id,title,content_preview`처럼 필드를 지정하면 해당 컬럼만 DB에서 읽어 반환하며,
+    `content_preview`는 본문 앞부분을 DB에서 잘라 읽습니다.
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더에 커서를 담아 반환하며,
+    이 값을 `cursor`로 넘기면 페이지 깊이와 관계없이 일정한 비용으로 조회합니다.
+    응답 본문 해시로 만든 `ETag`가 `If-None-Match`와 일치하면 `304 Not Modified`를 반환합니다.
+    """
+    namespaces = [POSTS_NAMESPACE]
+    if "comments" in includes:
+        namespaces.append(ALL_COMMENTS_NAMESPACE)
+
+    cache_key = response_cache.key(request, *namespaces)
+    if cached := response_cache.get(cache_key):
+        return conditional_response(request, cached)
+
+    if sort == "active":
+        return await _read_active_posts(
+            db,
+            request,
+            cache_key,
+            includes,
+            fields,
+            skip,
+            limit,
+            cursor,
+            comments_limit,
+        )
+
+    before_id = None
+    if cursor is not None:
+        before_id = decode_id_cursor(cursor)
+        if before_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+    if includes:
+        db_posts = await get_posts_async(
+            db,
+            skip,
+            limit,
+            before_id=before_id,
+            with_author="author" in includes,
+            fields=fields,
+        )
+        body = dump_rows(
+            await _with_relations(db, db_posts, includes, comments_limit, fields)
+        )
+        post_ids = [db_post.id for db_post in db_posts]
+    else:
+        # 관계가 필요 없으면 ORM 객체와 스키마 검증을 거치지 않고 행을 바로 직렬화합니다.
+        rows = await get_post_rows_async(
+            db, skip, limit, before_id=before_id, fields=fields
+        )
+        body = dump_rows(rows)
+        post_ids = [row["id"] for row in rows]
 
+    headers = {}
+    if len(post_ids) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(id=post_ids[-1])
+    headers["ETag"] = body_etag(body)
+    return conditional_response(request, response_cache.store(cache_key, body, headers))
+
+
+async def _read_active_posts(
+    db: AsyncSession,
+    request: Request,
+    cache_key: str,
+    includes: frozenset[str],
+    fields: tuple[str, ...] | None,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+    comments_limit: int,
+) -> Response:
+    """최근 활동순 피드 인덱스에서 게시글 ID를 고르고 기본 키로 조회해 반환합니다."""
+    before = None
+    if cursor is not None:
+        before = decode_feed_cursor(cursor)
+        if before is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+    await ensure_feed_index_async(db)
+    entries = feed_index.page(
+        ACTIVE_FEED, limit, skip=0 if before else skip, before=before
+    )
+    post_ids = [post_id for _, post_id in entries]
+
+    if includes:
+        db_posts = await get_posts_by_ids_async(
+            db, post_ids, with_author="author" in includes, fields=fields
+        )
+        body = dump_rows(
+            await _with_relations(db, db_posts, includes, comments_limit, fields)
+        )
+    else:
+        body = dump_rows(await get_post_rows_by_ids_async(db, post_ids, fields))
+
+    headers = {}
+    # 그사이 삭제된 게시글이 빠져도 다음 페이지 여부는 인덱스 항목 수로 판단합니다.
+    if len(entries) == limit:
+        last_score, last_id = entries[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(at=last_score, id=last_id)
+    headers["ETag"] = body_etag(body)
+    return conditional_response(request, response_cache.store(cache_key, body, headers))
+
+
+@router.get("/export", summary="게시글 전체 내보내기 (NDJSON)")
+async def export_posts(
+    user: CurrentUser,
+    after_id: Annotated[
+        int, Query(ge=0, description="이 ID보다 큰 게시글부터 내보냅니다 (이어받기용)")
+    ] = 0,
+    include_comments: Annotated[
+        bool, Query(description="게시글마다 댓글을 함께 내보낼지 여부")
+    ] = False,
+    gzip: Annotated[bool, Query(description="gzip으로 압축하여 내보낼지 여부")] = False,
+) -> StreamingResponse:
+    """
+    모든 게시글을 ID 오름차순의 NDJSON(한 줄에 게시글 하나)으로 스트리밍합니다.
+
+    서버 측 커서로 읽으며 바로 전송하므로 게시글 수와 관계없이 메모리 사용량이 일정합니다.
+    전송이 중단되면 마지막으로 받은 게시글의 `id`를 `after_id`로 넘겨 이어받을 수 있습니다.
+
+    관리자만 호출할 수 있으며, 권한이 없으면 `403 Forbidden`을 반환합니다.
+    """
+    if user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+
+    async def rows():
+        # 의존성으로 주입된 세션은 응답 스트리밍 전에 닫히므로 전용 세션을 엽니다.
+        async with AsyncSessionLocal() as db:
+            async for row in stream_posts_for_export_async(
+                db, after_id, include_comments, settings.EXPORT_CHUNK_SIZE
+            ):
+                yield row
+
+    if gzip:
+        return StreamingResponse(
+            gzip_stream(ndjson_stream(rows())),
+            media_type=GZIP_MEDIA_TYPE,
+            headers={"Content-Disposition": 'attachment; filename="posts.ndjson.gz"'},
+        )
+    return StreamingResponse(ndjson_stream(rows()), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get(
+    "/search", response_model=list[PostSearchResult], summary="게시글 전문 검색"
+)
+async def search_posts(
+    db: AsyncDbSession,
+    q: Annotated[str, Query(min_length=1, max_length=200, description="검색어")],
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="한 번에 가져올 최대 검색 결과 수")
+    ] = 10,
+    cursor: PageCursor = None,
+):
+    """
+    게시글 제목, 본문, 댓글 내용에서 검색어를 찾아 관련도 순으로 반환합니다.
 
-@router.get("/{post_id}", response_model=PostRead, summary="특정 게시글 조회")
-def read_post(post_id: PostId, db: DbSession) -> Post:
-    """게시글 ID로 특정 게시글을 조회합니다."""
-    db_post = get_post(db, post_id)
-    if not db_post:
+    `snippet`은 HTML 이스케이프된 원문 일부이며 일치한 부분만 `<mark>` 태그로 강조됩니다.
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더에 커서를 담아 반환합니다.
+    """
+    after = None
+    if cursor is not None:
+        values = decode_cursor(cursor) or {}
+        score, last_id = values.get("score"), values.get("id")
+        if not isinstance(score, (int, float)) or not isinstance(last_id, int):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        after = (float(score), last_id)
+
+    results = await search_posts_async(db, q, limit, after=after)
+    headers = {}
+    if len(results) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            score=results[-1]["score"], id=results[-1]["id"]
+        )
+
+    body = PostSearchResultListAdapter.dump_json(
+        PostSearchResultListAdapter.validate_python(results)
+    )
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _post_validators(
+    post_id: int,
+    version: int,
+    comment_count: int,
+    updated_at: datetime,
+    fields: tuple[str, ...] | None,
+) -> dict[str, str]:
+    """
+    게시글 상세 응답의 ETag와 Last-Modified를 만듭니다.
+
+    ETag는 수정마다 올라가는 `version`과 댓글 수로 만들어 같은 초의 수정도 구분하며,
+    필드 선택에 따라 본문이 달라지므로 필드 목록도 반영합니다.
+    Last-Modified는 초 단위이므로 If-None-Match가 없는 클라이언트용 보조 수단입니다.
+    """
+    return {
+        "ETag": make_etag(post_id, version, comment_count, *fields or ()),
+        "Last-Modified": http_date(updated_at),
+    }
+
+
+@router.get(
+    "/{post_id}",
+    response_model=PostReadWithRelations,
+    response_model_exclude_none=True,
+    summary="특정 게시글 조회",
+)
+async def read_post(
+    post_id: PostId,
+    db: AsyncDbSession,
+    request: Request,
+    includes: PostIncludes,
+    fields: PostFields,
+    comments_limit: CommentsLimit = 10,
+) -> Response:
+    """
+    게시글 ID로 특정 게시글을 조회합니다.
+
+    `include=comments,author`를 지정하면 댓글(최대 `comments_limit`개)과 작성자 정보를
+    함께 반환합니다. `fields`를 지정하면 해당 필드만 DB에서 읽어 반환합니다.
+
+    `If-None-Match` / `If-Modified-Since` 헤더가 최신 버전과 일치하면
+    게시글 본문을 읽지 않고 `304 Not Modified`를 반환합니다.
+    """
+    namespaces = [post_namespace(post_id)]
+    if "comments" in includes:
+        namespaces.append(comments_namespace(post_id))
+
+    cache_key = response_cache.key(request, *namespaces)
+    if cached := response_cache.get(cache_key):
+        return conditional_response(request, cached)
+
+    if includes:
+        db_post = await get_post_async(
+            db, post_id, with_author="author" in includes, fields=fields
+        )
+        if not db_post:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+        (post_out,) = await _with_relations(
+            db, [db_post], includes, comments_limit, fields
+        )
+        body = dump_row(post_out)
+        # 댓글 변경은 게시글 updated_at에 반영되지 않으므로 본문 해시를 사용합니다.
+        return conditional_response(
+            request,
+            response_cache.store(cache_key, body, {"ETag": body_etag(body)}),
+        )
+
+    # 버전과 댓글 수만 먼저 조회하여, 변경이 없으면 전체 행을 읽기 전에 응답합니다.
+    version = await get_post_version_async(db, post_id)
+    if version is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
 
-    return db_post
+    validators = _post_validators(post_id, *version, fields)
+    if is_not_modified(request, validators["ETag"], validators["Last-Modified"]):
+        return not_modified(validators)
+
+    names = fields or tuple(PostRead.model_fields)
+    row = await get_post_row_async(
+        db, post_id, {*names, "comment_count", "updated_at"}, with_version=True
+    )
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    body = dump_row({name: row[name] for name in names})
+    # 본문과 같은 행에서 읽은 값으로 검증자를 다시 만들어, 그 사이의 수정과 섞이지 않게 합니다.
+    validators = _post_validators(
+        post_id, row["version"], row["comment_count"], row["updated_at"], fields
+    )
+    return response_cache.store(cache_key, body, validators)
 
 
 @router.post(
@@ -38,67 +436,99 @@ def read_post(post_id: PostId, db: DbSession) -> Post:
     response_model=PostRead,
     status_code=status.HTTP_201_CREATED,
     summary="새로운 게시글 생성",
+    dependencies=[rate_limit("post_create", per_user=True)],
 )
-def create_new_post(
+async def create_new_post(
     user: CurrentUser,
-    db: DbSession,
+    db: AsyncDbSession,
     post_in: PostCreate,
 ) -> Post:
     """새로운 게시글을 등록합니다."""
-    return create_post(db, user.id, post_in)
+    return await create_post_async(db, user.id, post_in)
+
+
+@router.post(
+    "/bulk",
+    response_model=PostBulkResult,
+    status_code=status.HTTP_201_CREATED,
+    summary="게시글 일괄 생성",
+    dependencies=[rate_limit("bulk", per_user=True)],
+)
+async def create_posts_bulk(
+    user: CurrentUser,
+    db: AsyncDbSession,
+    items: Annotated[
+        list[Any],
+        Body(max_length=settings.BULK_MAX_ITEMS, description="생성할 게시글 목록"),
+    ],
+) -> PostBulkResult:
+    """
+    여러 게시글을 한 번에 등록합니다. (기존 데이터 이전용)
+
+    항목마다 `PostCreate` 형식으로 검증하며, 검증에 실패한 항목은 건너뛰고
+    `errors`에 인덱스와 오류 내용을 담아 반환합니다.
+    나머지 항목은 `BULK_CHUNK_SIZE`개씩 다중 행 INSERT로 한 트랜잭션에서 저장됩니다.
+    """
+    posts_in, errors = validate_bulk_items(PostCreate, items)
+    db_posts = await create_posts_bulk_async(
+        db, user.id, posts_in, chunk_size=settings.BULK_CHUNK_SIZE
+    )
+
+    return PostBulkResult(
+        created=PostReadListAdapter.validate_python(db_posts, from_attributes=True),
+        errors=errors,
+    )
 
 
 @router.put("/{post_id}", response_model=PostRead, summary="기존 게시글 수정")
-def update_existing_post(
+async def update_existing_post(
     user: CurrentUser,
-    db: DbSession,
+    db: AsyncDbSession,
     post_id: PostId,
     post_in: PostUpdate,
 ) -> Post:
     """
     기존 게시글을 수정합니다.
 
-    게시글은 작성자나 관리자만 수정할 수 있으며, 권한이 없는 경우 `403 Fobidden` 오류를 반환합니다.
+    게시글은 작성자나 관리자만 수정할 수 있으며, 권한이 없는 경우 `403 Forbidden` 오류를 반환합니다.
     """
-    db_post = get_post(db, post_id)
-    if not db_post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
-        )
-    if db_post.user_id != user.id and user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Not enough permissions"
-        )
+    db_post = await update_post_if_permitted_async(
+        db, post_id, post_in, user.id, is_admin=user.role == "admin"
+    )
+    if db_post is None:
+        await _raise_post_write_error(db, post_id)
 
-    return update_post(db=db, db_post=db_post, post_in=post_in)
+    return db_post
 
 
 @router.delete("/{post_id}", summary="기존 게시글 삭제")
-def delete_existing_post(
+async def delete_existing_post(
     user: CurrentUser,
-    db: DbSession,
+    db: AsyncDbSession,
     post_id: PostId,
 ):
     """
-    기존 게시글을 삭제합니다.
+    기존 게시글을 삭제합니다. 게시글의 댓글도 함께 삭제됩니다.
 
     게시글은 작성자나 관리자만 삭제할 수 있으며, 권한이 없는 경우 `403 Forbidden` 에러를 반환합니다.
     """
-    db_post = get_post(db, post_id)
+    if not await delete_post_if_permitted_async(
+        db, post_id, user.id, is_admin=user.role == "admin"
+    ):
+        await _raise_post_write_error(db, post_id)
 
-    if not db_post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
-        )
+    return {"detail": "Post deleted."}
 
-    if db_post.user_id != user.id or user.role != "admin":
+
+async def _raise_post_write_error(db: AsyncSession, post_id: int) -> NoReturn:
+    """조건부 수정/삭제가 아무 행도 바꾸지 못한 경우, 없는 게시글인지 권한 문제인지 구분합니다."""
+    if not await post_exists_async(db, post_id):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
         )
-
-    delete_post(db, db_post)
-
-    return {"detail": "Post deleted."}
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+    )
 
 
 # comment router
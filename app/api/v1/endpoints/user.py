@@ -1,13 +1,68 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Path, Query, Request, status
+
+from app.api.deps import AsyncDbSession, PageCursor, PostFields
+from app.core.conditional import body_etag, conditional_response
+from app.core.feed import author_feed, feed_index
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_id_cursor, encode_cursor
+from app.core.response_cache import POSTS_NAMESPACE, response_cache
+from app.core.serialization import dump_rows
+from app.crud.feed import ensure_feed_index_async
+from app.crud.post import get_post_rows_by_ids_async
+from app.schema.post import PostRead
 
 router = APIRouter()
 
+UserId = Annotated[int, Path(title="회원 ID", ge=1)]
+
+
+@router.get(
+    "/{user_id}/posts",
+    response_model=list[PostRead],
+    summary="작성자별 게시글 목록 조회",
+)
+async def read_user_posts(
+    user_id: UserId,
+    db: AsyncDbSession,
+    request: Request,
+    fields: PostFields,
+    skip: Annotated[int, Query(ge=0, description="건너뛸 게시글의 수")] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="한 번에 가져올 최대 게시글의 수")
+    ] = 10,
+    cursor: PageCursor = None,
+):
+    """
+    특정 회원이 작성한 게시글을 최신 작성순으로 페이지네이션하여 반환합니다.
+
+    미리 정렬해 둔 작성자별 피드 인덱스에서 게시글 ID를 고른 뒤 기본 키로만 조회하므로,
+    작성자의 게시글 수와 관계없이 `limit`에 비례하는 비용으로 조회합니다.
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더에 커서를 담아 반환합니다.
+    """
+    cache_key = response_cache.key(request, POSTS_NAMESPACE)
+    if cached := response_cache.get(cache_key):
+        return conditional_response(request, cached)
 
-@router.get("/users")
-def read_users():
-    return [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+    before = None
+    if cursor is not None:
+        before_id = decode_id_cursor(cursor)
+        if before_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        # 작성자별 피드의 점수는 게시글 ID입니다.
+        before = (before_id, before_id)
 
-@router.post("/users")
-def create_user(name: str):
-    return {"id": 3, "name": name}
+    await ensure_feed_index_async(db)
+    entries = feed_index.page(
+        author_feed(user_id), limit, skip=0 if before else skip, before=before
+    )
+    post_ids = [post_id for _, post_id in entries]
+    body = dump_rows(await get_post_rows_by_ids_async(db, post_ids, fields))
 
+    headers = {}
+    if len(entries) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(id=post_ids[-1])
+    headers["ETag"] = body_etag(body)
+    return conditional_response(request, response_cache.store(cache_key, body, headers))
@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, post
+from app.api.v1.endpoints import admin, auth, post, user
 
 api_router = APIRouter()
 
 
 api_router.include_router(auth.router, prefix="/users", tags=["users"])
+api_router.include_router(user.router, prefix="/users", tags=["users"])
 api_router.include_router(post.router, prefix="/posts", tags=["posts"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
@@ -0,0 +1,92 @@
+"""
+관리용 명령줄 도구입니다.
+
+사용 예:
+    python -m app.cli reconcile-comment-counts
+    python -m app.cli export-posts --include-comments -o posts.ndjson.gz
+"""
+
+import argparse
+import gzip
+import sys
+from contextlib import ExitStack
+
+from app.core.config import settings
+from app.core.export import ndjson_line
+from app.crud.export import iter_posts_for_export
+from app.crud.post import reconcile_comment_counts
+from app.db.session import SessionLocal
+
+
+def reconcile_comment_counts_command(args: argparse.Namespace) -> None:
+    with SessionLocal() as db:
+        updated = reconcile_comment_counts(db)
+    print(f"comment_count 보정 완료: {updated}개 게시글 갱신")
+
+
+def export_posts_command(args: argparse.Namespace) -> None:
+    compress = args.gzip or args.output.endswith(".gz")
+    count, last_id = 0, args.after_id
+    try:
+        with ExitStack() as stack, SessionLocal() as db:
+            if args.output == "-":
+                out = sys.stdout.buffer
+            else:
+                out = stack.enter_context(open(args.output, "wb"))
+            if compress:
+                out = stack.enter_context(gzip.GzipFile(fileobj=out, mode="wb"))
+
+            for post, comments in iter_posts_for_export(
+                db, args.after_id, args.include_comments, args.chunk_size
+            ):
+                out.write(ndjson_line(post, comments))
+                count, last_id = count + 1, post.id
+    finally:
+        # 중단되더라도 --after-id로 이어받을 수 있도록 마지막 ID를 알려줍니다.
+        print(f"게시글 {count}개 내보냄 (마지막 ID: {last_id})", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = subparsers.add_parser(
+        "reconcile-comment-counts", help="게시글 댓글 수를 실제 댓글 수로 재계산"
+    )
+    reconcile.set_defaults(func=reconcile_comment_counts_command)
+
+    export = subparsers.add_parser(
+        "export-posts", help="게시글 전체를 NDJSON으로 내보내기"
+    )
+    export.add_argument(
+        "-o", "--output", default="-", help="출력 파일 경로 (기본값: 표준 출력)"
+    )
+    export.add_argument(
+        "--after-id", type=int, default=0, help="이 ID보다 큰 게시글부터 내보내기"
+    )
+    export.add_argument(
+        "--include-comments", action="store_true", help="댓글을 함께 내보내기"
+    )
+    export.add_argument(
+        "--gzip",
+        action="store_true",
+        help="gzip으로 압축 (출력 파일이 .gz로 끝나면 자동 적용)",
+    )
+    export.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.EXPORT_CHUNK_SIZE,
+        help="서버 측 커서로 한 번에 읽을 행 수",
+    )
+    export.set_defaults(func=export_posts_command)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+전역 요청 수용(admission) 제어입니다.
+
+처리 중인 요청 수가 `MAX_CONCURRENT_REQUESTS`에 이르거나, 최근 DB 커넥션 풀 대기 시간이
+`DB_POOL_WAIT_SHED_MS`를 넘으면 새 요청을 DB에 닿기 전에 `503`으로 거절하여,
+대기열이 길어지며 모든 요청이 함께 느려지는 상황을 막습니다.
+"""
+
+import time
+
+from fastapi.responses import JSONResponse
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+# 마지막 관측 이후 이 시간(초)이 지나면 풀 대기 시간 추정값을 버립니다.
+POOL_WAIT_STALE_SECONDS = 1.0
+
+
+class PoolWaitMonitor:
+    """커넥션 풀 대기 시간의 지수 이동 평균(EWMA)을 추적합니다."""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.average = 0.0
+        self.updated_at = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.average += self.alpha * (seconds - self.average)
+        self.updated_at = time.monotonic()
+
+    def overloaded(self, threshold: float) -> bool:
+        # 요청을 거절하는 동안에는 새 관측이 없으므로, 오래된 값은 과부하로 보지 않습니다.
+        return (
+            threshold > 0
+            and self.average > threshold
+            and time.monotonic() - self.updated_at < POOL_WAIT_STALE_SECONDS
+        )
+
+
+pool_wait = PoolWaitMonitor()
+
+
+class _TimedPoolMixin:
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait.observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """커넥션을 얻기까지 기다린 시간을 `pool_wait`에 기록하는 QueuePool입니다."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 기다린 시간을 `pool_wait`에 기록하는 비동기 엔진용 풀입니다."""
+
+
+class AdmissionControlMiddleware:
+    """동시 처리 요청 수와 DB 풀 대기 시간을 보고 새 요청을 일찍 거절합니다."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrency: int = settings.MAX_CONCURRENT_REQUESTS,
+        pool_wait_threshold_ms: float = settings.DB_POOL_WAIT_SHED_MS,
+    ):
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.pool_wait_threshold = pool_wait_threshold_ms / 1000
+        self.in_flight = 0
+
+    def _should_shed(self) -> bool:
+        if self.max_concurrency > 0 and self.in_flight >= self.max_concurrency:
+            return True
+        return pool_wait.overloaded(self.pool_wait_threshold)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self._should_shed():
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server is busy. Try again later."},
+                headers={"Retry-After": str(settings.SHED_RETRY_AFTER_SECONDS)},
+            )
+            await response(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
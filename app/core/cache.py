@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+from app.core.config import settings
+from app.schema.user import UserSnapshot
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    최대 크기(LRU)와 만료 시간(TTL)을 함께 갖는 프로세스 내 캐시입니다.
+
+    스레드풀에서 실행되는 동기 엔드포인트와 이벤트 루프가 함께 접근할 수 있도록
+    모든 연산은 락으로 보호됩니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return None if item is None else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# 인증 캐시: 토큰 해시 -> 검증된 클레임, 회원 ID -> 회원 정보 스냅샷
+token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS
+)
+user_cache: TTLCache[int, UserSnapshot] = TTLCache(
+    settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_user(user_id: int) -> None:
+    """회원 정보가 바뀌거나 탈퇴한 경우 캐시된 스냅샷을 제거합니다."""
+    user_cache.pop(user_id)
@@ -0,0 +1,74 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """식별자와 버전 정보(updated_at 등)로 강한 ETag를 만듭니다."""
+    raw = "|".join(str(part) for part in parts).encode()
+    return f'"{hashlib.sha256(raw).hexdigest()[:32]}"'
+
+
+def body_etag(body: bytes) -> str:
+    """직렬화된 응답 본문의 해시로 강한 ETag를 만듭니다."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def http_date(value: datetime) -> str:
+    """DB의 UTC 시각을 HTTP 날짜 형식(Last-Modified)으로 변환합니다."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두어를 무시합니다.
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(
+    request: Request, etag: str | None, last_modified: str | None = None
+) -> bool:
+    """
+    조건부 요청 헤더(If-None-Match, If-Modified-Since)를 확인하여
+    클라이언트가 가진 표현이 최신이면 True를 반환합니다.
+
+    RFC 9110에 따라 If-None-Match가 있으면 If-Modified-Since는 무시합니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """본문 없이 검증자 헤더만 담은 `304 Not Modified` 응답을 만듭니다."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def conditional_response(request: Request, response: Response) -> Response:
+    """이미 만들어진(캐시된) 응답의 ETag/Last-Modified로 조건부 요청을 처리합니다."""
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if not is_not_modified(request, etag, last_modified):
+        return response
+
+    headers = {"ETag": etag} if etag else {}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return not_modified(headers)
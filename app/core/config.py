@@ -6,6 +6,100 @@ class Settings(BaseSettings):
 
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # refresh 토큰의 1회 사용과 로그아웃은 폐기 목록(app.core.revocation)으로 보장합니다.
+    # 기본 메모리 저장소는 프로세스마다 따로이므로, 워커/노드가 여러 개이면 공유 저장소로
+    # 바꾸기 전까지 다른 프로세스에서 같은 refresh 토큰을 다시 쓸 수 있습니다.
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+
+    # JWT 서명 키: HS*는 SECRET_KEY, RS*/ES*는 JWT_PRIVATE_KEY(PEM)로 서명합니다.
+    # JWT_VERIFICATION_KEYS(kid -> 공개 키 PEM, HS*는 비밀 키)에 이전 키를 남겨 두면
+    # 키를 교체해도 기존 토큰을 검증하며, 공개 키만 둔 노드는 검증만 합니다.
+    JWT_KEY_ID: str = "default"
+    JWT_PRIVATE_KEY: str = ""
+    JWT_VERIFICATION_KEYS: dict[str, str] = {}
+
+    # 비밀번호 해시(bcrypt) 설정: 전용 프로세스 풀에서 실행됩니다.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # 인증된 회원 조회 캐시 (프로세스 단위)
+    AUTH_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_CACHE_MAX_SIZE: int = 10_000
+
+    # 데이터베이스 연결 및 커넥션 풀 설정
+    DATABASE_URL: str = "sqlite:///./test.db"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # 읽기 전용 복제본. replica_ok로 표시한 조회만 라운드 로빈으로 분산됩니다.
+    DATABASE_REPLICA_URLS: list[str] = []
+    REPLICA_RETRY_SECONDS: float = 30.0  # 연결 오류가 난 복제본을 제외하는 시간
+    READ_YOUR_WRITES_SECONDS: float = 5.0  # 쓰기 직후 primary에서 읽는 시간
+
+    # SQLite 전용 PRAGMA 설정 (DATABASE_URL이 SQLite일 때만 적용)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64 * 1024  # 음수는 KiB 단위
+
+    # 공개 조회 API 응답 캐시 (TTL 0이면 비활성화)
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_SIZE: int = 1024
+
+    # 목록 응답의 본문 미리보기(content_preview) 길이 (글자 수, DB에서 잘라 읽음)
+    CONTENT_PREVIEW_LENGTH: int = 200
+
+    # 일괄 생성(bulk) API 설정: 한 요청의 최대 항목 수와 INSERT 한 번에 넣을 행 수
+    BULK_MAX_ITEMS: int = 10_000
+    BULK_CHUNK_SIZE: int = 500
+
+    # 내보내기(export) 시 서버 측 커서로 한 번에 읽을 행 수
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    # 작성자별/최근 활동순 피드 인덱스를 앱 시작 시 미리 만들지 여부 (끄면 첫 요청 때 생성)
+    FEED_INDEX_WARMUP: bool = True
+
+    # 요청별 계측(Server-Timing 헤더, /metrics). 끄면 미들웨어/리스너를 등록하지 않습니다.
+    METRICS_ENABLED: bool = False
+
+    # 개발/스테이징용 쿼리 진단: 느린 쿼리 로그와 N+1 감지 (N_PLUS_ONE_RAISE는 CI용)
+    QUERY_DIAGNOSTICS_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 100.0
+    N_PLUS_ONE_THRESHOLD: int = 5
+    N_PLUS_ONE_RAISE: bool = False
+
+    # 요청 한도: 범위별 토큰 버킷("횟수/기간"). 설정에 없는 범위는 제한하지 않습니다.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: dict[str, str] = {
+        "login": "10/minute",
+        "refresh": "30/minute",
+        "signup": "5/minute",
+        "post_create": "30/minute",
+        "comment_create": "30/minute",
+        "bulk": "10/minute",
+    }
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+
+    # 전역 요청 수용 제어: 동시 처리 상한과 DB 풀 대기 시간 기준 (0이면 비활성화)
+    MAX_CONCURRENT_REQUESTS: int = 0
+    DB_POOL_WAIT_SHED_MS: float = 0.0
+    SHED_RETRY_AFTER_SECONDS: int = 1
+
+    # 백그라운드 작업 큐: jobs 테이블(아웃박스)을 폴링하는 프로세스 내 asyncio 워커
+    # JOBS_ENABLED를 끄면 작업은 등록만 되고 이 프로세스에서는 실행하지 않습니다.
+    JOBS_ENABLED: bool = True
+    JOBS_WORKERS: int = 2
+    JOBS_BATCH_SIZE: int = 100  # 한 번에 점유하는 작업 수 (같은 종류끼리 묶어 처리)
+    JOBS_POLL_INTERVAL_SECONDS: float = 1.0
+    JOBS_LEASE_SECONDS: float = 60.0  # 처리 중 워커가 죽으면 이 시간 뒤 다시 실행
+    JOBS_MAX_ATTEMPTS: int = 5
+    JOBS_BACKOFF_SECONDS: float = 2.0  # 재시도 대기 시간: 시도마다 2배, 최대값까지
+    JOBS_BACKOFF_MAX_SECONDS: float = 300.0
 
     model_config = SettingsConfigDict(env_file=".env")
 
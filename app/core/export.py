@@ -0,0 +1,51 @@
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator
+
+from sqlalchemy import Row
+
+from app.schema.comment import CommentRead
+from app.schema.post import PostRead, PostReadWithComments
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+GZIP_MEDIA_TYPE = "application/gzip"
+
+# 줄마다 전송하지 않고 이 크기만큼 모아서 내보냅니다.
+FLUSH_BYTES = 64 * 1024
+
+
+def ndjson_line(post: Row, comments: list[Row] | None = None) -> bytes:
+    """게시글 한 건(댓글 포함 가능)을 NDJSON 한 줄로 직렬화합니다."""
+    if comments is None:
+        record = PostRead.model_validate(post, from_attributes=True)
+    else:
+        record = PostReadWithComments(
+            **PostRead.model_validate(post, from_attributes=True).model_dump(),
+            comments=[
+                CommentRead.model_validate(comment, from_attributes=True)
+                for comment in comments
+            ],
+        )
+    return record.model_dump_json().encode() + b"\n"
+
+
+async def ndjson_stream(
+    rows: AsyncIterable[tuple[Row, list[Row] | None]],
+) -> AsyncIterator[bytes]:
+    """`(게시글, 댓글 목록)` 스트림을 NDJSON 바이트 스트림으로 변환합니다."""
+    buffer = bytearray()
+    async for post, comments in rows:
+        buffer += ndjson_line(post, comments)
+        if len(buffer) >= FLUSH_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def gzip_stream(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """바이트 스트림을 gzip 형식으로 압축하며 흘려보냅니다."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,158 @@
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Protocol
+
+# 최근 활동순 피드: 점수는 마지막 댓글(없으면 게시글 작성) 시각
+ACTIVE_FEED = "active"
+
+# 피드 항목: (점수, 게시글 ID). 같은 점수는 ID로 정렬합니다.
+FeedEntry = tuple[float, int]
+
+
+def author_feed(user_id: int) -> str:
+    """작성자별 피드 이름입니다. 점수는 게시글 ID(작성 순서)입니다."""
+    return f"author:{user_id}"
+
+
+def activity_score(at: datetime) -> float:
+    return at.timestamp()
+
+
+class FeedBackend(Protocol):
+    """
+    피드별 정렬 인덱스 저장소 인터페이스입니다.
+
+    기본값은 프로세스 내 메모리 저장소이며, 같은 메서드를 구현하면 Redis의 sorted set
+    (`ZADD [GT]`, `ZREM`, `ZREVRANGEBYSCORE`) 등 공유 저장소로 교체할 수 있습니다.
+    `add`는 항목을 추가하거나 점수를 바꾸며, `gt`이면 점수가 커질 때만 바꿉니다.
+    `page`는 점수 내림차순으로 `before`보다 뒤(작은) 항목을 `skip`개 건너뛰고 반환합니다.
+    """
+
+    def add(self, feed: str, post_id: int, score: float, gt: bool = False) -> None: ...
+
+    def remove(self, feed: str, post_id: int) -> None: ...
+
+    def page(
+        self,
+        feed: str,
+        limit: int,
+        skip: int = 0,
+        before: FeedEntry | None = None,
+    ) -> list[FeedEntry]: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryFeedBackend:
+    """
+    피드마다 (점수, ID) 정렬 리스트를 유지하는 프로세스 내 저장소입니다.
+
+    조회는 이진 탐색 후 슬라이싱이므로 피드 크기와 관계없이 O(log n + limit)입니다.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, list[FeedEntry]] = {}
+        self._scores: dict[str, dict[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, feed: str, post_id: int, score: float, gt: bool = False) -> None:
+        with self._lock:
+            entries = self._entries.setdefault(feed, [])
+            scores = self._scores.setdefault(feed, {})
+            old = scores.get(post_id)
+            if old is not None:
+                if old == score or (gt and old > score):
+                    return
+                del entries[bisect_left(entries, (old, post_id))]
+
+            insort(entries, (score, post_id))
+            scores[post_id] = score
+
+    def remove(self, feed: str, post_id: int) -> None:
+        with self._lock:
+            old = self._scores.get(feed, {}).pop(post_id, None)
+            if old is not None:
+                entries = self._entries[feed]
+                del entries[bisect_left(entries, (old, post_id))]
+
+    def page(
+        self,
+        feed: str,
+        limit: int,
+        skip: int = 0,
+        before: FeedEntry | None = None,
+    ) -> list[FeedEntry]:
+        with self._lock:
+            entries = self._entries.get(feed, [])
+            end = len(entries) if before is None else bisect_left(entries, before)
+            end -= skip
+            if end <= 0:
+                return []
+            return entries[max(0, end - limit) : end][::-1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._scores.clear()
+
+
+class FeedIndex:
+    """
+    작성자별 피드와 최근 활동순 피드를 미리 정렬해 두는 인덱스입니다.
+
+    게시글/댓글 작성과 게시글 삭제 시 CRUD 함수가 커밋 후 갱신하며,
+    프로세스 시작 후 처음 사용할 때 DB에서 한 번 다시 만듭니다. (`ready`)
+    """
+
+    def __init__(self, backend: FeedBackend):
+        self.backend = backend
+        self.ready = False
+        # 다시 만드는 중(`begin_load` ~ `load`)에 삭제된 게시글 ID
+        self._removed_while_loading: set[int] | None = None
+
+    def add_post(self, post_id: int, user_id: int, created_at: datetime) -> None:
+        self.backend.add(author_feed(user_id), post_id, post_id)
+        self.backend.add(ACTIVE_FEED, post_id, activity_score(created_at), gt=True)
+
+    def remove_post(self, post_id: int, user_id: int) -> None:
+        if self._removed_while_loading is not None:
+            self._removed_while_loading.add(post_id)
+        self.backend.remove(author_feed(user_id), post_id)
+        self.backend.remove(ACTIVE_FEED, post_id)
+
+    def touch_post(self, post_id: int, at: datetime) -> None:
+        """댓글이 달린 게시글을 최근 활동순 피드의 앞으로 옮깁니다."""
+        self.backend.add(ACTIVE_FEED, post_id, activity_score(at), gt=True)
+
+    def page(
+        self,
+        feed: str,
+        limit: int,
+        skip: int = 0,
+        before: FeedEntry | None = None,
+    ) -> list[FeedEntry]:
+        """피드 항목을 점수 내림차순으로 반환합니다."""
+        return self.backend.page(feed, limit, skip, before)
+
+    def begin_load(self) -> None:
+        """다시 만들 게시글 목록을 DB에서 읽기 직전에 호출합니다."""
+        self._removed_while_loading = set()
+
+    def load(self, posts: Iterable[tuple[int, int, datetime]]) -> None:
+        """
+        (게시글 ID, 작성자 ID, 마지막 활동 시각) 목록으로 인덱스를 채웁니다.
+
+        기존 항목을 지우지 않고 덮어쓰므로, 다시 만드는 동안 반영된 작성/댓글이 사라지지
+        않습니다. `begin_load` 이후 삭제된 게시글은 읽은 목록에 있더라도 다시 넣지 않습니다.
+        """
+        removed = self._removed_while_loading or set()
+        self._removed_while_loading = None
+        for post_id, user_id, active_at in posts:
+            if post_id not in removed:
+                self.add_post(post_id, user_id, active_at)
+        self.ready = True
+
+
+feed_index = FeedIndex(MemoryFeedBackend())
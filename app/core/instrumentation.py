@@ -0,0 +1,249 @@
+"""
+요청 단위 성능 계측 도구입니다.
+
+요청마다 전체 처리 시간, SQL 실행 횟수와 누적 DB 시간, 직렬화 시간을 모아
+`Server-Timing` 헤더와 Prometheus 형식의 `/metrics` 응답으로 노출합니다.
+`METRICS_ENABLED`가 꺼져 있으면 미들웨어와 SQL 이벤트 리스너를 등록하지 않으며,
+직렬화 구간 측정은 컨텍스트 변수 조회 한 번으로 끝납니다.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)  # fmt: skip
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """요청 하나에서 누적되는 계측 값입니다."""
+
+    sql_count: int = 0
+    db_time: float = 0.0
+    serialize_time: float = 0.0
+
+    def server_timing(self, total: float) -> str:
+        return ", ".join(
+            (
+                f"total;dur={total * 1000:.2f}",
+                f'db;dur={self.db_time * 1000:.2f};desc="{self.sql_count} queries"',
+                f"serialize;dur={self.serialize_time * 1000:.2f}",
+            )
+        )
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_stats() -> RequestStats | None:
+    """현재 요청의 계측 값을 반환합니다. 계측 중이 아니면 None을 반환합니다."""
+    return _request_stats.get()
+
+
+@contextmanager
+def serialization_timer() -> Iterator[None]:
+    """감싼 구간의 소요 시간을 현재 요청의 직렬화 시간에 더합니다."""
+    stats = _request_stats.get()
+    if stats is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serialize_time += time.perf_counter() - started
+
+
+class InstrumentedORJSONResponse(ORJSONResponse):
+    """응답 본문 직렬화 시간을 계측하는 ORJSONResponse입니다."""
+
+    def render(self, content) -> bytes:
+        with serialization_timer():
+            return super().render(content)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started:
+        return
+
+    stats.sql_count += 1
+    stats.db_time += time.perf_counter() - started.pop()
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """엔진에 SQL 실행 횟수/시간을 요청별로 누적하는 이벤트 리스너를 등록합니다."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+class Histogram:
+    """Prometheus 형식으로 출력되는 레이블별 누적 히스토그램입니다."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float],
+        label_names: Sequence[str],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        # 레이블 값 -> [버킷별 개수..., 합계, 전체 개수]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, series in sorted(self._series.items()):
+            label_str = ",".join(
+                f'{name}="{_escape(value)}"'
+                for name, value in zip(self.label_names, labels)
+            )
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                yield f'{self.name}_bucket{{{label_str},le="{bound}"}} {cumulative}'
+            yield f'{self.name}_bucket{{{label_str},le="+Inf"}} {series[-1]}'
+            yield f"{self.name}_sum{{{label_str}}} {series[-2]}"
+            yield f"{self.name}_count{{{label_str}}} {series[-1]}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class MetricsRegistry:
+    """라우트 템플릿별 요청 계측 값을 모으는 저장소입니다. (프로세스 단위)"""
+
+    def __init__(self):
+        labels = ("method", "route", "status")
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "Total request latency in seconds.",
+            LATENCY_BUCKETS,
+            labels,
+        )
+        self.db_duration = Histogram(
+            "http_request_db_seconds",
+            "Cumulative SQL execution time per request in seconds.",
+            LATENCY_BUCKETS,
+            labels,
+        )
+        self.db_queries = Histogram(
+            "http_request_db_queries",
+            "Number of SQL statements executed per request.",
+            QUERY_COUNT_BUCKETS,
+            labels,
+        )
+        self.serialize_duration = Histogram(
+            "http_request_serialization_seconds",
+            "Response serialization time per request in seconds.",
+            LATENCY_BUCKETS,
+            labels,
+        )
+
+    def observe(self, labels: tuple[str, str, str], total: float, stats: RequestStats):
+        self.request_duration.observe(labels, total)
+        self.db_duration.observe(labels, stats.db_time)
+        self.db_queries.observe(labels, stats.sql_count)
+        self.serialize_duration.observe(labels, stats.serialize_time)
+
+    def render(self) -> str:
+        lines = []
+        for histogram in (
+            self.request_duration,
+            self.db_duration,
+            self.db_queries,
+            self.serialize_duration,
+        ):
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+class InstrumentationMiddleware:
+    """요청별 계측 값을 모아 `Server-Timing` 헤더를 붙이고 메트릭에 기록합니다."""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    stats.server_timing(time.perf_counter() - started),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            # 경로 파라미터 값이 아닌 라우트 템플릿으로 집계해 레이블 수를 제한합니다.
+            route = scope.get("route")
+            labels = (
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status_code),
+            )
+            self.registry.observe(labels, time.perf_counter() - started, stats)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus가 수집하는 메트릭을 텍스트 형식으로 반환합니다."""
+    return Response(metrics.render(), media_type=METRICS_MEDIA_TYPE)
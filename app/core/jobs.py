@@ -0,0 +1,210 @@
+"""
+DB 아웃박스(`jobs` 테이블) 기반 백그라운드 작업 큐입니다.
+
+CRUD 함수는 쓰기와 같은 트랜잭션에서 `enqueue_job`으로 작업을 등록하고 커밋 후
+`wake_job_workers()`를 호출합니다. 앱 수명 주기 동안 asyncio 워커가 작업을 점유하여
+같은 종류끼리 묶어 핸들러를 한 번 호출하고, 실패하면 지수 백오프로 다시 시도합니다.
+묶은 호출이 실패하면 작업마다 핸들러를 다시 호출하여, 실패한 작업만 다시 시도합니다.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.crud.job import claim_jobs_async, complete_jobs_async, fail_jobs_async
+
+logger = logging.getLogger(__name__)
+
+# 같은 종류의 작업 payload 목록을 한 번에 처리하는 핸들러. 묶은 호출이 실패하면
+# payload 하나씩 다시 호출되므로, 발송 등 외부 효과는 입력을 모두 검증한 뒤에 냅니다.
+JobHandler = Callable[[AsyncSession, list[dict[str, Any]]], Awaitable[None]]
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """작업 종류를 처리할 핸들러를 등록하는 데코레이터입니다."""
+
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    `attempts`번째 시도가 실패한 뒤 기다릴 시간(초)입니다.
+
+    지수적으로 늘리되 상한을 두고, 실패한 작업들이 한꺼번에 다시 실행되지 않도록
+    절반 범위의 무작위 지터를 더합니다.
+    """
+    delay = min(
+        settings.JOBS_BACKOFF_MAX_SECONDS,
+        settings.JOBS_BACKOFF_SECONDS * 2 ** (attempts - 1),
+    )
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class JobWorkerPool:
+    """`jobs` 테이블을 폴링하여 작업을 실행하는 프로세스 내 asyncio 워커 풀입니다."""
+
+    def __init__(
+        self,
+        workers: int = settings.JOBS_WORKERS,
+        batch_size: int = settings.JOBS_BATCH_SIZE,
+        poll_interval: float = settings.JOBS_POLL_INTERVAL_SECONDS,
+        lease_seconds: float = settings.JOBS_LEASE_SECONDS,
+        max_attempts: int = settings.JOBS_MAX_ATTEMPTS,
+    ):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # processed / failed / dead: 작업 수, batches: 핸들러 호출 수
+        self.stats: Counter[str] = Counter()
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """현재 이벤트 루프에서 워커를 시작합니다."""
+        if self.running:
+            return
+        self._session_factory = session_factory
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"job-worker-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """워커를 멈춥니다. 처리 중이던 작업은 임대 기한이 지나면 다시 실행됩니다."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+
+    def wake(self) -> None:
+        """
+        대기 중인 워커를 깨웁니다. 다른 스레드(동기 엔드포인트)에서 호출해도 안전합니다.
+
+        워커가 실행 중이 아니면 아무것도 하지 않으며, 작업은 DB에 남아 다음에 실행됩니다.
+        """
+        loop = self._loop
+        if loop is None or self._wakeup is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wakeup.set()
+        else:
+            loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("작업 큐를 처리하지 못했습니다.")
+                claimed = 0
+            # 꽉 찬 배치를 가져왔으면 남은 작업이 있을 수 있으므로 바로 다시 가져옵니다.
+            if claimed < self.batch_size:
+                await self._wait()
+
+    async def _wait(self) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+        self._wakeup.clear()
+
+    async def run_once(self) -> int:
+        """작업을 한 배치 점유하여 종류별로 처리하고, 점유한 작업 수를 반환합니다."""
+        async with self._session_factory() as db:
+            jobs = await claim_jobs_async(db, self.batch_size, self.lease_seconds)
+            groups: dict[str, list[Row]] = defaultdict(list)
+            for job in jobs:
+                groups[job.kind].append(job)
+            for kind, group in groups.items():
+                await self._handle(db, kind, group)
+            return len(jobs)
+
+    async def _handle(self, db: AsyncSession, kind: str, jobs: list[Row]) -> None:
+        handler = _handlers.get(kind)
+        if handler is None:
+            error = LookupError(f"등록되지 않은 작업 종류입니다: {kind}")
+            await self._fail(db, kind, jobs, error)
+            return
+
+        error = await self._run_handler(db, handler, jobs)
+        if error is None:
+            return
+        if len(jobs) == 1:
+            await self._fail(db, kind, jobs, error)
+            return
+
+        # payload 하나 때문에 배치 전체가 실패했을 수 있으므로, 하나씩 다시 실행하여
+        # 실제로 실패한 작업만 재시도(또는 dead) 처리합니다.
+        logger.warning(
+            "작업 %s %d개를 함께 처리하지 못해 하나씩 다시 처리합니다: %r",
+            kind,
+            len(jobs),
+            error,
+        )
+        for job in jobs:
+            error = await self._run_handler(db, handler, [job])
+            if error is not None:
+                await self._fail(db, kind, [job], error)
+
+    async def _run_handler(
+        self, db: AsyncSession, handler: JobHandler, jobs: list[Row]
+    ) -> Exception | None:
+        """핸들러를 호출하고 성공한 작업을 삭제합니다. 실패하면 그 예외를 반환합니다."""
+        self.stats["batches"] += 1
+        try:
+            await handler(db, [job.payload for job in jobs])
+        except Exception as exc:
+            # 핸들러가 남긴 트랜잭션 상태를 버립니다.
+            await db.rollback()
+            return exc
+
+        await complete_jobs_async(db, [job.id for job in jobs])
+        self.stats["processed"] += len(jobs)
+        return None
+
+    async def _fail(
+        self, db: AsyncSession, kind: str, jobs: list[Row], error: Exception
+    ) -> None:
+        logger.error(
+            "작업 %s %d개를 처리하지 못했습니다.", kind, len(jobs), exc_info=error
+        )
+        dead = await fail_jobs_async(
+            db, jobs, repr(error), self.max_attempts, retry_delay
+        )
+        self.stats["failed"] += len(jobs)
+        self.stats["dead"] += dead
+
+
+job_queue = JobWorkerPool()
+
+
+def wake_job_workers() -> None:
+    """작업을 등록한 트랜잭션을 커밋한 뒤 호출합니다."""
+    job_queue.wake()
@@ -0,0 +1,58 @@
+"""
+백그라운드 작업으로 처리하는 알림입니다.
+
+아직 메일/푸시 발송 수단이 없으므로 알림 내용을 로그로 남기며,
+발송 수단을 붙일 때는 핸들러 안의 로그 부분만 바꾸면 됩니다.
+"""
+
+import logging
+from collections import Counter
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.jobs import job_handler
+from app.models import Post, User
+
+logger = logging.getLogger(__name__)
+
+# payload: {"post_id", "user_id", "count"} (댓글 작성자와 한 번에 작성한 댓글 수)
+COMMENT_CREATED = "comment.created"
+
+
+@job_handler(COMMENT_CREATED)
+async def notify_post_authors(db: AsyncSession, payloads: list[dict[str, Any]]) -> None:
+    """
+    새 댓글이 달린 게시글의 작성자에게 알립니다.
+
+    같은 배치에 모인 댓글을 게시글별로 합쳐 작성자마다 알림 한 번만 보내며,
+    작성자가 자기 게시글에 단 댓글은 세지 않습니다.
+    """
+    new_comments: Counter[tuple[int, int]] = Counter()
+    for payload in payloads:
+        new_comments[payload["post_id"], payload["user_id"]] += payload["count"]
+
+    post_ids = {post_id for post_id, _ in new_comments}
+    stmt = (
+        select(Post.id, Post.title, Post.user_id, User.email)
+        .join(User, User.id == Post.user_id)
+        .where(Post.id.in_(post_ids))
+    )
+    per_post: Counter[int] = Counter()
+    posts = {row.id: row for row in (await db.execute(stmt)).all()}
+    for (post_id, commenter_id), count in new_comments.items():
+        post = posts.get(post_id)
+        # 그 사이 삭제된 게시글과 작성자 본인의 댓글은 알리지 않습니다.
+        if post is not None and post.user_id != commenter_id:
+            per_post[post_id] += count
+
+    for post_id, count in per_post.items():
+        post = posts[post_id]
+        logger.info(
+            "알림: %s 님의 게시글 '%s'(%d)에 새 댓글 %d개",
+            post.email,
+            post.title,
+            post_id,
+            count,
+        )
@@ -0,0 +1,45 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(**values: Any) -> str:
+    """키셋 페이지네이션 위치를 불투명한 커서 문자열로 인코딩합니다."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any] | None:
+    """커서 문자열을 디코딩합니다. 잘못된 커서이면 None을 반환합니다."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        return None
+
+    return values if isinstance(values, dict) else None
+
+
+def decode_id_cursor(cursor: str) -> int | None:
+    """ID 기반 커서에서 마지막으로 본 ID를 꺼냅니다."""
+    values = decode_cursor(cursor)
+    if values is None:
+        return None
+
+    last_id = values.get("id")
+    return last_id if isinstance(last_id, int) and last_id > 0 else None
+
+
+def decode_feed_cursor(cursor: str) -> tuple[float, int] | None:
+    """피드 커서에서 마지막으로 본 항목의 (점수, ID)를 꺼냅니다."""
+    values = decode_cursor(cursor)
+    if values is None:
+        return None
+
+    score, last_id = values.get("at"), values.get("id")
+    if not isinstance(score, (int, float)) or not isinstance(last_id, int):
+        return None
+    return float(score), last_id
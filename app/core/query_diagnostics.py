@@ -0,0 +1,208 @@
+"""
+개발/스테이징용 쿼리 진단 도구입니다.
+
+- 느린 쿼리 로그: `SLOW_QUERY_THRESHOLD_MS`를 넘긴 SQL을 바인딩 파라미터, 실행 계획과 함께 기록합니다.
+- N+1 감지: 요청 하나에서 같은 형태의 SQL이나 같은 관계의 지연 로딩이
+  `N_PLUS_ONE_THRESHOLD`번 이상 실행되면 경고하며, `N_PLUS_ONE_RAISE`가 켜져 있으면
+  `NPlusOneDetected` 예외를 발생시킵니다. (CI에서 테스트를 실패시키는 용도)
+  청크 단위 일괄 처리처럼 반복이 의도된 쿼리는 `N_PLUS_ONE_EXEMPT` 실행 옵션으로 제외합니다.
+
+테스트 픽스처에서는 `track_queries()`로 감싸 같은 검사를 적용할 수 있습니다.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+    "mysql": "EXPLAIN ",
+}
+
+# 반복 실행이 의도된 쿼리에 붙이는 실행 옵션 이름
+N_PLUS_ONE_EXEMPT = "n_plus_one_exempt"
+
+_FROM_TABLE = re.compile(r"\bFROM\s+\"?(\w+)\"?", re.IGNORECASE)
+
+
+class NPlusOneDetected(Exception):
+    """요청 하나에서 같은 쿼리가 반복 실행(N+1)되었을 때 발생합니다."""
+
+
+@dataclass
+class QueryTracker:
+    """요청 하나에서 실행된 SQL 형태와 관계 지연 로딩 횟수를 셉니다."""
+
+    threshold: int
+    strict: bool = False
+    statements: Counter = field(default_factory=Counter)
+    lazy_loads: Counter = field(default_factory=Counter)
+    reported: set = field(default_factory=set)
+
+    def _report(self, key: str, message: str) -> None:
+        if key in self.reported:
+            return
+        self.reported.add(key)
+        if self.strict:
+            raise NPlusOneDetected(message)
+        logger.warning(message)
+
+    def record_statement(self, statement: str) -> None:
+        self.statements[statement] += 1
+        count = self.statements[statement]
+        if count >= self.threshold:
+            candidates = relationships_for_statement(statement)
+            hint = f" (관계 후보: {', '.join(candidates)})" if candidates else ""
+            self._report(
+                statement,
+                f"N+1 의심: 같은 SQL이 {count}번 실행되었습니다{hint}\n{statement}",
+            )
+
+    def record_lazy_load(self, relationship: str) -> None:
+        self.lazy_loads[relationship] += 1
+        count = self.lazy_loads[relationship]
+        if count >= self.threshold:
+            self._report(
+                relationship,
+                f"N+1 의심: {relationship} 관계가 {count}번 지연 로딩되었습니다. "
+                "selectinload/joinedload로 미리 읽어오세요.",
+            )
+
+
+_tracker: ContextVar[QueryTracker | None] = ContextVar("query_tracker", default=None)
+
+
+@contextmanager
+def track_queries(
+    threshold: int | None = None, strict: bool | None = None
+) -> Iterator[QueryTracker]:
+    """감싼 구간에서 실행되는 SQL을 N+1 감지 대상으로 추적합니다."""
+    tracker = QueryTracker(
+        threshold=threshold or settings.N_PLUS_ONE_THRESHOLD,
+        strict=settings.N_PLUS_ONE_RAISE if strict is None else strict,
+    )
+    token = _tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _tracker.reset(token)
+
+
+def relationships_for_statement(statement: str) -> list[str]:
+    """SQL의 FROM 테이블을 대상으로 하는 모델 관계(`Post.user` 등) 이름을 찾습니다."""
+    from app.db.base import Base
+
+    tables = set(_FROM_TABLE.findall(statement))
+    return sorted(
+        str(relationship)
+        for mapper in Base.registry.mappers
+        for relationship in mapper.relationships
+        if relationship.target.name in tables
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("diagnostics_query_started", []).append(time.perf_counter())
+    tracker = _tracker.get()
+    if (
+        tracker is not None
+        and not executemany
+        and not context.execution_options.get(N_PLUS_ONE_EXEMPT)
+    ):
+        tracker.record_statement(statement)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("diagnostics_query_started")
+    if not started:
+        return
+
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+        logger.warning(
+            "느린 쿼리 (%.1fms)\n%s\n파라미터: %r\n실행 계획:\n%s",
+            elapsed_ms,
+            statement,
+            parameters,
+            _explain(conn, statement, parameters, executemany),
+        )
+
+
+def _explain(conn, statement: str, parameters, executemany: bool) -> str:
+    """같은 커넥션에서 DBAPI 커서로 실행 계획을 조회합니다. (이벤트 재진입 방지)"""
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if (
+        prefix is None
+        or executemany
+        or not statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    ):
+        return "(생략)"
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return "\n".join(" | ".join(map(str, row)) for row in cursor.fetchall())
+    except Exception as exc:
+        return f"(실행 계획 조회 실패: {exc})"
+    finally:
+        cursor.close()
+
+
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    tracker = _tracker.get()
+    if (
+        tracker is None
+        or not orm_execute_state.is_select
+        or orm_execute_state.lazy_loaded_from is None
+    ):
+        return
+
+    path = orm_execute_state.loader_strategy_path
+    if path is not None and len(path):
+        tracker.record_lazy_load(str(path[-1]))
+
+
+def install_query_diagnostics(engine: Engine) -> Engine:
+    """엔진에 느린 쿼리 로그와 N+1 감지용 이벤트 리스너를 등록합니다."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    if not event.contains(Session, "do_orm_execute", _do_orm_execute):
+        event.listen(Session, "do_orm_execute", _do_orm_execute)
+    return engine
+
+
+class QueryDiagnosticsMiddleware:
+    """
+    요청마다 N+1 감지를 위한 쿼리 추적 구간을 엽니다.
+
+    테스트처럼 이미 `track_queries()` 구간 안에서 요청을 보내면 바깥 추적기에 그대로 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if _tracker.get() is not None:
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries():
+            await self.app(scope, receive, send)
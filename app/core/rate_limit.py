@@ -0,0 +1,112 @@
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.core.config import settings
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+
+class RateLimitExceeded(Exception):
+    """요청 한도를 넘은 경우 발생합니다. `retry_after`초 뒤에 다시 시도할 수 있습니다."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+@dataclass(frozen=True, slots=True)
+class Rate:
+    """`limit`번의 요청을 `period`초에 걸쳐 채워지는 토큰 버킷으로 허용합니다."""
+
+    limit: int
+    period: float
+
+    @property
+    def per_second(self) -> float:
+        return self.limit / self.period
+
+
+def parse_rate(value: str) -> Rate:
+    """`"10/minute"`, `"100/5 minutes"` 형식의 문자열을 Rate로 변환합니다."""
+    match = _RATE_PATTERN.match(value)
+    if match is None or int(match.group(1)) <= 0:
+        raise ValueError(f"잘못된 요청 한도 형식입니다: {value!r}")
+
+    count, multiplier, unit = match.groups()
+    return Rate(int(count), int(multiplier or 1) * _PERIODS[unit])
+
+
+class RateLimitBackend(Protocol):
+    """
+    토큰 버킷 저장소 인터페이스입니다.
+
+    기본값은 프로세스 내 메모리 저장소이며, 같은 메서드를 구현하면
+    Redis 등 공유 저장소로 교체하여 여러 워커가 한도를 공유할 수 있습니다.
+    `consume`은 토큰을 소비하고, 토큰이 부족하면 다시 시도할 수 있을 때까지의
+    시간(초)을, 허용되면 0을 반환합니다.
+    """
+
+    def consume(self, key: str, rate: Rate, cost: int = 1) -> float: ...
+
+
+class MemoryRateLimitBackend:
+    """프로세스 내 토큰 버킷 저장소입니다. 오래 쓰이지 않은 키부터 제거합니다."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        # 키 -> (남은 토큰 수, 마지막 갱신 시각)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rate: Rate, cost: int = 1) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (rate.limit, now))
+            tokens = min(rate.limit, tokens + (now - updated_at) * rate.per_second)
+
+            retry_after = 0.0
+            if tokens >= cost:
+                tokens -= cost
+            else:
+                retry_after = (cost - tokens) / rate.per_second
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+
+        return retry_after
+
+
+class RateLimiter:
+    """`RATE_LIMITS`에 설정된 범위(scope)별 한도를 클라이언트 키마다 적용합니다."""
+
+    def __init__(self, backend: RateLimitBackend, limits: dict[str, str]):
+        self.backend = backend
+        self.rates = {scope: parse_rate(value) for scope, value in limits.items()}
+
+    def check(self, scope: str, key: str, cost: int = 1) -> None:
+        """한도를 넘었으면 `RateLimitExceeded`를 발생시킵니다. 설정이 없는 범위는 통과합니다."""
+        rate = self.rates.get(scope)
+        if rate is None:
+            return
+
+        retry_after = self.backend.consume(f"{scope}:{key}", rate, cost)
+        if retry_after > 0:
+            raise RateLimitExceeded(retry_after)
+
+
+rate_limiter = RateLimiter(
+    MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS),
+    settings.RATE_LIMITS if settings.RATE_LIMIT_ENABLED else {},
+)
@@ -0,0 +1,152 @@
+import itertools
+import json
+import math
+import threading
+from typing import Protocol
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.routing import replica_reads_allowed
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+
+class CacheBackend(Protocol):
+    """
+    응답 캐시 저장소 인터페이스입니다.
+
+    기본값은 프로세스 내 메모리 저장소이며, 같은 메서드를 구현하면
+    Redis 등 공유 저장소로 교체할 수 있습니다.
+    `incr`는 키의 값을 이전에 쓰인 적 없는 값으로 바꾸어 반환하며, 없는 키는 새로 만듭니다.
+    """
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def incr(self, key: str) -> int: ...
+
+
+class MemoryCacheBackend:
+    """
+    TTLCache 기반의 프로세스 내 응답 캐시 저장소입니다.
+
+    네임스페이스 버전도 크기가 제한된 LRU에 보관합니다. 버전은 모든 네임스페이스가
+    공유하는 증가 수열에서 받으므로, 밀려난 네임스페이스가 다시 받는 버전은
+    이전에 쓰인 적이 없어 캐시 미스만 생기고 오래된 응답이 되살아나지 않습니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries: TTLCache[str, bytes] = TTLCache(maxsize, ttl)
+        self._counters: TTLCache[str, int] = TTLCache(maxsize, math.inf)
+        self._versions = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        version = self._counters.get(key)
+        if version is not None:
+            return str(version).encode()
+        return self._entries.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.set(key, value, ttl=ttl)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            version = next(self._versions)
+            self._counters.set(key, version)
+            return version
+
+
+class ResponseCache:
+    """
+    직렬화된 JSON 응답(bytes)을 경로 + 쿼리 파라미터 단위로 캐시합니다.
+
+    각 응답은 하나 이상의 네임스페이스(예: `posts`, `post:1`)에 속하며,
+    쓰기 작업이 네임스페이스 버전을 올리면 해당 네임스페이스의 모든 키가 무효화됩니다.
+    버전이 키에 포함되므로, 무효화 직전에 시작된 조회가 뒤늦게 저장하더라도
+    이후 요청에는 보이지 않습니다.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    def _version(self, namespace: str) -> int:
+        raw = self.backend.get(f"ns:{namespace}")
+        if raw is None:
+            # 버전이 없으면(처음 보거나 저장소에서 밀려난 경우) 새 버전을 받습니다.
+            # 0 같은 고정값으로 시작하면 밀려나기 전의 응답과 키가 겹칠 수 있습니다.
+            return self.backend.incr(f"ns:{namespace}")
+        return int(raw)
+
+    def key(self, request: Request, *namespaces: str) -> str:
+        query = urlencode(sorted(request.query_params.multi_items()))
+        versions = ",".join(f"{ns}={self._version(ns)}" for ns in namespaces)
+        key = f"resp:{request.url.path}?{query}|{versions}"
+        # 복제본에서 읽은 응답은 복제 지연으로 무효화 이전 상태일 수 있으므로,
+        # primary로 고정된 요청(read-your-writes)이 읽지 않도록 다른 키에 저장합니다.
+        return f"{key}|replica" if replica_reads_allowed() else key
+
+    def get(self, key: str) -> Response | None:
+        raw = self.backend.get(key)
+        if raw is None:
+            return None
+
+        header_line, body = raw.split(b"\n", 1)
+        headers = json.loads(header_line)
+        headers[CACHE_STATUS_HEADER] = "HIT"
+        return Response(body, media_type="application/json", headers=headers)
+
+    def store(
+        self, key: str, body: bytes, headers: dict[str, str] | None = None
+    ) -> Response:
+        headers = headers or {}
+        self.backend.set(key, json.dumps(headers).encode() + b"\n" + body, self.ttl)
+        return Response(
+            body,
+            media_type="application/json",
+            headers={**headers, CACHE_STATUS_HEADER: "MISS"},
+        )
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self.backend.incr(f"ns:{namespace}")
+
+
+response_cache = ResponseCache(
+    MemoryCacheBackend(
+        settings.RESPONSE_CACHE_MAX_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS
+    ),
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+# 캐시 네임스페이스
+POSTS_NAMESPACE = "posts"
+# 댓글을 포함한 게시글 목록(include=comments)처럼 여러 게시글의 댓글에 걸친 응답용
+ALL_COMMENTS_NAMESPACE = "comments"
+
+
+def post_namespace(post_id: int) -> str:
+    return f"post:{post_id}"
+
+
+def comments_namespace(post_id: int) -> str:
+    return f"comments:{post_id}"
+
+
+def invalidate_posts(post_id: int | None = None) -> None:
+    """게시글 목록(및 특정 게시글 상세) 캐시를 무효화합니다."""
+    if post_id is None:
+        response_cache.invalidate(POSTS_NAMESPACE)
+    else:
+        response_cache.invalidate(POSTS_NAMESPACE, post_namespace(post_id))
+
+
+def invalidate_comments(post_id: int) -> None:
+    """특정 게시글의 댓글 목록 캐시를 무효화합니다."""
+    response_cache.invalidate(comments_namespace(post_id), ALL_COMMENTS_NAMESPACE)
@@ -0,0 +1,57 @@
+import heapq
+import threading
+import time
+from typing import Protocol
+
+
+class RevocationBackend(Protocol):
+    """
+    폐기된 토큰 ID(jti) 저장소 인터페이스입니다.
+
+    기본값은 프로세스 내 메모리 저장소이며, 같은 메서드를 구현하면 Redis
+    (`SET jti 1 NX EXAT exp`, `EXISTS jti`) 등 공유 저장소로 교체하여
+    여러 워커/노드가 폐기 목록을 공유할 수 있습니다.
+    `revoke`는 토큰이 만료되는 시각(epoch 초)까지 보관하며, 이미 폐기된 토큰이면
+    False를 반환합니다. (refresh 토큰을 한 번만 쓰도록 하는 데 사용합니다.)
+    """
+
+    def revoke(self, jti: str, expires_at: float) -> bool: ...
+
+    def is_revoked(self, jti: str) -> bool: ...
+
+
+class MemoryRevocationBackend:
+    """
+    jti -> 만료 시각 딕셔너리로 O(1)에 조회하는 프로세스 내 저장소입니다.
+
+    만료 시각 순 힙을 함께 유지하여, 폐기할 때마다 이미 만료된 항목을 앞에서부터 지웁니다.
+    """
+
+    def __init__(self):
+        self._revoked: dict[str, float] = {}
+        self._expiry: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: float) -> bool:
+        now = time.time()
+        with self._lock:
+            while self._expiry and self._expiry[0][0] <= now:
+                _, expired = heapq.heappop(self._expiry)
+                if self._revoked.get(expired, now) <= now:
+                    self._revoked.pop(expired, None)
+
+            if self._revoked.get(jti, 0) > now:
+                return False
+            if expires_at > now:
+                self._revoked[jti] = expires_at
+                heapq.heappush(self._expiry, (expires_at, jti))
+            return True
+
+    def is_revoked(self, jti: str) -> bool:
+        return self._revoked.get(jti, 0) > time.time()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revoked_tokens: RevocationBackend = MemoryRevocationBackend()
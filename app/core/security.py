@@ -1,15 +1,35 @@
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import multiprocessing
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from passlib.context import CryptContext
 
+from app.core.cache import token_cache
 from app.core.config import settings
+from app.core.revocation import revoked_tokens
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+# 토큰 종류 (`type` 클레임)
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
+
+class PasswordHasherBusy(Exception):
+    """비밀번호 해시 작업 대기열이 가득 차 요청을 처리할 수 없는 경우 발생합니다."""
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -19,18 +39,174 @@ def verify_password(plain_password, hashed_password) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def create_access_token(
-    data: dict, expires_delta: timedelta = timedelta(minutes=30)
-) -> str:
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    비밀번호를 검증하고, 저장된 해시가 오래된 설정(rounds 등)이면 새 해시를 함께 반환합니다.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# bcrypt는 CPU를 오래 점유하므로 요청 워커와 분리된 프로세스 풀에서 실행합니다.
+_hasher_pool: ProcessPoolExecutor | None = None
+_hasher_pending = 0
+
+
+def _get_hasher_pool() -> ProcessPoolExecutor:
+    global _hasher_pool
+    if _hasher_pool is None:
+        _hasher_pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _hasher_pool
+
+
+async def _run_in_hasher(func, *args):
+    global _hasher_pending
+    # 대기열이 가득 차면 기다리지 않고 즉시 거절합니다.
+    if _hasher_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHasherBusy()
+
+    _hasher_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hasher_pool(), func, *args)
+    finally:
+        _hasher_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_hasher(hash_password, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return await _run_in_hasher(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+def shutdown_password_hasher() -> None:
+    global _hasher_pool
+    if _hasher_pool is not None:
+        _hasher_pool.shutdown(cancel_futures=True)
+        _hasher_pool = None
+
+
+def _load_signing_key() -> Key | None:
+    if ALGORITHM.startswith("HS"):
+        return jwk.construct(SECRET_KEY, ALGORITHM)
+    if not settings.JWT_PRIVATE_KEY:
+        # 공개 키만 가진 노드는 토큰을 검증만 합니다.
+        return None
+    return jwk.construct(settings.JWT_PRIVATE_KEY, ALGORITHM)
+
+
+def _load_verification_keys() -> dict[str, Key]:
+    keys = {
+        kid: jwk.construct(key, ALGORITHM)
+        for kid, key in settings.JWT_VERIFICATION_KEYS.items()
+    }
+    if _signing_key is not None and settings.JWT_KEY_ID not in keys:
+        keys[settings.JWT_KEY_ID] = (
+            _signing_key if ALGORITHM.startswith("HS") else _signing_key.public_key()
+        )
+    return keys
+
+
+# PEM/비밀 키를 요청마다 다시 파싱하지 않도록 시작할 때 한 번만 키 객체로 만듭니다.
+_signing_key = _load_signing_key()
+_verification_keys = _load_verification_keys()
+
+
+def _create_token(data: dict, token_type: str, expires_delta: timedelta) -> str:
+    if _signing_key is None:
+        raise RuntimeError("JWT_PRIVATE_KEY가 설정되지 않아 토큰을 발급할 수 없습니다.")
+
+    now = datetime.now(timezone.utc)
     to_encode = data.copy()
-    expire = datetime.now() + expires_delta
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update(
+        {
+            "type": token_type,
+            "jti": secrets.token_urlsafe(16),
+            "iat": now,
+            "exp": now + expires_delta,
+        }
+    )
+    return jwt.encode(
+        to_encode,
+        _signing_key,
+        algorithm=ALGORITHM,
+        headers={"kid": settings.JWT_KEY_ID},
+    )
+
 
+def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    return _create_token(data, ACCESS_TOKEN, expires_delta)
 
-def verify_access_token(token: str):
+
+def create_refresh_token(data: dict, expires_delta: timedelta | None = None) -> str:
+    if expires_delta is None:
+        expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    return _create_token(data, REFRESH_TOKEN, expires_delta)
+
+
+def _decode_token(token: str) -> dict[str, Any] | None:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHM)
-        return payload
+        # 키 교체 중에는 토큰 헤더의 kid로 서명한 키를 고릅니다. (kid가 없는 토큰은 현재 키)
+        kid = jwt.get_unverified_header(token).get("kid", settings.JWT_KEY_ID)
+        key = _verification_keys.get(kid)
+        if key is None:
+            return None
+        return jwt.decode(token, key, algorithms=ALGORITHM)
     except JWTError:
         return None
+
+
+def _verify_token(token: str, token_type: str) -> dict[str, Any] | None:
+    """
+    토큰을 검증하고 클레임을 반환합니다. 유효하지 않거나 폐기된 토큰이면 None을 반환합니다.
+
+    검증된 클레임은 토큰 해시를 키로 만료 시각까지 캐시하여, 캐시 적중 시 서명 검증을
+    건너뜁니다. 폐기 여부는 캐시와 관계없이 매번 확인합니다.
+    """
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(cache_key)
+    if payload is None:
+        payload = _decode_token(token)
+        if payload is None:
+            return None
+        token_cache.set(cache_key, payload, ttl=payload.get("exp", 0) - time.time())
+
+    # type이 없는 토큰은 refresh 토큰 도입 전에 발급된 액세스 토큰입니다.
+    if payload.get("type", ACCESS_TOKEN) != token_type:
+        return None
+    jti = payload.get("jti")
+    if jti is not None and revoked_tokens.is_revoked(jti):
+        return None
+    return payload
+
+
+def verify_access_token(token: str) -> dict[str, Any] | None:
+    return _verify_token(token, ACCESS_TOKEN)
+
+
+def verify_refresh_token(token: str) -> dict[str, Any] | None:
+    return _verify_token(token, REFRESH_TOKEN)
+
+
+def revoke_token(payload: dict[str, Any]) -> bool:
+    """
+    검증된 토큰을 만료 시각까지 폐기합니다.
+
+    이미 폐기된 토큰이면 False를 반환합니다. jti가 없는 토큰은 폐기할 수 없습니다.
+    """
+    jti = payload.get("jti")
+    if jti is None:
+        return False
+    return revoked_tokens.revoke(jti, payload["exp"])
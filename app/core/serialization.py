@@ -0,0 +1,22 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import orjson
+
+from app.core.instrumentation import serialization_timer
+
+
+def dump_row(row: Mapping[str, Any]) -> bytes:
+    """DB 행(mapping) 하나를 pydantic 검증 없이 곧바로 JSON 바이트로 직렬화합니다."""
+    with serialization_timer():
+        return orjson.dumps(dict(row))
+
+
+def dump_rows(rows: Iterable[Mapping[str, Any]]) -> bytes:
+    """
+    DB 행(mapping) 목록을 pydantic 검증 없이 곧바로 JSON 바이트로 직렬화합니다.
+
+    행의 컬럼 순서와 이름이 응답 스키마와 같아야 합니다.
+    """
+    with serialization_timer():
+        return orjson.dumps([dict(row) for row in rows])
@@ -1,56 +1,142 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from operator import attrgetter
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import RowMapping, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 
-from app.models import Comment
+from app.core.feed import feed_index
+from app.core.jobs import wake_job_workers
+from app.core.notifications import COMMENT_CREATED
+from app.core.query_diagnostics import N_PLUS_ONE_EXEMPT
+from app.core.response_cache import invalidate_comments, invalidate_posts
+from app.crud.job import enqueue_job
+from app.crud.post import owned_or_admin
+from app.models import Comment, Post
 from app.schema.comment import CommentCreate, CommentUpdate
 
+# CommentRead 필드 순서와 같은 컬럼 목록입니다. ORM 객체 없이 바로 직렬화할 때 사용합니다.
+COMMENT_READ_COLUMNS = (
+    Comment.content,
+    Comment.id,
+    Comment.user_id,
+    Comment.post_id,
+    Comment.created_at,
+    Comment.updated_at,
+)
+# `fields` 파라미터로 선택할 수 있는 필드 (CommentRead 필드 + 본문 미리보기)
+COMMENT_FIELDS = tuple(column.key for column in COMMENT_READ_COLUMNS) + (
+    "content_preview",
+)
+
+
+def comment_columns(fields: Collection[str] | None = None) -> list:
+    """
+    요청한 필드에 해당하는 컬럼 목록을 `COMMENT_FIELDS` 순서로 반환합니다.
+
+    `fields`가 None이면 `CommentRead`의 모든 컬럼을 반환합니다.
+    """
+    if fields is None:
+        return list(COMMENT_READ_COLUMNS)
+    return [getattr(Comment, name) for name in COMMENT_FIELDS if name in fields]
+
+
+def _change_comment_count(post_id: int, delta: int):
+    """게시글 댓글 수를 증감하는 원자적 UPDATE 문을 만듭니다."""
+    return (
+        update(Post)
+        .where(Post.id == post_id)
+        # 댓글 수 변경은 게시글 수정이 아니므로 updated_at을 유지합니다.
+        .values(comment_count=Post.comment_count + delta, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _comment_created_payload(user_id: int, post_id: int, count: int) -> dict:
+    return {"post_id": post_id, "user_id": user_id, "count": count}
+
 
 def create_comment(
     db: Session, user_id: int, post_id: int, comment_in: CommentCreate
-) -> Comment:
-    """새로운 댓글을 DB에 저장합니다."""
+) -> Comment | None:
+    """
+    새로운 댓글을 DB에 저장합니다.
+
+    같은 트랜잭션에서 게시글의 댓글 수를 1 늘리고 게시글 작성자 알림 작업을 등록하며,
+    게시글이 없으면 None을 반환합니다.
+    """
+    if db.execute(_change_comment_count(post_id, 1)).rowcount == 0:
+        db.rollback()
+        return None
+
     db_comment = Comment(content=comment_in.content, user_id=user_id, post_id=post_id)
     db.add(db_comment)
+    enqueue_job(db, COMMENT_CREATED, _comment_created_payload(user_id, post_id, 1))
     db.commit()
-    db.refresh(db_comment)
+    invalidate_comments(post_id)
+    invalidate_posts(post_id)
+    feed_index.touch_post(post_id, db_comment.created_at)
+    wake_job_workers()
 
     return db_comment
 
 
 def get_comment(db: Session, comment_id: int) -> Comment | None:
     """ID로 특정 댓글 한 개를 조회합니다."""
-    stmt = select(Comment).where(Comment.id == comment_id)
+    stmt = (
+        select(Comment)
+        .where(Comment.id == comment_id)
+        .execution_options(replica_ok=True)
+    )
     return db.execute(stmt).scalar_one_or_none()
 
 
 def get_comments_by_post(
-    db: Session, post_id: int, skip: int = 0, limit: int = 10
+    db: Session,
+    post_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: int | None = None,
 ) -> Sequence[Comment]:
-    """특정 게시글에 작성된 모든 댓글을 페이지네이션하여 조회합니다."""
+    """
+    특정 게시글에 작성된 모든 댓글을 페이지네이션하여 조회합니다.
+
+    `after_id`가 주어지면 OFFSET 대신 해당 ID보다 큰 댓글부터 조회합니다(키셋 페이지네이션).
+    """
     stmt = (
         select(Comment)
         .where(Comment.post_id == post_id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(Comment.id.asc())
+        .execution_options(replica_ok=True)
     )
+    if after_id is not None:
+        stmt = stmt.where(Comment.id > after_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Comment.id.asc())
 
     return db.execute(stmt).scalars().all()
 
 
 def get_comments_by_user(
-    db: Session, user_id: int, skip: int = 0, limit: int = 10
+    db: Session,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: int | None = None,
 ) -> Sequence[Comment]:
-    """특정 사용자가 작성한 모든 댓글을 페이지네이션하여 조회합니다."""
-    stmt = (
-        select(Comment)
-        .where(Comment.user_id == user_id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(Comment.id.asc())
-    )
+    """
+    특정 사용자가 작성한 모든 댓글을 페이지네이션하여 조회합니다.
+
+    `after_id`가 주어지면 OFFSET 대신 해당 ID보다 큰 댓글부터 조회합니다(키셋 페이지네이션).
+    """
+    stmt = select(Comment).where(Comment.user_id == user_id)
+    if after_id is not None:
+        stmt = stmt.where(Comment.id > after_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Comment.id.asc())
 
     return db.execute(stmt).scalars().all()
 
@@ -63,12 +149,290 @@ def update_comment(
         db_comment.content = comment_in.content
 
     db.commit()
-    db.refresh(db_comment)
+    invalidate_comments(db_comment.post_id)
 
     return db_comment
 
 
 def delete_comment(db: Session, db_comment: Comment):
     """특정 댓글을 삭제합니다."""
+    post_id = db_comment.post_id
     db.delete(db_comment)
+    db.execute(_change_comment_count(post_id, -1))
     db.commit()
+    invalidate_comments(post_id)
+    invalidate_posts(post_id)
+
+
+async def create_comment_async(
+    db: AsyncSession, user_id: int, post_id: int, comment_in: CommentCreate
+) -> Comment | None:
+    """
+    새로운 댓글을 DB에 저장합니다.
+
+    같은 트랜잭션에서 게시글의 댓글 수를 1 늘리고 게시글 작성자 알림 작업을 등록하며,
+    게시글이 없으면 None을 반환합니다.
+    """
+    if (await db.execute(_change_comment_count(post_id, 1))).rowcount == 0:
+        await db.rollback()
+        return None
+
+    db_comment = Comment(content=comment_in.content, user_id=user_id, post_id=post_id)
+    db.add(db_comment)
+    enqueue_job(db, COMMENT_CREATED, _comment_created_payload(user_id, post_id, 1))
+    await db.commit()
+    invalidate_comments(post_id)
+    invalidate_posts(post_id)
+    feed_index.touch_post(post_id, db_comment.created_at)
+    wake_job_workers()
+
+    return db_comment
+
+
+async def create_comments_bulk_async(
+    db: AsyncSession,
+    user_id: int,
+    post_id: int,
+    comments_in: Sequence[CommentCreate],
+    chunk_size: int = 500,
+) -> list[Comment] | None:
+    """
+    한 게시글에 여러 댓글을 한 트랜잭션에서 일괄 생성합니다.
+
+    `chunk_size`개씩 나누어 청크마다 다중 행 `INSERT ... RETURNING` 한 번으로 저장하고,
+    게시글의 댓글 수는 한 번에 늘립니다. 게시글이 없으면 None을 반환합니다.
+    """
+    delta = len(comments_in)
+    if (await db.execute(_change_comment_count(post_id, delta))).rowcount == 0:
+        await db.rollback()
+        return None
+
+    stmt = (
+        insert(Comment)
+        # sort_by_parameter_order는 SQLite에서 행마다 INSERT를 따로 실행하므로 쓰지 않고,
+        # VALUES 순서대로 매겨지는 자동 증가 ID로 정렬해 입력 순서를 맞춥니다.
+        .returning(Comment)
+        # 청크마다 한 번씩 실행되는 것이 의도된 쿼리입니다.
+        .execution_options(**{N_PLUS_ONE_EXEMPT: True})
+    )
+    db_comments: list[Comment] = []
+    for start in range(0, len(comments_in), chunk_size):
+        rows = [
+            {"content": comment_in.content, "user_id": user_id, "post_id": post_id}
+            for comment_in in comments_in[start : start + chunk_size]
+        ]
+        created = (await db.scalars(stmt, rows)).all()
+        db_comments.extend(sorted(created, key=attrgetter("id")))
+
+    if db_comments:
+        # 댓글 수와 관계없이 작업 한 개로 알립니다.
+        payload = _comment_created_payload(user_id, post_id, len(db_comments))
+        enqueue_job(db, COMMENT_CREATED, payload)
+    await db.commit()
+    invalidate_comments(post_id)
+    invalidate_posts(post_id)
+    if db_comments:
+        feed_index.touch_post(post_id, db_comments[-1].created_at)
+        wake_job_workers()
+
+    return db_comments
+
+
+async def get_comment_async(db: AsyncSession, comment_id: int) -> Comment | None:
+    """ID로 특정 댓글 한 개를 조회합니다."""
+    stmt = (
+        select(Comment)
+        .where(Comment.id == comment_id)
+        .execution_options(replica_ok=True)
+    )
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def get_comments_by_post_async(
+    db: AsyncSession,
+    post_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: int | None = None,
+) -> Sequence[Comment]:
+    """
+    특정 게시글에 작성된 모든 댓글을 페이지네이션하여 조회합니다.
+
+    `after_id`가 주어지면 OFFSET 대신 해당 ID보다 큰 댓글부터 조회합니다(키셋 페이지네이션).
+    """
+    stmt = (
+        select(Comment)
+        .where(Comment.post_id == post_id)
+        .execution_options(replica_ok=True)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Comment.id > after_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Comment.id.asc())
+
+    return (await db.execute(stmt)).scalars().all()
+
+
+async def get_comment_rows_by_post_async(
+    db: AsyncSession,
+    post_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: int | None = None,
+    fields: Collection[str] | None = None,
+) -> Sequence[RowMapping]:
+    """
+    게시글 댓글 목록을 ORM 객체 대신 요청한 컬럼만 담은 행(mapping)으로 조회합니다.
+
+    객체 생성과 identity map 등록을 건너뛰므로 응답을 바로 직렬화하는 목록 API에서 사용합니다.
+    `fields`가 None이면 `CommentRead`의 모든 컬럼을 조회합니다.
+    """
+    stmt = (
+        select(*comment_columns(fields))
+        .where(Comment.post_id == post_id)
+        .execution_options(replica_ok=True)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Comment.id > after_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Comment.id.asc())
+
+    return (await db.execute(stmt)).mappings().all()
+
+
+async def get_comments_by_user_async(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: int | None = None,
+) -> Sequence[Comment]:
+    """
+    특정 사용자가 작성한 모든 댓글을 페이지네이션하여 조회합니다.
+
+    `after_id`가 주어지면 OFFSET 대신 해당 ID보다 큰 댓글부터 조회합니다(키셋 페이지네이션).
+    """
+    stmt = select(Comment).where(Comment.user_id == user_id)
+    if after_id is not None:
+        stmt = stmt.where(Comment.id > after_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Comment.id.asc())
+
+    return (await db.execute(stmt)).scalars().all()
+
+
+async def get_comments_for_posts_async(
+    db: AsyncSession, post_ids: Sequence[int], limit_per_post: int = 10
+) -> dict[int, list[Comment]]:
+    """
+    여러 게시글의 댓글을 게시글마다 최대 `limit_per_post`개씩 한 번의 쿼리로 조회합니다.
+
+    게시글별로 댓글을 따로 조회하는 N+1 문제를 피하기 위해 윈도 함수(ROW_NUMBER)를 사용합니다.
+    """
+    comments: dict[int, list[Comment]] = {post_id: [] for post_id in post_ids}
+    if not post_ids:
+        return comments
+
+    ranked = (
+        select(
+            Comment,
+            func.row_number()
+            .over(partition_by=Comment.post_id, order_by=Comment.id.asc())
+            .label("rn"),
+        )
+        .where(Comment.post_id.in_(post_ids))
+        .subquery()
+    )
+    ranked_comment = aliased(Comment, ranked)
+    stmt = (
+        select(ranked_comment)
+        .where(ranked.c.rn <= limit_per_post)
+        .order_by(ranked.c.post_id, ranked.c.id)
+        .execution_options(replica_ok=True)
+    )
+
+    for db_comment in (await db.execute(stmt)).scalars():
+        comments[db_comment.post_id].append(db_comment)
+
+    return comments
+
+
+async def get_comment_post_id_async(db: AsyncSession, comment_id: int) -> int | None:
+    """
+    댓글이 속한 게시글 ID를 조회합니다. (조건부 수정/삭제가 실패했을 때 원인 구분용)
+
+    댓글이 없으면 None을 반환합니다.
+    """
+    stmt = select(Comment.post_id).where(Comment.id == comment_id)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def update_comment_if_permitted_async(
+    db: AsyncSession,
+    post_id: int,
+    comment_id: int,
+    comment_in: CommentUpdate,
+    user_id: int,
+    is_admin: bool,
+) -> Comment | None:
+    """
+    작성자이거나 관리자인 경우에만 댓글 내용을 수정합니다.
+
+    게시글 일치 여부와 권한 확인, 수정을 `UPDATE ... RETURNING` 한 문장으로 처리하며,
+    조건에 맞는 댓글이 없으면 None을 반환합니다.
+    """
+    stmt = (
+        update(Comment)
+        .where(
+            Comment.id == comment_id,
+            Comment.post_id == post_id,
+            owned_or_admin(Comment.user_id, user_id, is_admin),
+        )
+        .values(content=comment_in.content)
+        .returning(Comment)
+        .execution_options(synchronize_session=False)
+    )
+    db_comment = (await db.execute(stmt)).scalar_one_or_none()
+    if db_comment is None:
+        await db.rollback()
+        return None
+
+    await db.commit()
+    invalidate_comments(post_id)
+    return db_comment
+
+
+async def delete_comment_if_permitted_async(
+    db: AsyncSession, post_id: int, comment_id: int, user_id: int, is_admin: bool
+) -> bool:
+    """
+    작성자이거나 관리자인 경우에만 댓글을 삭제합니다.
+
+    조건부 `DELETE` 한 문장으로 삭제한 뒤 같은 트랜잭션에서 게시글의 댓글 수를 1 줄이며,
+    삭제했으면 True를 반환합니다.
+    """
+    stmt = (
+        delete(Comment)
+        .where(
+            Comment.id == comment_id,
+            Comment.post_id == post_id,
+            owned_or_admin(Comment.user_id, user_id, is_admin),
+        )
+        .returning(Comment.id)
+        .execution_options(synchronize_session=False)
+    )
+    if (await db.execute(stmt)).first() is None:
+        await db.rollback()
+        return False
+
+    await db.execute(_change_comment_count(post_id, -1))
+    await db.commit()
+    invalidate_comments(post_id)
+    invalidate_posts(post_id)
+    return True
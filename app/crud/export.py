@@ -0,0 +1,91 @@
+from collections.abc import AsyncIterator, Iterator
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud.comment import COMMENT_READ_COLUMNS
+from app.crud.post import POST_READ_COLUMNS
+from app.models import Comment, Post
+
+ExportRow = tuple[Row, list[Row] | None]
+
+
+def _posts_stmt(after_id: int, chunk_size: int) -> Select:
+    # ORM 객체 대신 컬럼 행으로 읽어 identity map에 객체가 쌓이지 않게 합니다.
+    return (
+        select(*POST_READ_COLUMNS)
+        .where(Post.id > after_id)
+        .order_by(Post.id.asc())
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def _comments_stmt(after_id: int, chunk_size: int) -> Select:
+    # 게시글과 같은 순서로 읽어 두 커서를 나란히 넘기며 합칩니다. (ix_comments_post_id_id)
+    return (
+        select(*COMMENT_READ_COLUMNS)
+        .where(Comment.post_id > after_id)
+        .order_by(Comment.post_id.asc(), Comment.id.asc())
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def iter_posts_for_export(
+    db: Session,
+    after_id: int = 0,
+    include_comments: bool = False,
+    chunk_size: int = 1000,
+) -> Iterator[ExportRow]:
+    """
+    내보내기용으로 게시글을 ID 오름차순으로 순회합니다.
+
+    서버 측 커서(`yield_per`)로 `chunk_size`개씩 읽으므로 테이블 크기와 관계없이
+    메모리 사용량이 일정합니다. `include_comments`가 True이면 `(post_id, id)` 순서의
+    댓글 커서를 하나 더 열어 나란히 읽으며 `(게시글, 댓글 목록)` 쌍으로 반환하므로,
+    메모리에는 청크 하나와 현재 게시글의 댓글만 남습니다.
+    """
+    posts = db.execute(_posts_stmt(after_id, chunk_size))
+    if not include_comments:
+        for post in posts:
+            yield post, None
+        return
+
+    comments = db.execute(_comments_stmt(after_id, chunk_size))
+    pending = comments.fetchone()
+    for post in posts:
+        attached: list[Row] = []
+        # 게시글 커서를 연 뒤 지워진 게시글의 댓글은 건너뜁니다.
+        while pending is not None and pending.post_id <= post.id:
+            if pending.post_id == post.id:
+                attached.append(pending)
+            pending = comments.fetchone()
+        yield post, attached
+
+
+async def stream_posts_for_export_async(
+    db: AsyncSession,
+    after_id: int = 0,
+    include_comments: bool = False,
+    chunk_size: int = 1000,
+) -> AsyncIterator[ExportRow]:
+    """
+    내보내기용으로 게시글을 ID 오름차순으로 순회합니다.
+
+    `iter_posts_for_export`의 비동기 버전으로, `AsyncSession.stream()`으로 서버 측 커서를 엽니다.
+    """
+    posts = await db.stream(_posts_stmt(after_id, chunk_size))
+    if not include_comments:
+        async for post in posts:
+            yield post, None
+        return
+
+    comments = await db.stream(_comments_stmt(after_id, chunk_size))
+    pending = await comments.fetchone()
+    async for post in posts:
+        attached: list[Row] = []
+        while pending is not None and pending.post_id <= post.id:
+            if pending.post_id == post.id:
+                attached.append(pending)
+            pending = await comments.fetchone()
+        yield post, attached
@@ -0,0 +1,48 @@
+import asyncio
+
+from sqlalchemy import DateTime, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.feed import feed_index
+from app.models import Comment, Post
+
+_rebuild_lock = asyncio.Lock()
+
+
+async def rebuild_feed_index_async(db: AsyncSession) -> int:
+    """
+    DB에서 게시글마다 작성자와 마지막 활동 시각을 한 번에 읽어 피드 인덱스를 채웁니다.
+
+    마지막 활동 시각은 가장 최근 댓글의 작성 시각이며, 댓글이 없으면 게시글 작성 시각입니다.
+    읽은 게시글 수를 반환합니다.
+    """
+    last_comment = (
+        select(Comment.post_id, func.max(Comment.created_at).label("last_commented_at"))
+        .group_by(Comment.post_id)
+        .subquery()
+    )
+    active_at = func.coalesce(
+        last_comment.c.last_commented_at, Post.created_at, type_=DateTime
+    )
+    stmt = (
+        select(Post.id, Post.user_id, active_at)
+        .outerjoin(last_comment, last_comment.c.post_id == Post.id)
+        # 정렬된 순서로 넣으면 인덱스 리스트 끝에 추가되어 삽입 비용이 거의 없습니다.
+        .order_by(active_at, Post.id)
+    )
+
+    # 읽는 동안 삭제된 게시글이 읽은 행으로 되살아나지 않도록 삭제를 기록해 둡니다.
+    feed_index.begin_load()
+    rows = (await db.execute(stmt)).all()
+    feed_index.load(rows)
+    return len(rows)
+
+
+async def ensure_feed_index_async(db: AsyncSession) -> None:
+    """피드 인덱스가 아직 만들어지지 않았으면 한 번만 만듭니다. (동시 요청은 기다림)"""
+    if feed_index.ready:
+        return
+
+    async with _rebuild_lock:
+        if not feed_index.ready:
+            await rebuild_feed_index_async(db)
@@ -0,0 +1,133 @@
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import Row, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.query_diagnostics import N_PLUS_ONE_EXEMPT
+from app.models.job import JOB_DEAD, JOB_PENDING, Job
+
+
+def utcnow() -> datetime:
+    """작업 시각 비교에 쓰는 현재 UTC 시각입니다. (DB에는 naive UTC로 저장)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def enqueue_job(
+    db: Session | AsyncSession,
+    kind: str,
+    payload: dict[str, Any],
+    delay_seconds: float = 0.0,
+) -> Job:
+    """
+    작업을 호출한 쪽 세션에 추가합니다. 커밋은 호출한 쪽에서 합니다.
+
+    쓰기와 같은 트랜잭션에서 커밋되므로, 쓰기가 롤백되면 작업도 함께 사라집니다.
+    """
+    job = Job(
+        kind=kind,
+        payload=payload,
+        run_at=utcnow() + timedelta(seconds=delay_seconds),
+    )
+    db.add(job)
+    return job
+
+
+async def claim_jobs_async(
+    db: AsyncSession, limit: int, lease_seconds: float
+) -> list[Row]:
+    """
+    실행할 차례가 된 작업을 최대 `limit`개 점유하고 (id, kind, payload, attempts)를 반환합니다.
+
+    `locked_until`을 임대 기한으로 설정하고 시도 횟수를 늘리는 UPDATE 한 번으로 점유하므로,
+    여러 워커(프로세스)가 같은 작업을 동시에 가져가지 않습니다. 워커가 처리 중에 죽으면
+    임대 기한이 지난 뒤 다른 워커가 다시 가져갑니다.
+    PostgreSQL에서는 `FOR UPDATE SKIP LOCKED`로 다른 워커가 잡은 행을 건너뜁니다.
+    """
+    now = utcnow()
+    due_ids = (
+        select(Job.id)
+        .where(
+            Job.status == JOB_PENDING,
+            Job.run_at <= now,
+            or_(Job.locked_until.is_(None), Job.locked_until <= now),
+        )
+        .order_by(Job.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(Job)
+        .where(Job.id.in_(due_ids))
+        .values(
+            locked_until=now + timedelta(seconds=lease_seconds),
+            attempts=Job.attempts + 1,
+        )
+        # ORM 객체가 아닌 행으로 받아, 핸들러 실패 후 롤백해도 값이 만료되지 않습니다.
+        .returning(Job.id, Job.kind, Job.payload, Job.attempts)
+        .execution_options(synchronize_session=False)
+    )
+    jobs = (await db.execute(stmt)).all()
+    await db.commit()
+    return sorted(jobs, key=lambda job: job.id)
+
+
+async def complete_jobs_async(db: AsyncSession, job_ids: Sequence[int]) -> None:
+    """처리를 마친 작업을 삭제합니다."""
+    stmt = (
+        delete(Job)
+        .where(Job.id.in_(job_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def fail_jobs_async(
+    db: AsyncSession,
+    jobs: Sequence[Row],
+    error: str,
+    max_attempts: int,
+    retry_delay: Callable[[int], float],
+) -> int:
+    """
+    처리에 실패한 작업을 `retry_delay(시도 횟수)`초 뒤에 다시 실행하도록 미룹니다.
+
+    시도 횟수가 `max_attempts`에 이른 작업은 `dead`로 표시하여 더 이상 실행하지 않습니다.
+    `dead`로 표시한 작업 수를 반환합니다.
+    """
+    now = utcnow()
+    stmt = (
+        update(Job)
+        # 작업마다 다음 실행 시각이 다르므로 작업 수만큼 실행되는 것이 의도된 쿼리입니다.
+        .execution_options(synchronize_session=False, **{N_PLUS_ONE_EXEMPT: True})
+    )
+    dead = 0
+    for job in jobs:
+        values: dict[str, Any] = {"locked_until": None, "last_error": error}
+        if job.attempts >= max_attempts:
+            values["status"] = JOB_DEAD
+            dead += 1
+        else:
+            values["run_at"] = now + timedelta(seconds=retry_delay(job.attempts))
+        await db.execute(stmt.where(Job.id == job.id).values(values))
+    await db.commit()
+    return dead
+
+
+async def get_job_queue_stats_async(db: AsyncSession) -> Sequence:
+    """작업 종류/상태별 작업 수와 가장 오래된 실행 예정 시각을 조회합니다."""
+    stmt = (
+        select(
+            Job.kind,
+            Job.status,
+            func.count().label("count"),
+            func.min(Job.run_at).label("oldest_run_at"),
+        )
+        .group_by(Job.kind, Job.status)
+        .order_by(Job.kind, Job.status)
+    )
+    return (await db.execute(stmt)).all()
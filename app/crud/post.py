@@ -1,30 +1,84 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from datetime import datetime
+from operator import attrgetter
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Boolean,
+    RowMapping,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, load_only
 
+from app.core.feed import feed_index
+from app.core.query_diagnostics import N_PLUS_ONE_EXEMPT
+from app.core.response_cache import invalidate_comments, invalidate_posts
+from app.models.comment import Comment
 from app.models.post import Post
 from app.schema.post import PostCreate, PostUpdate
 
+# PostRead 필드 순서와 같은 컬럼 목록입니다. ORM 객체 없이 바로 직렬화할 때 사용합니다.
+POST_READ_COLUMNS = (
+    Post.title,
+    Post.content,
+    Post.id,
+    Post.user_id,
+    Post.comment_count,
+    Post.created_at,
+    Post.updated_at,
+)
+# `fields` 파라미터로 선택할 수 있는 필드 (PostRead 필드 + 본문 미리보기)
+POST_FIELDS = tuple(column.key for column in POST_READ_COLUMNS) + ("content_preview",)
+
+
+def post_columns(fields: Collection[str] | None = None) -> list:
+    """
+    요청한 필드에 해당하는 컬럼 목록을 `POST_FIELDS` 순서로 반환합니다.
+
+    `fields`가 None이면 `PostRead`의 모든 컬럼을 반환합니다.
+    """
+    if fields is None:
+        return list(POST_READ_COLUMNS)
+    return [getattr(Post, name) for name in POST_FIELDS if name in fields]
+
 
 def create_post(db: Session, user_id: int, post_in: PostCreate) -> Post:
     """게시글을 생성합니다."""
     db_post = Post(title=post_in.title, content=post_in.content, user_id=user_id)
     db.add(db_post)
     db.commit()
-    db.refresh(db_post)
+    invalidate_posts()
+    feed_index.add_post(db_post.id, user_id, db_post.created_at)
     return db_post
 
 
 def get_post(db: Session, post_id: int) -> Post | None:
     """게시글 하나를 조회합니다."""
-    stmt = select(Post).where(Post.id == post_id)
+    stmt = select(Post).where(Post.id == post_id).execution_options(replica_ok=True)
     return db.execute(stmt).scalar_one_or_none()
 
 
-def get_posts(db: Session, skip: int = 0, limit: int = 10) -> Sequence[Post]:
-    """게시글 목록을 조회합니다."""
-    stmt = select(Post).offset(skip).limit(limit).order_by(Post.id.desc())
+def get_posts(
+    db: Session, skip: int = 0, limit: int = 10, before_id: int | None = None
+) -> Sequence[Post]:
+    """
+    게시글 목록을 조회합니다.
+
+    `before_id`가 주어지면 OFFSET 대신 해당 ID보다 작은 게시글부터 조회합니다(키셋 페이지네이션).
+    """
+    stmt = select(Post).execution_options(replica_ok=True)
+    if before_id is not None:
+        stmt = stmt.where(Post.id < before_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Post.id.desc())
     return db.execute(stmt).scalars().all()
 
 
@@ -36,11 +90,308 @@ def update_post(db: Session, db_post: Post, post_in: PostUpdate) -> Post:
         db_post.content = post_in.content
 
     db.commit()
-    db.refresh(db_post)
+    invalidate_posts(db_post.id)
     return db_post
 
 
+def reconcile_comment_counts(db: Session) -> int:
+    """
+    비정규화된 댓글 수를 실제 댓글 수로 일괄 재계산합니다.
+
+    값이 어긋난 게시글만 갱신하며, 갱신된 게시글 수를 반환합니다.
+    """
+    actual = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(Post)
+        .where(Post.comment_count != actual)
+        # 댓글 수 보정은 게시글 수정이 아니므로 updated_at을 유지합니다.
+        .values(comment_count=actual, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    result = db.execute(stmt)
+    db.commit()
+    invalidate_posts()
+
+    return result.rowcount
+
+
 def delete_post(db: Session, db_post: Post):
     """기존 게시글을 삭제합니다."""
+    post_id, user_id = db_post.id, db_post.user_id
     db.delete(db_post)
     db.commit()
+    invalidate_posts(post_id)
+    invalidate_comments(post_id)
+    feed_index.remove_post(post_id, user_id)
+
+
+async def create_post_async(
+    db: AsyncSession, user_id: int, post_in: PostCreate
+) -> Post:
+    """게시글을 생성합니다."""
+    db_post = Post(title=post_in.title, content=post_in.content, user_id=user_id)
+    db.add(db_post)
+    await db.commit()
+    invalidate_posts()
+    feed_index.add_post(db_post.id, user_id, db_post.created_at)
+    return db_post
+
+
+async def create_posts_bulk_async(
+    db: AsyncSession,
+    user_id: int,
+    posts_in: Sequence[PostCreate],
+    chunk_size: int = 500,
+) -> list[Post]:
+    """
+    여러 게시글을 한 트랜잭션에서 일괄 생성합니다.
+
+    `chunk_size`개씩 나누어 청크마다 다중 행 `INSERT ... RETURNING` 한 번으로 저장하며,
+    생성된 게시글은 입력 순서대로 반환합니다.
+    """
+    stmt = (
+        insert(Post)
+        # sort_by_parameter_order는 SQLite에서 행마다 INSERT를 따로 실행하므로 쓰지 않고,
+        # VALUES 순서대로 매겨지는 자동 증가 ID로 정렬해 입력 순서를 맞춥니다.
+        .returning(Post)
+        # 청크마다 한 번씩 실행되는 것이 의도된 쿼리입니다.
+        .execution_options(**{N_PLUS_ONE_EXEMPT: True})
+    )
+    db_posts: list[Post] = []
+    for start in range(0, len(posts_in), chunk_size):
+        rows = [
+            {"title": post_in.title, "content": post_in.content, "user_id": user_id}
+            for post_in in posts_in[start : start + chunk_size]
+        ]
+        created = (await db.scalars(stmt, rows)).all()
+        db_posts.extend(sorted(created, key=attrgetter("id")))
+
+    await db.commit()
+    invalidate_posts()
+    for db_post in db_posts:
+        feed_index.add_post(db_post.id, user_id, db_post.created_at)
+    return db_posts
+
+
+async def get_post_async(
+    db: AsyncSession,
+    post_id: int,
+    with_author: bool = False,
+    fields: Collection[str] | None = None,
+) -> Post | None:
+    """
+    게시글 하나를 조회합니다.
+
+    `with_author`가 True이면 작성자(`Post.user`)를 JOIN으로 함께 읽어옵니다.
+    `fields`가 주어지면 해당 컬럼만 읽고 나머지 속성은 지연 로딩으로 남깁니다.
+    """
+    stmt = select(Post).where(Post.id == post_id).execution_options(replica_ok=True)
+    if with_author:
+        stmt = stmt.options(joinedload(Post.user))
+    if fields is not None:
+        stmt = stmt.options(load_only(*post_columns(fields)))
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def get_post_row_async(
+    db: AsyncSession,
+    post_id: int,
+    fields: Collection[str] | None = None,
+    with_version: bool = False,
+) -> RowMapping | None:
+    """
+    게시글 하나를 ORM 객체 대신 요청한 컬럼만 담은 행(mapping)으로 조회합니다.
+
+    `fields`가 None이면 `PostRead`의 모든 컬럼을 조회합니다.
+    `with_version`이 True이면 ETag용 `version` 컬럼을 같은 행에서 함께 읽습니다.
+    """
+    columns = post_columns(fields)
+    if with_version:
+        columns.append(Post.version)
+    stmt = select(*columns).where(Post.id == post_id).execution_options(replica_ok=True)
+    return (await db.execute(stmt)).mappings().one_or_none()
+
+
+async def get_post_version_async(
+    db: AsyncSession, post_id: int
+) -> tuple[int, int, datetime] | None:
+    """
+    게시글 본문을 읽지 않고 버전, 댓글 수, 수정 시각만 조회합니다. (조건부 요청 검증용)
+    """
+    stmt = (
+        select(Post.version, Post.comment_count, Post.updated_at)
+        .where(Post.id == post_id)
+        .execution_options(replica_ok=True)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    return None if row is None else tuple(row)
+
+
+async def get_posts_async(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    before_id: int | None = None,
+    with_author: bool = False,
+    fields: Collection[str] | None = None,
+) -> Sequence[Post]:
+    """
+    게시글 목록을 조회합니다.
+
+    `before_id`가 주어지면 OFFSET 대신 해당 ID보다 작은 게시글부터 조회합니다(키셋 페이지네이션).
+    `with_author`가 True이면 작성자(`Post.user`)를 JOIN으로 함께 읽어옵니다.
+    `fields`가 주어지면 해당 컬럼만 읽고 나머지 속성은 지연 로딩으로 남깁니다.
+    """
+    stmt = select(Post).execution_options(replica_ok=True)
+    if with_author:
+        stmt = stmt.options(joinedload(Post.user))
+    if fields is not None:
+        stmt = stmt.options(load_only(*post_columns(fields)))
+    if before_id is not None:
+        stmt = stmt.where(Post.id < before_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Post.id.desc())
+    return (await db.execute(stmt)).scalars().all()
+
+
+async def get_post_rows_async(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    before_id: int | None = None,
+    fields: Collection[str] | None = None,
+) -> Sequence[RowMapping]:
+    """
+    게시글 목록을 ORM 객체 대신 요청한 컬럼만 담은 행(mapping)으로 조회합니다.
+
+    객체 생성과 identity map 등록을 건너뛰므로 응답을 바로 직렬화하는 목록 API에서 사용합니다.
+    `fields`가 None이면 `PostRead`의 모든 컬럼을 조회합니다.
+    """
+    stmt = select(*post_columns(fields)).execution_options(replica_ok=True)
+    if before_id is not None:
+        stmt = stmt.where(Post.id < before_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit).order_by(Post.id.desc())
+    return (await db.execute(stmt)).mappings().all()
+
+
+async def get_posts_by_ids_async(
+    db: AsyncSession,
+    post_ids: Sequence[int],
+    with_author: bool = False,
+    fields: Collection[str] | None = None,
+) -> list[Post]:
+    """
+    주어진 ID 순서대로 게시글을 조회합니다. (피드 인덱스로 고른 게시글용)
+
+    기본 키 조회만 하므로 정렬 비용이 없으며, 그사이 삭제된 게시글은 건너뜁니다.
+    """
+    if not post_ids:
+        return []
+
+    stmt = select(Post).where(Post.id.in_(post_ids)).execution_options(replica_ok=True)
+    if with_author:
+        stmt = stmt.options(joinedload(Post.user))
+    if fields is not None:
+        stmt = stmt.options(load_only(*post_columns(fields)))
+
+    db_posts = {db_post.id: db_post for db_post in (await db.scalars(stmt)).unique()}
+    return [db_posts[post_id] for post_id in post_ids if post_id in db_posts]
+
+
+async def get_post_rows_by_ids_async(
+    db: AsyncSession,
+    post_ids: Sequence[int],
+    fields: Collection[str] | None = None,
+) -> list[RowMapping]:
+    """
+    주어진 ID 순서대로 게시글을 요청한 컬럼만 담은 행(mapping)으로 조회합니다.
+
+    그사이 삭제된 게시글은 건너뜁니다.
+    """
+    if not post_ids:
+        return []
+
+    stmt = (
+        select(*post_columns(fields))
+        .where(Post.id.in_(post_ids))
+        .execution_options(replica_ok=True)
+    )
+    rows = {row["id"]: row for row in (await db.execute(stmt)).mappings()}
+    return [rows[post_id] for post_id in post_ids if post_id in rows]
+
+
+def owned_or_admin(owner_column, user_id: int, is_admin: bool):
+    """`owner_column = :user_id OR :is_admin` 조건을 만듭니다. (관리자 여부도 바인딩 값)"""
+    return or_(owner_column == user_id, literal(is_admin, Boolean))
+
+
+async def post_exists_async(db: AsyncSession, post_id: int) -> bool:
+    """게시글이 있는지 확인합니다. (조건부 수정/삭제가 실패했을 때 원인 구분용)"""
+    stmt = select(Post.id).where(Post.id == post_id)
+    return (await db.execute(stmt)).first() is not None
+
+
+async def update_post_if_permitted_async(
+    db: AsyncSession, post_id: int, post_in: PostUpdate, user_id: int, is_admin: bool
+) -> Post | None:
+    """
+    작성자이거나 관리자인 경우에만 게시글을 수정합니다.
+
+    권한 확인과 수정을 `UPDATE ... WHERE id = :id AND (user_id = :uid OR :is_admin)
+    RETURNING` 한 문장으로 처리하며, 게시글이 없거나 권한이 없으면 None을 반환합니다.
+    """
+    values = post_in.model_dump(exclude_none=True)
+    if values:
+        values["version"] = Post.version + 1
+    stmt = (
+        update(Post)
+        .where(Post.id == post_id, owned_or_admin(Post.user_id, user_id, is_admin))
+        # 바꿀 값이 없으면 updated_at도 유지한 채 권한 확인과 조회만 합니다.
+        .values(values or {"updated_at": Post.updated_at})
+        .returning(Post)
+        .execution_options(synchronize_session=False)
+    )
+    db_post = (await db.execute(stmt)).scalar_one_or_none()
+    if db_post is None:
+        await db.rollback()
+        return None
+
+    await db.commit()
+    invalidate_posts(post_id)
+    return db_post
+
+
+async def delete_post_if_permitted_async(
+    db: AsyncSession, post_id: int, user_id: int, is_admin: bool
+) -> bool:
+    """
+    작성자이거나 관리자인 경우에만 게시글을 삭제합니다.
+
+    `DELETE ... WHERE id = :id AND (user_id = :uid OR :is_admin)` 한 문장으로 처리하며,
+    댓글은 DB의 `ON DELETE CASCADE`로 함께 삭제됩니다. 삭제했으면 True를 반환합니다.
+    """
+    stmt = (
+        delete(Post)
+        .where(Post.id == post_id, owned_or_admin(Post.user_id, user_id, is_admin))
+        .returning(Post.user_id)
+        .execution_options(synchronize_session=False)
+    )
+    owner_id = (await db.execute(stmt)).scalar_one_or_none()
+    if owner_id is None:
+        await db.rollback()
+        return False
+
+    await db.commit()
+    invalidate_posts(post_id)
+    invalidate_comments(post_id)
+    feed_index.remove_post(post_id, owner_id)
+    return True
@@ -0,0 +1,246 @@
+import html
+import re
+from typing import Any
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Integer,
+    String,
+    and_,
+    case,
+    exists,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Comment, Post
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# DB가 일치 구간을 표시할 때 쓰는 제어 문자(STX, ETX)입니다. 스니펫을 HTML 이스케이프한
+# 뒤에 `<mark>` 태그로 바꾸므로, 원문에 들어 있는 마크업은 그대로 전달되지 않습니다.
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+# LIKE 대체 검색의 스니펫 길이 (일치한 단어 앞뒤 글자 수)
+LIKE_SNIPPET_RADIUS = 60
+
+# 댓글에서만 일치한 게시글은 제목/본문에서 일치한 게시글보다 낮게 평가합니다.
+COMMENT_SCORE_WEIGHT = 0.5
+
+RESULT_COLUMNS = {
+    "id": Integer,
+    "title": String,
+    "user_id": Integer,
+    "created_at": DateTime,
+    "score": Float,
+    "snippet": String,
+}
+
+# score는 작을수록 관련도가 높습니다. (SQLite bm25()는 음수를 반환)
+SQLITE_SEARCH = f"""
+WITH hits AS (
+    SELECT rowid AS post_id,
+           bm25(posts_fts, 10.0, 1.0) AS score,
+           snippet(posts_fts, -1, char(2), char(3), '…', 16)
+               AS snippet
+    FROM posts_fts
+    WHERE posts_fts MATCH :query
+    UNION ALL
+    SELECT post_id,
+           bm25(comments_fts) * {COMMENT_SCORE_WEIGHT} AS score,
+           snippet(comments_fts, 0, char(2), char(3), '…', 16)
+               AS snippet
+    FROM comments_fts
+    WHERE comments_fts MATCH :query
+),
+ranked AS (
+    -- SQLite는 MIN() 집계 시 나머지 컬럼(snippet)을 최솟값 행에서 가져옵니다.
+    SELECT post_id, MIN(score) AS score, snippet
+    FROM hits
+    GROUP BY post_id
+)
+SELECT posts.id, posts.title, posts.user_id, posts.created_at,
+       ranked.score, ranked.snippet
+FROM ranked
+JOIN posts ON posts.id = ranked.post_id
+{{keyset}}
+ORDER BY ranked.score, posts.id
+LIMIT :limit
+"""
+
+POSTGRESQL_SEARCH = f"""
+WITH q AS (
+    SELECT websearch_to_tsquery('simple', :query) AS query
+),
+hits AS (
+    SELECT posts.id AS post_id,
+           (-ts_rank_cd(posts.search_vector, q.query))::float8 AS score,
+           NULL::integer AS comment_id
+    FROM posts, q
+    WHERE posts.search_vector @@ q.query
+    UNION ALL
+    SELECT comments.post_id,
+           (-ts_rank_cd(comments.search_vector, q.query)
+               * {COMMENT_SCORE_WEIGHT})::float8 AS score,
+           comments.id AS comment_id
+    FROM comments, q
+    WHERE comments.search_vector @@ q.query
+),
+ranked AS (
+    SELECT DISTINCT ON (post_id) post_id, score, comment_id
+    FROM hits
+    ORDER BY post_id, score
+)
+SELECT posts.id, posts.title, posts.user_id, posts.created_at, ranked.score,
+       ts_headline(
+           'simple',
+           coalesce(comments.content, posts.title || ' ' || posts.content),
+           q.query,
+           'StartSel=' || chr(2) || ', StopSel=' || chr(3)
+               || ', MaxFragments=1, MaxWords=16, MinWords=4'
+       ) AS snippet
+FROM ranked
+JOIN posts ON posts.id = ranked.post_id
+LEFT JOIN comments ON comments.id = ranked.comment_id
+CROSS JOIN q
+{{keyset}}
+ORDER BY ranked.score, posts.id
+LIMIT :limit
+"""
+
+KEYSET_CLAUSE = (
+    "WHERE ranked.score > :after_score "
+    "OR (ranked.score = :after_score AND posts.id > :after_id)"
+)
+
+
+def to_fts5_query(query: str) -> str:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환합니다.
+
+    각 단어를 큰따옴표 구문으로 감싸 특수 문자로 인한 문법 오류를 막고, 모든 단어를 AND로 찾습니다.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def render_snippet(snippet: str | None) -> str | None:
+    """DB가 만든 스니펫을 HTML 이스케이프하고, 일치 구간 표시만 `<mark>` 태그로 바꿉니다."""
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(MATCH_START, HIGHLIGHT_START)
+        .replace(MATCH_END, HIGHLIGHT_END)
+    )
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _contains(column, term: str):
+    return column.ilike(f"%{_escape_like(term)}%", escape="\\")
+
+
+def _like_snippet(content: str, terms: list[str]) -> str:
+    """본문에서 처음 일치한 단어 주변을 잘라, 일치한 단어를 표시 문자로 감쌉니다."""
+    pattern = re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+    match = pattern.search(content)
+    center = match.start() if match else 0
+    start = max(0, center - LIKE_SNIPPET_RADIUS)
+    end = center + LIKE_SNIPPET_RADIUS
+    snippet = pattern.sub(
+        lambda found: MATCH_START + found.group(0) + MATCH_END, content[start:end]
+    )
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(content) else "")
+
+
+async def _search_posts_like_async(
+    db: AsyncSession,
+    terms: list[str],
+    limit: int,
+    after: tuple[float, int] | None,
+) -> list[dict[str, Any]]:
+    """
+    전문 검색 인덱스를 지원하지 않는 DB에서 쓰는 LIKE 기반 대체 검색입니다.
+
+    모든 단어가 제목/본문에 있으면 `score` 0, 한 댓글에만 모두 있으면 1로 정렬하며,
+    인덱스를 타지 않으므로 게시글 수에 비례하는 비용이 듭니다.
+    """
+    in_post = and_(
+        *(
+            or_(_contains(Post.title, term), _contains(Post.content, term))
+            for term in terms
+        )
+    )
+    in_comment = exists().where(
+        Comment.post_id == Post.id,
+        *(_contains(Comment.content, term) for term in terms),
+    )
+    hits = (
+        select(
+            Post.id,
+            Post.title,
+            Post.user_id,
+            Post.created_at,
+            Post.content,
+            case((in_post, 0.0), else_=1.0).label("score"),
+        )
+        .where(or_(in_post, in_comment))
+        .subquery()
+    )
+    stmt = select(hits).order_by(hits.c.score, hits.c.id).limit(limit)
+    if after is not None:
+        stmt = stmt.where(tuple_(hits.c.score, hits.c.id) > after)
+
+    return [
+        {
+            **{key: row[key] for key in RESULT_COLUMNS if key != "snippet"},
+            "snippet": render_snippet(
+                _like_snippet(f"{row['title']} {row['content']}", terms)
+            ),
+        }
+        for row in (await db.execute(stmt)).mappings()
+    ]
+
+
+async def search_posts_async(
+    db: AsyncSession,
+    query: str,
+    limit: int = 10,
+    after: tuple[float, int] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    게시글 제목/본문과 댓글 내용에서 검색어를 찾아 관련도(BM25) 순으로 반환합니다.
+
+    `after`에 직전 페이지 마지막 결과의 (score, id)를 넘기면 그 다음 결과부터 조회합니다.
+    SQLite(FTS5)와 PostgreSQL(tsvector) 외의 DB에서는 LIKE 대체 검색을 사용합니다.
+    """
+    terms = query.split()
+    if not terms:
+        return []
+
+    dialect = db.bind.dialect.name
+    if dialect == "sqlite":
+        sql, query = SQLITE_SEARCH, to_fts5_query(query)
+    elif dialect == "postgresql":
+        sql = POSTGRESQL_SEARCH
+    else:
+        return await _search_posts_like_async(db, terms, limit, after)
+
+    params = {"query": query, "limit": limit}
+    if after is not None:
+        params["after_score"], params["after_id"] = after
+
+    stmt = text(sql.format(keyset=KEYSET_CLAUSE if after else "")).columns(
+        **RESULT_COLUMNS
+    )
+    return [
+        {**row, "snippet": render_snippet(row["snippet"])}
+        for row in (await db.execute(stmt, params)).mappings()
+    ]
@@ -1,27 +1,37 @@
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import hash_password
+from app.core.cache import invalidate_user
+from app.core.security import hash_password, hash_password_async
 from app.models.user import User
 from app.schema.user import UserCreate, UserUpdate
 
 
-def create_user(db: Session, user_in: UserCreate) -> User:
-    """신규 회원을 생성하여 DB에 등록합니다."""
+def create_user(db: Session, user_in: UserCreate) -> User | None:
+    """
+    신규 회원을 생성하여 DB에 등록합니다.
+
+    이미 가입된 E-mail이면 (유니크 제약 위반) None을 반환합니다.
+    """
     db_user = User(
         email=user_in.email,
         hashed_password=hash_password(user_in.password),
         role=user_in.role or "user",
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return None
     return db_user
 
 
 def get_user_by_id(db: Session, user_id: int) -> User | None:
     """ID로 회원을 조회합니다."""
-    stmt = select(User).where(User.id == user_id)
+    stmt = select(User).where(User.id == user_id).execution_options(replica_ok=True)
     return db.execute(stmt).scalar_one_or_none()
 
 
@@ -39,11 +49,77 @@ def update_user(db: Session, db_user: User, user_in: UserUpdate) -> User:
         db_user.hashed_password = hash_password(user_in.password)
 
     db.commit()
-    db.refresh(db_user)
+    invalidate_user(db_user.id)
     return db_user
 
 
 def delete_user(db: Session, db_user: User):
     """회원을 탈퇴합니다."""
+    user_id = db_user.id
     db.delete(db_user)
     db.commit()
+    invalidate_user(user_id)
+
+
+async def create_user_async(db: AsyncSession, user_in: UserCreate) -> User | None:
+    """
+    신규 회원을 생성하여 DB에 등록합니다.
+
+    이미 가입된 E-mail이면 (유니크 제약 위반) None을 반환합니다.
+    """
+    db_user = User(
+        email=user_in.email,
+        hashed_password=await hash_password_async(user_in.password),
+        role=user_in.role or "user",
+    )
+    db.add(db_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None
+    return db_user
+
+
+async def get_user_by_id_async(db: AsyncSession, user_id: int) -> User | None:
+    """ID로 회원을 조회합니다."""
+    stmt = select(User).where(User.id == user_id).execution_options(replica_ok=True)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def get_user_by_email_async(db: AsyncSession, user_email: str) -> User | None:
+    """가입한 E-mail 주소로 회원을 조회합니다."""
+    stmt = select(User).where(User.email == user_email)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def update_user_async(
+    db: AsyncSession, db_user: User, user_in: UserUpdate
+) -> User:
+    """기존 회원 등록 정보를 수정합니다."""
+    if user_in.email:
+        db_user.email = user_in.email
+    if user_in.password:
+        db_user.hashed_password = await hash_password_async(user_in.password)
+
+    await db.commit()
+    invalidate_user(db_user.id)
+    return db_user
+
+
+async def update_password_hash_async(
+    db: AsyncSession, db_user: User, hashed_password: str
+) -> User:
+    """비밀번호 해시만 새 값으로 교체합니다. (로그인 시 재해시용)"""
+    db_user.hashed_password = hashed_password
+
+    await db.commit()
+    return db_user
+
+
+async def delete_user_async(db: AsyncSession, db_user: User):
+    """회원을 탈퇴합니다."""
+    user_id = db_user.id
+    await db.delete(db_user)
+    await db.commit()
+    invalidate_user(user_id)
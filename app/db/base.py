@@ -2,4 +2,6 @@ from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
-    pass
+    # INSERT/UPDATE 시 서버 기본값(id, created_at, updated_at 등)을 같은 문장의
+    # RETURNING으로 받아와, 커밋 후 refresh용 SELECT를 따로 실행하지 않습니다.
+    __mapper_args__ = {"eager_defaults": True}
@@ -0,0 +1,188 @@
+"""
+읽기 전용 복제본(replica) 라우팅입니다.
+
+`replica_ok=True` 실행 옵션이 붙은 SELECT만 복제본으로 보내고, 그 외의 쿼리와
+쓰기 요청(POST/PUT/PATCH/DELETE), 쓰기 직후의 같은 클라이언트 요청(read-your-writes)은
+모두 primary에서 실행합니다.
+"""
+
+import itertools
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REPLICA_OK = "replica_ok"
+
+# 쓰기 직후 primary에서 읽어야 하는 시각(epoch 초)을 전달하는 쿠키/헤더 이름
+READ_YOUR_WRITES_COOKIE = "primary_until"
+READ_YOUR_WRITES_HEADER = "X-Primary-Until"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_primary_only: ContextVar[bool] = ContextVar("primary_only", default=False)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """감싼 구간의 모든 쿼리를 primary에서 실행합니다."""
+    token = _primary_only.set(True)
+    try:
+        yield
+    finally:
+        _primary_only.reset(token)
+
+
+def replica_reads_allowed() -> bool:
+    """현재 컨텍스트의 `replica_ok` 조회가 복제본에서 실행될 수 있는지 반환합니다."""
+    return bool(settings.DATABASE_REPLICA_URLS) and not _primary_only.get()
+
+
+class ReplicaSet:
+    """
+    복제본 엔진을 라운드 로빈으로 고릅니다.
+
+    연결 오류가 난 복제본은 `REPLICA_RETRY_SECONDS` 동안 제외되며,
+    사용할 수 있는 복제본이 없으면 None을 반환하여 primary를 사용하게 합니다.
+    """
+
+    def __init__(self, engines: Iterable[Engine] = (), retry_seconds: float = 30.0):
+        self.engines = list(engines)
+        self.retry_seconds = retry_seconds
+        self._down_until: dict[Engine, float] = {}
+        self._counter = itertools.count()
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._handle_error)
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> Engine | None:
+        now = time.monotonic()
+        for _ in range(len(self.engines)):
+            engine = self.engines[next(self._counter) % len(self.engines)]
+            if self._down_until.get(engine, 0.0) <= now:
+                return engine
+        return None
+
+    def mark_down(self, engine: Engine) -> None:
+        self._down_until[engine] = time.monotonic() + self.retry_seconds
+        logger.warning(
+            "복제본 %s을(를) %.0f초 동안 제외합니다.", engine.url, self.retry_seconds
+        )
+
+    def _handle_error(self, context) -> None:
+        dbapi = context.dialect.loaded_dbapi
+        if context.is_disconnect or isinstance(
+            context.original_exception, dbapi.OperationalError
+        ):
+            self.mark_down(context.engine)
+
+
+class RoutingSession(Session):
+    """`replica_ok` 실행 옵션이 붙은 SELECT를 복제본으로 보내는 세션입니다."""
+
+    replicas: ReplicaSet = ReplicaSet()
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            self.replicas
+            and not self._flushing
+            and not _primary_only.get()
+            and clause is not None
+            and getattr(clause, "is_select", False)
+            and clause.get_execution_options().get(REPLICA_OK)
+            and (replica := self._connect_replica()) is not None
+        ):
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def _connect_replica(self) -> Engine | None:
+        """
+        복제본을 골라 세션 트랜잭션에 연결해 두고 반환합니다.
+
+        연결에 실패한 복제본은 제외하고 다음 복제본을 시도하며, 모두 실패하면 None을
+        반환하여 같은 쿼리를 primary에서 실행합니다. 연결 단계의 실패는 세션 트랜잭션에
+        남지 않으므로 이후 쿼리와 커밋에 영향을 주지 않습니다.
+        """
+        for _ in range(len(self.replicas.engines)):
+            replica = self.replicas.choose()
+            if replica is None:
+                return None
+            try:
+                self.connection(bind_arguments={"bind": replica})
+            except DBAPIError:
+                # 연결 오류는 handle_error 리스너가 이미 mark_down 합니다.
+                continue
+            return replica
+        return None
+
+
+def routing_session_class(replicas: ReplicaSet) -> type[RoutingSession]:
+    """주어진 복제본 집합을 사용하는 RoutingSession 클래스를 만듭니다."""
+    return type("RoutingSession", (RoutingSession,), {"replicas": replicas})
+
+
+def _recently_wrote(connection: HTTPConnection) -> bool:
+    value = connection.headers.get(READ_YOUR_WRITES_HEADER) or connection.cookies.get(
+        READ_YOUR_WRITES_COOKIE
+    )
+    try:
+        return value is not None and float(value) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 요청과 쓰기 직후 같은 클라이언트의 요청을 primary로 고정합니다.
+
+    쓰기에 성공하면 `READ_YOUR_WRITES_SECONDS` 뒤의 시각을 쿠키와 헤더로 돌려주며,
+    클라이언트가 이 값을 쿠키나 `X-Primary-Until` 헤더로 다시 보내면 그때까지 primary에서 읽습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope["method"] not in SAFE_METHODS
+        primary = is_write or _recently_wrote(HTTPConnection(scope))
+
+        async def send_with_marker(message: Message) -> None:
+            if (
+                is_write
+                and message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                max_age = int(settings.READ_YOUR_WRITES_SECONDS)
+                until = int(time.time()) + max_age
+                headers = MutableHeaders(scope=message)
+                headers.append(READ_YOUR_WRITES_HEADER, str(until))
+                headers.append(
+                    "Set-Cookie",
+                    f"{READ_YOUR_WRITES_COOKIE}={until}; Max-Age={max_age}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        token = _primary_only.set(primary)
+        try:
+            await self.app(scope, receive, send_with_marker)
+        finally:
+            _primary_only.reset(token)
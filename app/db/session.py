@@ -1,12 +1,122 @@
-from sqlalchemy import create_engine
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+from app.core.admission import TimedAsyncAdaptedQueuePool, TimedQueuePool
+from app.core.config import settings
+from app.core.instrumentation import instrument_engine
+from app.core.query_diagnostics import install_query_diagnostics
+from app.db.routing import ReplicaSet, routing_session_class
+
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+
+
+def to_async_url(url: str) -> str:
+    """동기 DB URL을 비동기 드라이버(aiosqlite, asyncpg)용 URL로 변환합니다."""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith(("postgresql:", "postgresql+psycopg2:", "postgres:")):
+        return "postgresql+asyncpg:" + url.split(":", 1)[1]
+    return url
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """Settings 값으로 create_engine에 넘길 커넥션 풀 옵션을 만듭니다."""
+    options: dict[str, Any] = {}
+    url_obj = make_url(url)
+
+    if url_obj.get_backend_name() == "sqlite":
+        if url_obj.get_driver_name() == "pysqlite":
+            options["connect_args"] = {"check_same_thread": False}
+        # 인메모리 DB는 단일 커넥션 풀을 사용하므로 풀 크기 옵션을 받지 않습니다.
+        if url_obj.database in (None, "", ":memory:"):
+            return options
+
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    # 풀 대기 시간으로 요청을 거절하려면 커넥션 대기 시간을 측정하는 풀을 사용합니다.
+    if settings.DB_POOL_WAIT_SHED_MS > 0:
+        options["poolclass"] = (
+            TimedAsyncAdaptedQueuePool
+            if url_obj.get_dialect().is_async
+            else TimedQueuePool
+        )
+    return options
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """새 SQLite 커넥션마다 동시성/캐시/외래 키 관련 PRAGMA를 적용합니다."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    # SQLite는 외래 키 제약(ON DELETE CASCADE 포함)이 기본적으로 꺼져 있습니다.
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+def configure_engine(engine: Engine) -> Engine:
+    """엔진 종류와 설정에 맞는 이벤트 리스너를 등록합니다."""
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    if settings.METRICS_ENABLED:
+        instrument_engine(engine)
+    if settings.QUERY_DIAGNOSTICS_ENABLED:
+        install_query_diagnostics(engine)
+    return engine
+
+
+engine = configure_engine(
+    create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+)
+replica_engines = [
+    configure_engine(create_engine(url, **engine_options(url)))
+    for url in settings.DATABASE_REPLICA_URLS
+]
+SessionLocal = sessionmaker(
+    class_=routing_session_class(
+        ReplicaSet(replica_engines, settings.REPLICA_RETRY_SECONDS)
+    ),
+    autocommit=False,
+    autoflush=False,
+    # 쓰기 결과는 RETURNING으로 채워지므로 커밋 후 다시 읽지 않도록 만료시키지 않습니다.
+    expire_on_commit=False,
+    bind=engine,
+)
+
+SQLALCHEMY_ASYNC_DATABASE_URL = to_async_url(SQLALCHEMY_DATABASE_URL)
+
+async_engine = create_async_engine(
+    SQLALCHEMY_ASYNC_DATABASE_URL, **engine_options(SQLALCHEMY_ASYNC_DATABASE_URL)
+)
+configure_engine(async_engine.sync_engine)
+async_replica_engines = [
+    create_async_engine(to_async_url(url), **engine_options(to_async_url(url)))
+    for url in settings.DATABASE_REPLICA_URLS
+]
+for replica in async_replica_engines:
+    configure_engine(replica.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=routing_session_class(
+        ReplicaSet(
+            [replica.sync_engine for replica in async_replica_engines],
+            settings.REPLICA_RETRY_SECONDS,
+        )
+    ),
+    autoflush=False,
+    expire_on_commit=False,
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 def get_db():
@@ -15,3 +125,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,11 +1,86 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 
 from app.api.v1.routers import api_router
+from app.core.admission import AdmissionControlMiddleware
+from app.core.config import settings
+from app.core.instrumentation import (
+    InstrumentationMiddleware,
+    InstrumentedORJSONResponse,
+    metrics_endpoint,
+)
+from app.core.jobs import job_queue
+from app.core.query_diagnostics import QueryDiagnosticsMiddleware
+from app.core.rate_limit import RateLimitExceeded
+from app.core.revocation import MemoryRevocationBackend, revoked_tokens
+from app.core.security import PasswordHasherBusy, shutdown_password_hasher
+from app.crud.feed import ensure_feed_index_async
+from app.db.routing import ReadYourWritesMiddleware
+from app.db.session import AsyncSessionLocal, async_engine, async_replica_engines
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if isinstance(revoked_tokens, MemoryRevocationBackend):
+        logger.warning(
+            "토큰 폐기 목록이 프로세스 내 메모리에 있습니다. 워커/노드가 여러 개이면 "
+            "로그아웃한 토큰과 사용한 refresh 토큰이 다른 프로세스에서는 유효합니다."
+        )
+    if settings.FEED_INDEX_WARMUP:
+        # 첫 피드 요청이 인덱스를 만드는 비용을 떠안지 않도록 시작할 때 미리 만듭니다.
+        async with AsyncSessionLocal() as db:
+            await ensure_feed_index_async(db)
+    if settings.JOBS_ENABLED:
+        job_queue.start(AsyncSessionLocal)
+    yield
+    await job_queue.stop()
+    shutdown_password_hasher()
+    await async_engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+
 
 app = FastAPI(
     title="My FastAPI Project",
     description="API Documentation",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=InstrumentedORJSONResponse,
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(InstrumentationMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+if settings.QUERY_DIAGNOSTICS_ENABLED:
+    app.add_middleware(QueryDiagnosticsMiddleware)
+if settings.DATABASE_REPLICA_URLS:
+    app.add_middleware(ReadYourWritesMiddleware)
+# 가장 바깥에서 실행되도록 마지막에 추가합니다.
+if settings.MAX_CONCURRENT_REQUESTS > 0 or settings.DB_POOL_WAIT_SHED_MS > 0:
+    app.add_middleware(AdmissionControlMiddleware)
+
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many authentication requests. Try again later."},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many requests. Try again later."},
+        headers={"Retry-After": exc.retry_after_header},
+    )
+
+
 app.include_router(api_router, prefix="/api/v1")
@@ -1,3 +1,4 @@
 from app.models.comment import Comment
+from app.models.job import Job
 from app.models.post import Post
 from app.models.user import User
@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, Text, func
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
+from app.core.config import settings
 from app.db.base import Base
 from app.models.post import Post
 from app.models.user import User
@@ -10,11 +11,23 @@ from app.models.user import User
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 게시글별/작성자별 댓글 목록 조회(id 오름차순)용 복합 인덱스
+        Index("ix_comments_post_id_id", "post_id", "id"),
+        Index("ix_comments_user_id_id", "user_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # 본문 앞부분만 DB에서 잘라 읽는 미리보기. 요청한 경우에만 조회됩니다.
+    content_preview: Mapped[str] = column_property(
+        func.substr(content, 1, settings.CONTENT_PREVIEW_LENGTH), deferred=True
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    post_id: Mapped[int] = mapped_column(ForeignKey("posts.id"), nullable=False)
+    # 게시글 삭제 시 DB가 댓글을 함께 삭제합니다. (ORM이 댓글을 하나씩 읽어 지우지 않도록)
+    post_id: Mapped[int] = mapped_column(
+        ForeignKey("posts.id", ondelete="CASCADE"), nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         nullable=False,
         server_default=func.now(),
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, Index, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+JOB_PENDING = "pending"
+JOB_DEAD = "dead"  # 최대 재시도 횟수를 넘겨 더 이상 실행하지 않는 작업
+
+
+class Job(Base):
+    """
+    백그라운드 작업 아웃박스입니다.
+
+    쓰기 작업과 같은 트랜잭션에서 등록되므로 커밋된 쓰기의 후속 작업만 남고,
+    프로세스가 재시작되어도 사라지지 않습니다. 성공한 작업은 삭제됩니다.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # 실행할 차례가 된 작업을 찾는 조회용 인덱스
+        Index("ix_jobs_status_run_at", "status", "run_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=JOB_PENDING, server_default=JOB_PENDING
+    )
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    # 다음 실행 시각과 워커가 작업을 점유한 기한 (UTC)
+    run_at: Mapped[datetime] = mapped_column(nullable=False)
+    locked_until: Mapped[datetime | None] = mapped_column(nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, String, Text, func
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
+from app.core.config import settings
 from app.db.base import Base
 
 # from app.models.comment import Comment
@@ -15,6 +16,18 @@ class Post(Base):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # 본문 앞부분만 DB에서 잘라 읽는 미리보기. 요청한 경우에만 조회됩니다.
+    content_preview: Mapped[str] = column_property(
+        func.substr(content, 1, settings.CONTENT_PREVIEW_LENGTH), deferred=True
+    )
+    # 댓글 수 (비정규화). 댓글 생성/삭제 시 같은 트랜잭션에서 원자적으로 갱신됩니다.
+    comment_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+    # 수정할 때마다 1씩 올리는 버전. updated_at은 초 단위라 같은 초에 두 번 수정되면
+    # 구분되지 않으므로 ETag는 이 값으로 만듭니다. ORM으로 수정하면 매퍼가 올리고
+    # (`version_id_col`), UPDATE 문으로 수정하는 곳에서는 직접 올립니다.
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         nullable=False,
@@ -26,7 +39,16 @@ class Post(Base):
         onupdate=func.now(),
     )
 
+    __mapper_args__ = {**Base.__mapper_args__, "version_id_col": version}
+
     user = relationship("User", back_populates="posts")
     comments = relationship(
-        "Comment", back_populates="post", cascade="all, delete-orphan"
+        "Comment",
+        back_populates="post",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+
+# 작성자별 게시글 목록 조회(id 내림차순)용 복합 인덱스
+Index("ix_posts_user_id_id_desc", Post.user_id, Post.id.desc())
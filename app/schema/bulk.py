@@ -0,0 +1,37 @@
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class BulkItemError(BaseModel):
+    """일괄 생성 요청에서 검증에 실패한 항목의 위치와 오류 내용입니다."""
+
+    index: int
+    errors: list[dict[str, Any]]
+
+
+def validate_bulk_items(
+    model: type[ModelT], items: Sequence[Any]
+) -> tuple[list[ModelT], list[BulkItemError]]:
+    """
+    일괄 생성 요청 항목을 한 번에 검증합니다.
+
+    검증에 성공한 항목과, 실패한 항목의 인덱스별 오류 목록을 나누어 반환합니다.
+    """
+    valid: list[ModelT] = []
+    errors: list[BulkItemError] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append(model.model_validate(item))
+        except ValidationError as exc:
+            errors.append(
+                BulkItemError(
+                    index=index,
+                    errors=exc.errors(include_url=False, include_input=False),
+                )
+            )
+
+    return valid, errors
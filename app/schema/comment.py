@@ -2,6 +2,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict
 
+from app.schema.bulk import BulkItemError
+
 
 class CommentBase(BaseModel):
     content: str
@@ -25,3 +27,10 @@ class CommentRead(CommentBase):
     model_config = ConfigDict(
         from_attributes=True,
     )
+
+
+class CommentBulkResult(BaseModel):
+    """댓글 일괄 생성 결과입니다. 검증에 실패한 항목은 `errors`에 담깁니다."""
+
+    created: list[CommentRead]
+    errors: list[BulkItemError] = []
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class JobQueueEntry(BaseModel):
+    """작업 종류/상태별 대기 작업 수입니다."""
+
+    kind: str
+    status: str
+    count: int
+    oldest_run_at: datetime
+
+
+class JobQueueStats(BaseModel):
+    """작업 큐 깊이와 이 프로세스 워커의 처리 통계입니다."""
+
+    pending: int
+    dead: int
+    # 실행 예정 시각이 가장 오래된 대기 작업이 밀린 시간(초)
+    oldest_pending_age_seconds: float
+    queues: list[JobQueueEntry]
+    workers_running: bool
+    processed: int
+    failed: int
+    batches: int
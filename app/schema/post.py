@@ -3,7 +3,9 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from app.schema.bulk import BulkItemError
 from app.schema.comment import CommentRead
+from app.schema.user import UserSummary
 
 
 class PostBase(BaseModel):
@@ -23,6 +25,7 @@ class PostUpdate(BaseModel):
 class PostRead(PostBase):
     id: int
     user_id: int
+    comment_count: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -31,5 +34,35 @@ class PostRead(PostBase):
     )
 
 
+class PostBulkResult(BaseModel):
+    """게시글 일괄 생성 결과입니다. 검증에 실패한 항목은 `errors`에 담깁니다."""
+
+    created: list[PostRead]
+    errors: list[BulkItemError] = []
+
+
+class PostSearchResult(BaseModel):
+    """
+    게시글 검색 결과입니다.
+
+    `snippet`은 HTML 이스케이프한 원문 일부이며, 일치한 부분만 `<mark>` 태그로 감쌉니다.
+    `score`는 작을수록 관련도가 높습니다.
+    """
+
+    id: int
+    title: str
+    user_id: int
+    created_at: datetime
+    score: float
+    snippet: str
+
+
 class PostReadWithComments(PostRead):
     comments: list["CommentRead"] = []
+
+
+class PostReadWithRelations(PostRead):
+    """`include` 파라미터로 요청한 관계만 채워지는 게시글 응답입니다."""
+
+    comments: Optional[list[CommentRead]] = None
+    author: Optional[UserSummary] = None
@@ -30,3 +30,26 @@ class UserRead(UserBase):
     model_config = ConfigDict(
         from_attributes=True,
     )
+
+
+class UserSummary(BaseModel):
+    """게시글 작성자 등 다른 리소스에 포함되는 회원 요약 정보입니다."""
+
+    id: int
+    email: EmailStr
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
+
+
+class UserSnapshot(BaseModel):
+    """인증 캐시에 저장되는 최소한의 회원 정보입니다."""
+
+    id: int
+    role: str
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+    )
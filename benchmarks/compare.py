@@ -0,0 +1,40 @@
+"""
+두 벤치마크 결과(JSON)를 라우트별로 비교합니다.
+
+사용 예:
+    python -m benchmarks.compare before.json after.json
+"""
+
+import argparse
+import json
+
+METRICS = ("rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def load_results(path: str) -> dict[str, dict]:
+    with open(path) as f:
+        return {result["route"]: result for result in json.load(f)["results"]}
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args(argv)
+
+    before, after = load_results(args.before), load_results(args.after)
+    print(f"{'route':<8} {'metric':<7} {'before':>10} {'after':>10} {'change':>8}")
+    for route in [route for route in before if route in after]:
+        for metric in METRICS:
+            old, new = before[route][metric], after[route][metric]
+            print(f"{route:<8} {metric:<7} {old:>10} {new:>10} {change(old, new):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+목록 API 응답 경로 비교 벤치마크입니다.
+
+같은 DB에 두 ASGI 앱을 띄우고 httpx `ASGITransport`로 라우트마다 동시 요청을 일정 시간 보내
+초당 요청 수(RPS)와 지연 시간을 경로별로 출력합니다.
+
+- before: 목록은 ORM 객체 → TypeAdapter 검증 → dump_json, 나머지 응답은 `JSONResponse`
+  (행 직렬화와 `default_response_class` 변경 이전의 응답 경로)
+- after: 현재 `app.main:app` (컬럼 행 → orjson, `default_response_class`는 orjson 응답)
+
+측정 라우트:
+- posts: `GET /api/v1/posts/?limit=N`
+- comments: `GET /api/v1/posts/1/comments/?limit=N`
+- comment: `GET /api/v1/posts/1/comments/{id}` (response_model 직렬화 → 기본 응답 클래스)
+
+사용 예:
+    python -m benchmarks.list_serialization --posts 2000 --limit 100 --duration 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+_db_dir = tempfile.mkdtemp(prefix="bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+# DB 조회와 직렬화 경로를 비교하므로 응답 캐시와 요청 한도를 끕니다.
+os.environ["RESPONSE_CACHE_TTL_SECONDS"] = "0"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+from fastapi import APIRouter, FastAPI, Query, Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.api.deps import AsyncDbSession  # noqa: E402
+from app.api.v1.routers import api_router  # noqa: E402
+from app.core.conditional import body_etag  # noqa: E402
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor  # noqa: E402
+from app.crud.comment import get_comments_by_post_async  # noqa: E402
+from app.crud.post import get_posts_async  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import async_engine, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Comment, Post, User  # noqa: E402
+from app.schema.comment import CommentRead  # noqa: E402
+from app.schema.post import PostRead  # noqa: E402
+from benchmarks.run import drive, summarize  # noqa: E402
+
+PostReadListAdapter = TypeAdapter(list[PostRead])
+CommentReadListAdapter = TypeAdapter(list[CommentRead])
+
+
+def seed(posts: int, comments: int, content_size: int) -> int:
+    """벤치마크용 데이터를 생성하고, 1번 게시글에 달린 첫 댓글 ID를 반환합니다."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            User.__table__.insert(),
+            [{"email": "bench@example.com", "hashed_password": "x", "role": "user"}],
+        )
+        conn.execute(
+            Post.__table__.insert(),
+            [
+                {"title": f"title {i}", "content": "x" * content_size, "user_id": 1}
+                for i in range(posts)
+            ],
+        )
+        conn.execute(
+            Comment.__table__.insert(),
+            [
+                {"content": f"comment {i}", "user_id": 1, "post_id": 1}
+                for i in range(comments)
+            ],
+        )
+    return 1
+
+
+def list_response(body: bytes, ids: list[int], limit: int) -> Response:
+    # 현재 목록 API와 같은 커서/ETag 헤더를 붙여 직렬화 경로만 다르게 합니다.
+    headers = {"ETag": body_etag(body)}
+    if len(ids) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(id=ids[-1])
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def build_before_app() -> FastAPI:
+    """목록을 ORM 객체와 TypeAdapter로 직렬화하고 `JSONResponse`를 쓰는 이전 응답 경로입니다."""
+    router = APIRouter()
+
+    @router.get("/api/v1/posts/")
+    async def read_posts(
+        db: AsyncDbSession, limit: int = Query(10, ge=1, le=100)
+    ) -> Response:
+        db_posts = await get_posts_async(db, 0, limit)
+        body = PostReadListAdapter.dump_json(
+            PostReadListAdapter.validate_python(db_posts, from_attributes=True)
+        )
+        return list_response(body, [db_post.id for db_post in db_posts], limit)
+
+    @router.get("/api/v1/posts/{post_id}/comments/")
+    async def read_comments(
+        post_id: int, db: AsyncDbSession, limit: int = Query(10, ge=1, le=100)
+    ) -> Response:
+        db_comments = await get_comments_by_post_async(db, post_id, 0, limit)
+        body = CommentReadListAdapter.dump_json(
+            CommentReadListAdapter.validate_python(db_comments, from_attributes=True)
+        )
+        ids = [db_comment.id for db_comment in db_comments]
+        return list_response(body, ids, limit)
+
+    before = FastAPI(default_response_class=JSONResponse)
+    # 목록 라우트가 먼저 일치하도록 이전 경로를 먼저 등록하고, 나머지는 현재 라우트를 씁니다.
+    before.include_router(router)
+    before.include_router(api_router, prefix="/api/v1")
+    before.user_middleware = list(app.user_middleware)
+    return before
+
+
+def build_routes(args: argparse.Namespace, comment_id: int) -> dict:
+    return {
+        "posts": lambda client, rng: client.get(
+            "/api/v1/posts/", params={"limit": args.limit}
+        ),
+        "comments": lambda client, rng: client.get(
+            "/api/v1/posts/1/comments/", params={"limit": args.limit}
+        ),
+        "comment": lambda client, rng: client.get(
+            f"/api/v1/posts/1/comments/{comment_id}"
+        ),
+    }
+
+
+async def measure(
+    client: httpx.AsyncClient, route: str, make_request, args: argparse.Namespace
+) -> dict:
+    if args.warmup > 0:
+        await drive(client, make_request, args.concurrency, args.warmup)
+    latencies, statuses, elapsed = await drive(
+        client, make_request, args.concurrency, args.duration
+    )
+    return summarize(route, latencies, statuses, elapsed)
+
+
+async def run(args: argparse.Namespace) -> list[dict]:
+    comment_id = seed(args.posts, args.comments, args.content_size)
+    paths = {"before": build_before_app(), "after": app}
+    results = []
+    try:
+        for route, make_request in build_routes(args, comment_id).items():
+            # DB 상태 변화의 영향을 줄이도록 라우트마다 두 경로를 번갈아 측정합니다.
+            rps = {}
+            for name, target in paths.items():
+                transport = httpx.ASGITransport(app=target)
+                async with httpx.AsyncClient(
+                    transport=transport, base_url="http://benchmark"
+                ) as client:
+                    result = await measure(client, route, make_request, args)
+                print(json.dumps({"path": name, **result}), file=sys.stderr)
+                rps[name] = result["rps"]
+            results.append(
+                {
+                    "route": route,
+                    "before_rps": rps["before"],
+                    "after_rps": rps["after"],
+                    "speedup": round(rps["after"] / rps["before"], 2)
+                    if rps["before"]
+                    else None,
+                }
+            )
+    finally:
+        await async_engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.list_serialization")
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--comments", type=int, default=500)
+    parser.add_argument("--content-size", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="라우트별 측정 시간(초)"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=1.0, help="라우트별 워밍업 시간(초)"
+    )
+    args = parser.parse_args()
+
+    for result in asyncio.run(run(args)):
+        print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
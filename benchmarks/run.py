@@ -0,0 +1,326 @@
+"""
+API 부하 테스트 / 벤치마크 도구입니다.
+
+데이터를 생성한 DB에 실제 `app.main:app`을 띄우고, 라우트마다 동시 요청을 일정 시간 보내
+p50/p95/p99 지연 시간과 초당 요청 수(RPS)를 측정합니다.
+
+- `--mode asgi`: 같은 프로세스에서 httpx ASGI 클라이언트로 호출 (네트워크/서버 비용 제외)
+- `--mode uvicorn`: uvicorn 서버 프로세스를 띄워 HTTP로 호출
+
+사용 예:
+    python -m benchmarks.run --posts 5000 --concurrency 32 --output before.json
+    python -m benchmarks.run --mode uvicorn --workers 2 --output after.json
+    python -m benchmarks.compare before.json after.json
+
+`--database-url`로 로컬 PostgreSQL 등 다른 DB를 지정할 수 있으며, 빈 DB를 사용해야 합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+import httpx
+
+ROUTES = ("list", "detail", "create", "login")
+
+RequestFactory = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """정렬된 값에서 nearest-rank 방식으로 백분위수를 구합니다."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(route: str, latencies: list[float], statuses: Counter, elapsed: float):
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if status >= 400)
+    return {
+        "route": route,
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3)
+        if latencies
+        else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    make_request: RequestFactory,
+    concurrency: int,
+    duration: float,
+    seed: int = 0,
+) -> tuple[list[float], Counter, float]:
+    """`concurrency`개의 작업자가 `duration`초 동안 요청을 반복합니다."""
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline:
+            sent = time.perf_counter()
+            try:
+                response = await make_request(client, rng)
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 599
+            latencies.append(time.perf_counter() - sent)
+            statuses[status] += 1
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return latencies, statuses, time.perf_counter() - started
+
+
+def build_routes(args: argparse.Namespace, token: str) -> dict[str, RequestFactory]:
+    from benchmarks.seed import BENCH_PASSWORD, bench_email
+
+    auth = {"Authorization": f"Bearer {token}"}
+
+    async def list_posts(client, rng):
+        return await client.get("/api/v1/posts/", params={"limit": args.page_size})
+
+    async def post_detail(client, rng):
+        return await client.get(f"/api/v1/posts/{rng.randint(1, args.posts)}")
+
+    async def create_post(client, rng):
+        return await client.post(
+            "/api/v1/posts/",
+            json={"title": "benchmark", "content": "lorem ipsum " * 50},
+            headers=auth,
+        )
+
+    async def login(client, rng):
+        return await client.post(
+            "/api/v1/users/login",
+            data={
+                "username": bench_email(rng.randrange(args.users)),
+                "password": BENCH_PASSWORD,
+            },
+        )
+
+    return {
+        "list": list_posts,
+        "detail": post_detail,
+        "create": create_post,
+        "login": login,
+    }
+
+
+async def benchmark(client: httpx.AsyncClient, args: argparse.Namespace) -> list:
+    from benchmarks.seed import BENCH_PASSWORD, bench_email
+
+    response = await client.post(
+        "/api/v1/users/login",
+        data={"username": bench_email(0), "password": BENCH_PASSWORD},
+    )
+    response.raise_for_status()
+    routes = build_routes(args, response.json()["access_token"])
+
+    results = []
+    for index, route in enumerate(args.routes):
+        if args.warmup > 0:
+            await drive(client, routes[route], args.concurrency, args.warmup)
+        latencies, statuses, elapsed = await drive(
+            client, routes[route], args.concurrency, args.duration, seed=index
+        )
+        result = summarize(route, latencies, statuses, elapsed)
+        print(json.dumps(result), file=sys.stderr)
+        results.append(result)
+
+    return results
+
+
+async def run_asgi(args: argparse.Namespace) -> list:
+    from app.core.security import shutdown_password_hasher
+    from app.db.session import async_engine
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            return await benchmark(client, args)
+    finally:
+        shutdown_password_hasher()
+        await async_engine.dispose()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/openapi.json")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn 서버가 시간 내에 시작되지 않았습니다.")
+
+
+async def run_uvicorn(args: argparse.Namespace) -> list:
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=os.environ.copy(),
+    )
+    limits = httpx.Limits(max_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60.0
+        ) as client:
+            await _wait_ready(client)
+            return await benchmark(client, args)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--mode", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument(
+        "--database-url",
+        help="벤치마크에 사용할 빈 DB URL (기본값: 임시 디렉터리의 SQLite 파일)",
+    )
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--comments", type=int, default=5000)
+    parser.add_argument("--content-size", type=int, default=2000)
+    parser.add_argument(
+        "--routes",
+        type=lambda value: [route for route in value.split(",") if route],
+        default=list(ROUTES),
+        help=f"측정할 라우트 (쉼표로 구분, 기본값: {','.join(ROUTES)})",
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="라우트별 측정 시간(초)"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=1.0, help="라우트별 워밍업 시간(초)"
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=100, help="list 라우트의 limit"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="응답 캐시를 켠 상태로 측정 (기본값: 꺼서 DB 경로를 측정)",
+    )
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    if unknown := set(args.routes) - set(ROUTES):
+        parser.error(f"알 수 없는 라우트: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    # app 모듈은 환경 변수로 설정을 읽으므로, 환경 변수를 먼저 정한 뒤 가져옵니다.
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{tempfile.mkdtemp(prefix='bench-')}/bench.db"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    # 같은 회원/IP로 요청을 반복하므로 요청 한도를 끈 상태로 측정합니다.
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    if not args.response_cache:
+        os.environ["RESPONSE_CACHE_TTL_SECONDS"] = "0"
+
+    from app.db.session import engine
+    from benchmarks.seed import seed
+
+    seed(engine, args.users, args.posts, args.comments, args.content_size)
+    engine.dispose()
+
+    runner = run_asgi if args.mode == "asgi" else run_uvicorn
+    results = asyncio.run(runner(args))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "mode": args.mode,
+            "database": engine.dialect.name,
+            "users": args.users,
+            "posts": args.posts,
+            "comments": args.comments,
+            "content_size": args.content_size,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "page_size": args.page_size,
+            "workers": args.workers if args.mode == "uvicorn" else None,
+            "response_cache": args.response_cache,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
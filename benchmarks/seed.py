@@ -0,0 +1,81 @@
+"""
+벤치마크용 데이터를 생성합니다.
+
+빈 데이터베이스를 기준으로 하며, 회원 비밀번호는 모두 `BENCH_PASSWORD`입니다.
+"""
+
+import random
+
+from sqlalchemy import Engine, insert
+
+from app.core.security import hash_password
+from app.db.base import Base
+from app.models import Comment, Post, User
+
+BENCH_PASSWORD = "benchmark"
+
+
+def bench_email(index: int) -> str:
+    return f"bench{index}@example.com"
+
+
+def _insert_batches(conn, table, rows, batch_size: int) -> None:
+    for start in range(0, len(rows), batch_size):
+        conn.execute(insert(table), rows[start : start + batch_size])
+
+
+def seed(
+    engine: Engine,
+    users: int = 10,
+    posts: int = 1000,
+    comments: int = 5000,
+    content_size: int = 2000,
+    batch_size: int = 5000,
+) -> None:
+    """테이블을 만들고 회원/게시글/댓글을 지정한 수만큼 생성합니다."""
+    Base.metadata.create_all(engine)
+
+    rng = random.Random(0)
+    hashed_password = hash_password(BENCH_PASSWORD)
+    comment_post_ids = [rng.randint(1, posts) for _ in range(comments)] if posts else []
+    comment_counts = [0] * (posts + 1)
+    for post_id in comment_post_ids:
+        comment_counts[post_id] += 1
+
+    with engine.begin() as conn:
+        _insert_batches(
+            conn,
+            User,
+            [
+                {"email": bench_email(i), "hashed_password": hashed_password}
+                for i in range(users)
+            ],
+            batch_size,
+        )
+        _insert_batches(
+            conn,
+            Post,
+            [
+                {
+                    "title": f"benchmark post {i}",
+                    "content": "lorem ipsum " * (content_size // 12),
+                    "user_id": i % users + 1,
+                    "comment_count": comment_counts[i + 1],
+                }
+                for i in range(posts)
+            ],
+            batch_size,
+        )
+        _insert_batches(
+            conn,
+            Comment,
+            [
+                {
+                    "content": f"benchmark comment {i}",
+                    "user_id": i % users + 1,
+                    "post_id": post_id,
+                }
+                for i, post_id in enumerate(comment_post_ids)
+            ],
+            batch_size,
+        )
@@ -0,0 +1,174 @@
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+# app 설정은 임포트할 때 읽히므로, 어떤 app 모듈보다 먼저 테스트용 환경을 지정합니다.
+_TEST_DIR = tempfile.mkdtemp(prefix="blog-tests-")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_TEST_DIR}/test.db")
+# 실행되는 SQL을 그대로 세도록 응답 캐시, 요청 한도, 시작 시 작업을 끕니다.
+os.environ.setdefault("RESPONSE_CACHE_TTL_SECONDS", "0")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("FEED_INDEX_WARMUP", "false")
+os.environ.setdefault("JOBS_ENABLED", "false")
+# track_queries()가 SQL을 셀 수 있도록 엔진에 쿼리 진단 리스너를 등록합니다.
+os.environ.setdefault("QUERY_DIAGNOSTICS_ENABLED", "true")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.core.cache import token_cache, user_cache  # noqa: E402
+from app.core.feed import feed_index  # noqa: E402
+from app.core.query_diagnostics import track_queries  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, async_engine, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Comment, Post, User  # noqa: E402
+
+ADMIN_ID = 1_000_000
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database() -> Iterator[None]:
+    Base.metadata.create_all(engine)
+    yield
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def detect_n_plus_one() -> Iterator[None]:
+    """
+    테스트 전체를 strict 모드 N+1 감지 구간으로 감쌉니다.
+
+    같은 SQL이나 같은 관계의 지연 로딩이 `N_PLUS_ONE_THRESHOLD`번 이상 실행되면
+    `NPlusOneDetected`가 발생해 테스트가 실패합니다.
+    """
+    with track_queries(strict=True):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clean_state() -> Iterator[None]:
+    """테스트마다 모든 테이블과 프로세스 내 캐시/인덱스를 비웁니다."""
+    yield
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    token_cache.clear()
+    user_cache.clear()
+    feed_index.backend.clear()
+    feed_index.ready = False
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    # 요청마다 이벤트 루프가 바뀌지 않도록 수명 주기 동안 하나의 루프에서 실행합니다.
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def make_blog() -> Callable[..., list[int]]:
+    """
+    게시글마다 작성자가 다른 게시글과 댓글을 만들고 새 게시글 ID 목록을 반환합니다.
+
+    여러 번 호출하면 이어지는 ID로 데이터를 더 만듭니다. 행마다 INSERT를 실행하지
+    않도록 executemany로 한 번에 넣습니다. (`track_queries`는 executemany를 세지 않습니다)
+    """
+    next_id = 1
+
+    def make(posts: int, comments_per_post: int = 0) -> list[int]:
+        nonlocal next_id
+        ids = range(next_id, next_id + posts)
+        next_id += posts
+        users = [
+            {"id": i, "email": f"user{i}@example.com", "hashed_password": "x"}
+            for i in ids
+        ]
+        rows = [
+            {
+                "id": i,
+                "title": f"title {i}",
+                "content": f"content {i}",
+                "user_id": i,
+                "comment_count": comments_per_post,
+            }
+            for i in ids
+        ]
+        comments = [
+            {"content": f"comment {n} on {i}", "user_id": i, "post_id": i}
+            for i in ids
+            for n in range(comments_per_post)
+        ]
+        with SessionLocal() as db:
+            db.execute(insert(User), users)
+            db.execute(insert(Post), rows)
+            if comments:
+                db.execute(insert(Comment), comments)
+            db.commit()
+        return list(ids)
+
+    return make
+
+
+@pytest.fixture
+def make_admin() -> Callable[[], int]:
+    """관리자 회원을 만들고 ID를 반환합니다. (make_blog의 ID와 겹치지 않습니다)"""
+
+    def make() -> int:
+        with SessionLocal() as db:
+            db.execute(
+                insert(User),
+                {
+                    "id": ADMIN_ID,
+                    "email": "admin@example.com",
+                    "hashed_password": "x",
+                    "role": "admin",
+                },
+            )
+            db.commit()
+        return ADMIN_ID
+
+    return make
+
+
+@pytest.fixture
+def auth_headers() -> Callable[[int], dict[str, str]]:
+    """회원 ID로 액세스 토큰을 발급해 Authorization 헤더를 만듭니다."""
+
+    def headers(user_id: int) -> dict[str, str]:
+        token = create_access_token({"sub": str(user_id)})
+        return {"Authorization": f"Bearer {token}"}
+
+    return headers
+
+
+@pytest.fixture
+def capture_sql() -> Callable[[], AbstractContextManager[list[str]]]:
+    """
+    감싼 구간에서 `before_cursor_execute`로 실행된 SQL을 모두 모읍니다.
+
+    `track_queries`와 달리 executemany와 `N_PLUS_ONE_EXEMPT` 쿼리도 빠짐없이 셉니다.
+    """
+
+    @contextmanager
+    def capture() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engines = (engine, async_engine.sync_engine)
+        for target in engines:
+            event.listen(target, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", record)
+
+    return capture
@@ -0,0 +1,122 @@
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+
+from app.core import admission
+from app.core.admission import (
+    AdmissionControlMiddleware,
+    PoolWaitMonitor,
+    TimedQueuePool,
+)
+from app.core.config import settings
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def monitor(monkeypatch) -> PoolWaitMonitor:
+    """테스트마다 관측값이 없는 풀 대기 시간 모니터를 사용합니다."""
+    monitor = PoolWaitMonitor()
+    monkeypatch.setattr(admission, "pool_wait", monitor)
+    return monitor
+
+
+def shedding_app(**options) -> tuple[AdmissionControlMiddleware, anyio.Event]:
+    """`/slow` 요청이 `release`가 설정될 때까지 끝나지 않는 앱을 감쌉니다."""
+    inner = FastAPI()
+    release = anyio.Event()
+
+    @inner.get("/")
+    async def index() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @inner.get("/slow")
+    async def slow() -> dict[str, str]:
+        await release.wait()
+        return {"status": "ok"}
+
+    return AdmissionControlMiddleware(inner, **options), release
+
+
+def client_for(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.mark.anyio
+async def test_sheds_when_pool_wait_crosses_threshold(monitor):
+    app, _ = shedding_app(max_concurrency=0, pool_wait_threshold_ms=50)
+
+    async with client_for(app) as client:
+        monitor.observe(0.01)
+        assert (await client.get("/")).status_code == 200
+
+        for _ in range(10):
+            monitor.observe(0.5)
+        response = await client.get("/")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.SHED_RETRY_AFTER_SECONDS)
+
+
+@pytest.mark.anyio
+async def test_stale_pool_wait_stops_shedding(monitor, monkeypatch):
+    app, _ = shedding_app(max_concurrency=0, pool_wait_threshold_ms=50)
+    monitor.observe(0.5)
+    # 거절하는 동안에는 새 관측이 없으므로, 오래된 평균으로는 계속 거절하지 않습니다.
+    monkeypatch.setattr(admission, "POOL_WAIT_STALE_SECONDS", 0.0)
+
+    async with client_for(app) as client:
+        assert (await client.get("/")).status_code == 200
+
+
+@pytest.mark.anyio
+async def test_sheds_above_max_concurrency(monitor):
+    app, release = shedding_app(max_concurrency=1, pool_wait_threshold_ms=0)
+
+    async with client_for(app) as client, anyio.create_task_group() as tg:
+        statuses = []
+
+        async def slow_request() -> None:
+            statuses.append((await client.get("/slow")).status_code)
+
+        tg.start_soon(slow_request)
+        while app.in_flight == 0:
+            await anyio.sleep(0.01)
+
+        assert (await client.get("/")).status_code == 503
+        release.set()
+
+    assert statuses == [200]
+    assert app.in_flight == 0
+
+
+def test_timed_pool_records_connection_wait(monitor, tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/pool.db",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    held = engine.connect()
+    # 유일한 커넥션을 잠시 뒤에 돌려주어 다음 요청이 풀에서 기다리게 합니다.
+    threading.Timer(0.2, held.close).start()
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    waited = time.perf_counter() - started
+    engine.dispose()
+
+    assert waited >= 0.15
+    assert monitor.overloaded(0.01)
+    assert not monitor.overloaded(1.0)
@@ -0,0 +1,72 @@
+import logging
+import time
+
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import create_refresh_token
+from app.main import app
+
+LOGOUT_URL = "/api/v1/users/logout"
+REFRESH_URL = "/api/v1/users/refresh"
+
+
+def bearer(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def legacy_access_token(user_id: int) -> str:
+    """refresh 토큰 도입 전 형식(type, jti 없음)의 액세스 토큰을 만듭니다."""
+    return jwt.encode(
+        {"sub": str(user_id), "exp": int(time.time()) + 600},
+        security._signing_key,
+        algorithm=security.ALGORITHM,
+        headers={"kid": settings.JWT_KEY_ID},
+    )
+
+
+def test_refresh_token_can_be_used_once(client, make_blog):
+    [user_id] = make_blog(posts=1)
+    refresh_token = create_refresh_token({"sub": str(user_id)})
+
+    first = client.post(REFRESH_URL, json={"refresh_token": refresh_token})
+    second = client.post(REFRESH_URL, json={"refresh_token": refresh_token})
+
+    assert first.status_code == 200
+    assert first.json()["refresh_token"] != refresh_token
+    assert second.status_code == 401
+
+
+def test_logout_revokes_access_and_refresh_tokens(client, make_blog, auth_headers):
+    [user_id] = make_blog(posts=1)
+    headers = auth_headers(user_id)
+    refresh_token = create_refresh_token({"sub": str(user_id)})
+
+    response = client.post(
+        LOGOUT_URL, json={"refresh_token": refresh_token}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert client.post(LOGOUT_URL, headers=headers).status_code == 401
+    refreshed = client.post(REFRESH_URL, json={"refresh_token": refresh_token})
+    assert refreshed.status_code == 401
+
+
+def test_logout_rejects_token_that_cannot_be_revoked(client, make_blog):
+    [user_id] = make_blog(posts=1)
+    headers = bearer(legacy_access_token(user_id))
+
+    response = client.post(LOGOUT_URL, headers=headers)
+
+    assert response.status_code == 400
+    # 폐기되지 않았으므로 만료될 때까지 계속 쓸 수 있습니다.
+    assert client.post(LOGOUT_URL, headers=headers).status_code == 400
+
+
+def test_startup_warns_about_process_local_revocation(caplog):
+    with caplog.at_level(logging.WARNING, logger="app.main"), TestClient(app):
+        pass
+
+    assert any("토큰 폐기 목록" in record.message for record in caplog.records)
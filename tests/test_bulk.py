@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models import Post
+
+CHUNK_SIZE = 3
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(settings, "BULK_CHUNK_SIZE", CHUNK_SIZE)
+
+
+def inserts_into(statements: list[str], table: str) -> list[str]:
+    return [s for s in statements if s.startswith(f"INSERT INTO {table}")]
+
+
+def test_bulk_posts_insert_one_statement_per_chunk(
+    client, make_blog, auth_headers, capture_sql
+):
+    [user_id] = make_blog(posts=1)
+    items = [{"title": f"bulk {i}", "content": f"content {i}"} for i in range(7)]
+
+    with capture_sql() as statements:
+        response = client.post(
+            "/api/v1/posts/bulk", json=items, headers=auth_headers(user_id)
+        )
+
+    assert response.status_code == 201, response.text
+    inserts = inserts_into(statements, "posts")
+    assert len(inserts) == 3  # 3 + 3 + 1
+    assert all("RETURNING" in s for s in inserts)
+
+
+def test_bulk_posts_keep_input_order_and_report_invalid_items(
+    client, make_blog, auth_headers
+):
+    [user_id] = make_blog(posts=1)
+    items = [
+        {"title": "first", "content": "a"},
+        {"title": "missing content"},
+        {"title": "second", "content": "b"},
+        "not an object",
+        {"title": "third", "content": "c"},
+        {"title": "fourth", "content": "d"},
+    ]
+
+    response = client.post(
+        "/api/v1/posts/bulk", json=items, headers=auth_headers(user_id)
+    )
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    created = body["created"]
+    assert [post["title"] for post in created] == ["first", "second", "third", "fourth"]
+    ids = [post["id"] for post in created]
+    assert ids == sorted(ids)
+    assert [error["index"] for error in body["errors"]] == [1, 3]
+
+    with SessionLocal() as db:
+        stored = db.scalars(select(Post.title).where(Post.user_id == user_id)).all()
+    assert sorted(stored) == sorted(["first", "second", "third", "fourth", "title 1"])
+
+
+def test_bulk_comments_insert_one_statement_per_chunk(
+    client, make_blog, auth_headers, capture_sql
+):
+    [post_id] = make_blog(posts=1)
+    items = [{"content": f"comment {i}"} for i in range(7)] + [{"content": 1.5}]
+
+    with capture_sql() as statements:
+        response = client.post(
+            f"/api/v1/posts/{post_id}/comments/bulk",
+            json=items,
+            headers=auth_headers(post_id),
+        )
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert [c["content"] for c in body["created"]] == [f"comment {i}" for i in range(7)]
+    assert [error["index"] for error in body["errors"]] == [7]
+
+    inserts = inserts_into(statements, "comments")
+    assert len(inserts) == 3
+    assert all("RETURNING" in s for s in inserts)
+    # 댓글 수는 일괄 요청 전체에 대해 한 번만 늘립니다.
+    assert len([s for s in statements if s.startswith("UPDATE posts")]) == 1
+
+    with SessionLocal() as db:
+        assert db.get(Post, post_id).comment_count == 7
+
+
+def test_bulk_comments_on_missing_post_is_404(client, make_blog, auth_headers):
+    [user_id] = make_blog(posts=1)
+
+    response = client.post(
+        "/api/v1/posts/999/comments/bulk",
+        json=[{"content": "orphan"}],
+        headers=auth_headers(user_id),
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.crud.export import iter_posts_for_export
+from app.db.session import SessionLocal
+from app.models import Comment
+
+# 게시글별 댓글 수 (청크 경계와 댓글 없는 게시글을 함께 확인합니다)
+COMMENTS = [3, 0, 1, 5, 0, 2, 4]
+
+
+@pytest.fixture
+def blog(make_blog):
+    post_ids = make_blog(posts=len(COMMENTS))
+    comments = [
+        {"content": f"comment {n}", "user_id": post_id, "post_id": post_id}
+        for post_id, count in zip(post_ids, COMMENTS, strict=True)
+        for n in range(count)
+    ]
+    with SessionLocal() as db:
+        db.execute(insert(Comment), comments)
+        db.commit()
+    return post_ids
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 2)
+
+
+def export(client, headers, **params) -> list[dict]:
+    response = client.get("/api/v1/posts/export", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_streams_comments_in_post_order(
+    client, blog, make_admin, auth_headers, capture_sql
+):
+    headers = auth_headers(make_admin())
+
+    with capture_sql() as statements:
+        records = export(client, headers, include_comments=True)
+
+    assert [record["id"] for record in records] == blog
+    for record, count in zip(records, COMMENTS, strict=True):
+        comments = record["comments"]
+        assert len(comments) == count
+        assert {comment["post_id"] for comment in comments} <= {record["id"]}
+        ids = [comment["id"] for comment in comments]
+        assert ids == sorted(ids)
+    # 청크 수와 관계없이 게시글과 댓글 커서 하나씩만 엽니다.
+    exported = [s for s in statements if "FROM posts" in s or "FROM comments" in s]
+    assert len(exported) == 2
+
+
+def test_export_resumes_after_id(client, blog, make_admin, auth_headers):
+    headers = auth_headers(make_admin())
+
+    records = export(client, headers, include_comments=True, after_id=blog[3])
+
+    assert [record["id"] for record in records] == blog[4:]
+    assert [len(record["comments"]) for record in records] == COMMENTS[4:]
+
+
+def test_export_without_comments(client, blog, make_admin, auth_headers):
+    records = export(client, auth_headers(make_admin()))
+
+    assert [record["id"] for record in records] == blog
+    assert all("comments" not in record for record in records)
+
+
+def test_export_requires_admin(client, blog, auth_headers):
+    response = client.get("/api/v1/posts/export", headers=auth_headers(blog[0]))
+
+    assert response.status_code == 403
+
+
+def test_sync_export_matches_comments_to_posts(blog):
+    with SessionLocal() as db:
+        rows = [
+            (post.id, [comment.post_id for comment in comments])
+            for post, comments in iter_posts_for_export(
+                db, include_comments=True, chunk_size=2
+            )
+        ]
+
+    assert rows == [
+        (post_id, [post_id] * count)
+        for post_id, count in zip(blog, COMMENTS, strict=True)
+    ]
@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app.core.feed import ACTIVE_FEED, author_feed, feed_index
+from app.crud.feed import rebuild_feed_index_async
+from app.crud.post import delete_post_if_permitted_async
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import Comment, Post, User
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def posts() -> list[int]:
+    """
+    회원 1의 게시글 1~4를 한 시간 간격으로 만들고, 게시글 2에 가장 늦은 댓글을 답니다.
+
+    최근 활동순은 2, 4, 3, 1이고 작성자별 최신순은 4, 3, 2, 1입니다.
+    """
+    ids = [1, 2, 3, 4]
+    with SessionLocal() as db:
+        db.execute(
+            insert(User), {"id": 1, "email": "a@example.com", "hashed_password": "x"}
+        )
+        db.execute(
+            insert(Post),
+            [
+                {
+                    "id": i,
+                    "title": f"title {i}",
+                    "content": "c",
+                    "user_id": 1,
+                    "created_at": START + timedelta(hours=i),
+                }
+                for i in ids
+            ],
+        )
+        db.execute(
+            insert(Comment),
+            {
+                "content": "c",
+                "user_id": 1,
+                "post_id": 2,
+                "created_at": START + timedelta(days=1),
+            },
+        )
+        db.commit()
+    return ids
+
+
+def page_ids(response) -> list[int]:
+    assert response.status_code == 200, response.text
+    return [post["id"] for post in response.json()]
+
+
+def test_active_feed_orders_by_last_activity(client, posts):
+    response = client.get("/api/v1/posts/", params={"sort": "active"})
+
+    assert page_ids(response) == [2, 4, 3, 1]
+
+
+def test_active_feed_moves_commented_post_to_front(client, posts, auth_headers):
+    client.get("/api/v1/posts/", params={"sort": "active"})
+
+    client.post(
+        "/api/v1/posts/3/comments/", json={"content": "new"}, headers=auth_headers(1)
+    )
+    response = client.get("/api/v1/posts/", params={"sort": "active"})
+
+    assert page_ids(response)[0] == 3
+
+
+@pytest.mark.parametrize(
+    ("url", "params", "expected"),
+    [
+        pytest.param("/api/v1/posts/", {"sort": "active"}, [2, 4, 3, 1], id="active"),
+        pytest.param("/api/v1/users/1/posts", {}, [4, 3, 2, 1], id="author"),
+    ],
+)
+def test_feed_cursor_pages(client, posts, url, params, expected):
+    first = client.get(url, params={**params, "limit": 3})
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get(url, params={**params, "limit": 3, "cursor": cursor})
+
+    assert page_ids(first) + page_ids(second) == expected
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_deleted_post_leaves_feeds(client, posts, auth_headers):
+    client.get("/api/v1/posts/", params={"sort": "active"})
+
+    response = client.delete("/api/v1/posts/2", headers=auth_headers(1))
+    assert response.status_code == 200
+
+    active = client.get("/api/v1/posts/", params={"sort": "active"})
+    author = client.get("/api/v1/users/1/posts")
+    assert page_ids(active) == [4, 3, 1]
+    assert page_ids(author) == [4, 3, 1]
+
+
+@pytest.mark.anyio
+async def test_rebuild_does_not_restore_post_deleted_while_loading(posts):
+    async with AsyncSessionLocal() as db:
+        execute = db.execute
+
+        async def execute_then_delete(*args, **kwargs):
+            frozen = (await execute(*args, **kwargs)).freeze()
+            # SQLite는 읽기 트랜잭션이 열려 있으면 다른 커넥션이 커밋할 수 없습니다.
+            await db.rollback()
+            # 다시 만들기가 행을 읽은 뒤, 인덱스에 넣기 전에 다른 요청이 게시글을 삭제합니다.
+            async with AsyncSessionLocal() as other:
+                assert await delete_post_if_permitted_async(other, 2, 1, False)
+            return frozen()
+
+        db.execute = execute_then_delete
+        await rebuild_feed_index_async(db)
+
+    # aiosqlite 커넥션은 이벤트 루프에 묶이므로 테스트마다 풀을 비웁니다.
+    await async_engine.dispose()
+
+    assert [post_id for _, post_id in feed_index.page(ACTIVE_FEED, 10)] == [4, 3, 1]
+    assert [post_id for _, post_id in feed_index.page(author_feed(1), 10)] == [
+        4,
+        3,
+        1,
+    ]
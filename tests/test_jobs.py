@@ -0,0 +1,101 @@
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+
+from app.core import jobs as job_module
+from app.core.jobs import JobWorkerPool
+from app.crud.job import enqueue_job
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine
+from app.models.job import JOB_DEAD, JOB_PENDING, Job
+
+KIND = "test.echo"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def handled(monkeypatch) -> list[list[dict[str, Any]]]:
+    """`bad` payload가 섞이면 실패하는 핸들러를 등록하고, 호출마다 받은 payload를 모읍니다."""
+    calls: list[list[dict[str, Any]]] = []
+
+    async def handler(db, payloads: list[dict[str, Any]]) -> None:
+        calls.append(payloads)
+        if any(payload.get("bad") for payload in payloads):
+            raise ValueError("bad payload")
+
+    monkeypatch.setitem(job_module._handlers, KIND, handler)
+    return calls
+
+
+def enqueue(*payloads: dict[str, Any], kind: str = KIND) -> None:
+    with SessionLocal() as db:
+        for payload in payloads:
+            enqueue_job(db, kind, payload)
+        db.commit()
+
+
+def job_states() -> list[tuple[dict[str, Any], str, int]]:
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Job.payload, Job.status, Job.attempts).order_by(Job.id)
+        ).all()
+    return [tuple(row) for row in rows]
+
+
+async def run_once(max_attempts: int = 3) -> JobWorkerPool:
+    pool = JobWorkerPool(workers=1, batch_size=10, max_attempts=max_attempts)
+    pool._session_factory = AsyncSessionLocal
+    await pool.run_once()
+    # aiosqlite 커넥션은 이벤트 루프에 묶이므로 테스트마다 풀을 비웁니다.
+    await async_engine.dispose()
+    return pool
+
+
+@pytest.mark.anyio
+async def test_batch_is_handled_in_one_call(handled):
+    enqueue({"n": 1}, {"n": 2}, {"n": 3})
+
+    pool = await run_once()
+
+    assert handled == [[{"n": 1}, {"n": 2}, {"n": 3}]]
+    assert job_states() == []
+    assert pool.stats == {"batches": 1, "processed": 3}
+
+
+@pytest.mark.anyio
+async def test_bad_payload_only_fails_its_own_job(handled):
+    enqueue({"n": 1}, {"n": 2, "bad": True}, {"n": 3})
+
+    pool = await run_once()
+
+    # 배치 호출이 실패하면 payload마다 한 번씩 다시 호출합니다.
+    assert handled[1:] == [[{"n": 1}], [{"n": 2, "bad": True}], [{"n": 3}]]
+    assert job_states() == [({"n": 2, "bad": True}, JOB_PENDING, 1)]
+    assert pool.stats["processed"] == 2
+    assert pool.stats["failed"] == 1
+
+
+@pytest.mark.anyio
+async def test_bad_payload_is_marked_dead_without_valid_jobs(handled):
+    enqueue({"n": 1}, {"n": 2, "bad": True})
+
+    pool = await run_once(max_attempts=1)
+
+    assert job_states() == [({"n": 2, "bad": True}, JOB_DEAD, 1)]
+    assert pool.stats["dead"] == 1
+
+
+@pytest.mark.anyio
+async def test_unknown_kind_fails_whole_group_once(handled):
+    enqueue({"n": 1}, {"n": 2}, kind="test.unknown")
+
+    pool = await run_once()
+
+    assert handled == []
+    assert [status for _, status, _ in job_states()] == [JOB_PENDING, JOB_PENDING]
+    assert pool.stats["failed"] == 2
+    assert pool.stats["batches"] == 0
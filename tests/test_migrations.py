@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import select
+
+from alembic import command
+from alembic.config import Config
+from app.models import Comment, Post
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(name, sa.DateTime, nullable=False, server_default=sa.func.now())
+        for name in ("created_at", "updated_at")
+    ]
+
+
+def create_baseline_schema(connection: sa.Connection) -> None:
+    """첫 마이그레이션 이전(모델로 테이블만 만들던 시점)의 스키마를 만듭니다."""
+    metadata = sa.MetaData()
+    sa.Table(
+        "users",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("email", sa.String, unique=True, index=True, nullable=False),
+        sa.Column("hashed_password", sa.String, nullable=False),
+        sa.Column("role", sa.String),
+        *timestamps(),
+    )
+    sa.Table(
+        "posts",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("user_id", sa.ForeignKey("users.id"), nullable=False),
+        *timestamps(),
+    )
+    sa.Table(
+        "comments",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("user_id", sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("post_id", sa.ForeignKey("posts.id"), nullable=False),
+        *timestamps(),
+    )
+    metadata.create_all(connection)
+
+
+@pytest.fixture
+def migrated(tmp_path):
+    """기존 스키마의 SQLite DB를 마지막 리비전(head)까지 업그레이드합니다."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    with engine.connect() as connection:
+        create_baseline_schema(connection)
+        connection.commit()
+
+        # alembic.ini의 로깅 설정이 앱 로거를 끄지 않도록 스크립트 위치만 지정합니다.
+        config = Config()
+        config.set_main_option("script_location", str(ROOT / "alembic"))
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+        yield connection
+    engine.dispose()
+
+
+def query_plan(connection: sa.Connection, stmt) -> str:
+    sql = stmt.compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    return "\n".join(row.detail for row in rows)
+
+
+@pytest.mark.parametrize(
+    ("stmt", "index"),
+    [
+        # 게시글별 댓글 목록 (OFFSET / 키셋 페이지네이션)
+        (
+            select(Comment).where(Comment.post_id == 1).order_by(Comment.id).limit(10),
+            "ix_comments_post_id_id",
+        ),
+        (
+            select(Comment)
+            .where(Comment.post_id == 1, Comment.id > 100)
+            .order_by(Comment.id)
+            .limit(10),
+            "ix_comments_post_id_id",
+        ),
+        # 회원별 댓글 목록
+        (
+            select(Comment).where(Comment.user_id == 1).order_by(Comment.id).limit(10),
+            "ix_comments_user_id_id",
+        ),
+        # 작성자별 게시글 목록 (최신순)
+        (
+            select(Post).where(Post.user_id == 1).order_by(Post.id.desc()).limit(10),
+            "ix_posts_user_id_id_desc",
+        ),
+    ],
+    ids=[
+        "comments-by-post",
+        "comments-by-post-keyset",
+        "comments-by-user",
+        "posts-by-user",
+    ],
+)
+def test_listing_queries_use_composite_indexes(migrated, stmt, index):
+    plan = query_plan(migrated, stmt)
+
+    assert f"INDEX {index}" in plan, plan
+    # 인덱스 순서로 읽으므로 정렬 단계가 없어야 합니다.
+    assert "USE TEMP B-TREE FOR ORDER BY" not in plan, plan
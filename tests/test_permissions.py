@@ -0,0 +1,113 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.db.session import SessionLocal
+from app.models import Comment, Post
+
+POST_URL = "/api/v1/posts/{post_id}"
+COMMENT_URL = "/api/v1/posts/{post_id}/comments/{comment_id}"
+
+# (메서드, URL, 요청 본문, 성공 상태 코드)
+POST_WRITES = [
+    pytest.param("PUT", POST_URL, {"title": "edited"}, 200, id="update-post"),
+    pytest.param("DELETE", POST_URL, None, 200, id="delete-post"),
+]
+COMMENT_WRITES = [
+    pytest.param("PUT", COMMENT_URL, {"content": "edited"}, 200, id="update-comment"),
+    pytest.param("DELETE", COMMENT_URL, None, 204, id="delete-comment"),
+]
+
+
+@pytest.fixture
+def blog(make_blog) -> dict[int, int]:
+    """
+    게시글 1, 2(작성자 1, 2)와 각 게시글 작성자의 댓글을 하나씩 만듭니다.
+
+    게시글 ID -> 댓글 ID 매핑을 반환합니다.
+    """
+    make_blog(posts=2, comments_per_post=1)
+    with SessionLocal() as db:
+        return dict(db.execute(select(Comment.post_id, Comment.id)).tuples().all())
+
+
+@pytest.fixture
+def write(client, auth_headers):
+    def send(method, url, body, user_id, post_id, comment_id=None):
+        return client.request(
+            method,
+            url.format(post_id=post_id, comment_id=comment_id),
+            json=body,
+            headers=auth_headers(user_id),
+        )
+
+    return send
+
+
+def rows() -> tuple[list[tuple], list[tuple]]:
+    with SessionLocal() as db:
+        posts = db.execute(select(Post.id, Post.title)).all()
+        comments = db.execute(select(Comment.id, Comment.content)).all()
+    return posts, comments
+
+
+@pytest.mark.parametrize(("method", "url", "body", "ok"), POST_WRITES + COMMENT_WRITES)
+def test_owner_can_write(blog, write, method, url, body, ok):
+    response = write(method, url, body, 1, post_id=1, comment_id=blog[1])
+
+    assert response.status_code == ok, response.text
+
+
+@pytest.mark.parametrize(("method", "url", "body", "ok"), POST_WRITES + COMMENT_WRITES)
+def test_admin_can_write_any(blog, write, make_admin, method, url, body, ok):
+    response = write(method, url, body, make_admin(), post_id=1, comment_id=blog[1])
+
+    assert response.status_code == ok, response.text
+
+
+@pytest.mark.parametrize(("method", "url", "body", "ok"), POST_WRITES + COMMENT_WRITES)
+def test_other_user_is_forbidden(blog, write, method, url, body, ok):
+    before = rows()
+
+    response = write(method, url, body, 2, post_id=1, comment_id=blog[1])
+
+    assert response.status_code == 403
+    assert rows() == before
+
+
+@pytest.mark.parametrize(("method", "url", "body", "ok"), POST_WRITES)
+def test_missing_post_returns_404(blog, write, method, url, body, ok):
+    assert write(method, url, body, 1, post_id=999).status_code == 404
+
+
+@pytest.mark.parametrize(("method", "url", "body", "ok"), COMMENT_WRITES)
+def test_missing_comment_returns_404(blog, write, method, url, body, ok):
+    assert write(method, url, body, 1, post_id=1, comment_id=999).status_code == 404
+
+
+@pytest.mark.parametrize(("method", "url", "body", "ok"), COMMENT_WRITES)
+def test_comment_under_wrong_post_returns_400(blog, write, method, url, body, ok):
+    before = rows()
+
+    # 댓글 작성자가 요청해도 다른 게시글 경로로는 수정/삭제할 수 없습니다.
+    response = write(method, url, body, 1, post_id=2, comment_id=blog[1])
+
+    assert response.status_code == 400
+    assert rows() == before
+
+
+def test_delete_post_removes_comments_in_one_statement(make_blog, write, capture_sql):
+    make_blog(posts=2, comments_per_post=3)
+
+    with capture_sql() as statements:
+        response = write("DELETE", POST_URL, None, 1, post_id=1)
+
+    assert response.status_code == 200
+    deletes = [s for s in statements if s.startswith("DELETE")]
+    assert len(deletes) == 1
+    assert deletes[0].startswith("DELETE FROM posts")
+    with SessionLocal() as db:
+        remaining = db.execute(
+            select(Comment.post_id, func.count()).group_by(Comment.post_id)
+        ).all()
+    # 댓글은 DB의 ON DELETE CASCADE로 함께 삭제됩니다.
+    assert remaining == [(2, 3)]
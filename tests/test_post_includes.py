@@ -0,0 +1,43 @@
+import pytest
+
+# include 조합별로 요청 하나가 실행해야 하는 SQL 문 수
+# (게시글과 작성자는 JOIN 한 번, 댓글은 게시글 ID 목록으로 한 번 더 읽습니다)
+INCLUDES = [
+    ("comments,author", 2),
+    ("author,comments", 2),
+    ("comments", 2),
+    ("author", 1),
+]
+
+
+def count_statements(client, capture_sql, url: str) -> int:
+    """요청 하나가 실행한 SQL 문 수를 셉니다."""
+    with capture_sql() as statements:
+        response = client.get(url)
+    assert response.status_code == 200, response.text
+    return len(statements)
+
+
+@pytest.mark.parametrize(("include", "expected"), INCLUDES)
+def test_list_includes_run_fixed_number_of_statements(
+    client, capture_sql, make_blog, include, expected
+):
+    url = f"/api/v1/posts/?include={include}&limit=50"
+
+    make_blog(posts=2, comments_per_post=1)
+    assert count_statements(client, capture_sql, url) == expected
+
+    make_blog(posts=30, comments_per_post=5)
+    assert count_statements(client, capture_sql, url) == expected
+
+
+@pytest.mark.parametrize(("include", "expected"), INCLUDES)
+def test_detail_includes_run_fixed_number_of_statements(
+    client, capture_sql, make_blog, include, expected
+):
+    [small] = make_blog(posts=1, comments_per_post=1)
+    [large] = make_blog(posts=1, comments_per_post=20)
+
+    for post_id in (small, large):
+        url = f"/api/v1/posts/{post_id}?include={include}"
+        assert count_statements(client, capture_sql, url) == expected
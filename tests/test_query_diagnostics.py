@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.query_diagnostics import NPlusOneDetected
+from app.db.session import SessionLocal
+from app.models import Post
+
+
+def test_lazy_loading_in_a_loop_is_detected(make_blog):
+    # 같은 작성자는 identity map에서 읽혀 SQL이 실행되지 않으므로 작성자를 모두 다르게 만듭니다.
+    make_blog(posts=settings.N_PLUS_ONE_THRESHOLD)
+
+    with SessionLocal() as db:
+        posts = db.scalars(select(Post).order_by(Post.id)).all()
+        # conftest의 strict 모드 추적 구간이 반복된 지연 로딩을 잡아냅니다.
+        with pytest.raises(NPlusOneDetected, match="Post.user"):
+            for post in posts:
+                post.user.email  # noqa: B018
+
+
+def test_eager_loading_is_not_reported(make_blog):
+    make_blog(posts=settings.N_PLUS_ONE_THRESHOLD * 2)
+
+    with SessionLocal() as db:
+        stmt = select(Post).options(selectinload(Post.user)).order_by(Post.id)
+        emails = [post.user.email for post in db.scalars(stmt)]
+
+    assert len(emails) == settings.N_PLUS_ONE_THRESHOLD * 2
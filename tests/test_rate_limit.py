@@ -0,0 +1,79 @@
+import pytest
+
+from app.core.rate_limit import MemoryRateLimitBackend, parse_rate, rate_limiter
+
+NEW_POST = {"title": "title", "content": "content"}
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    """테스트마다 빈 토큰 버킷으로 주어진 범위의 한도를 적용합니다."""
+
+    def apply(**rates: str) -> None:
+        monkeypatch.setattr(rate_limiter, "backend", MemoryRateLimitBackend(100))
+        monkeypatch.setattr(
+            rate_limiter,
+            "rates",
+            {scope: parse_rate(value) for scope, value in rates.items()},
+        )
+
+    return apply
+
+
+def test_exceeding_route_limit_returns_429_with_retry_after(
+    client, make_blog, auth_headers, limits
+):
+    limits(post_create="2/minute")
+    [user_id] = make_blog(posts=1)
+    headers = auth_headers(user_id)
+
+    for _ in range(2):
+        response = client.post("/api/v1/posts/", json=NEW_POST, headers=headers)
+        assert response.status_code == 201, response.text
+
+    response = client.post("/api/v1/posts/", json=NEW_POST, headers=headers)
+
+    assert response.status_code == 429
+    # 토큰 하나가 다시 채워지는 데 30초가 걸립니다.
+    assert 1 <= int(response.headers["Retry-After"]) <= 30
+
+
+def test_per_user_limit_does_not_affect_other_users(
+    client, make_blog, auth_headers, limits
+):
+    limits(post_create="1/minute")
+    first, second = make_blog(posts=2)
+
+    client.post("/api/v1/posts/", json=NEW_POST, headers=auth_headers(first))
+    limited = client.post("/api/v1/posts/", json=NEW_POST, headers=auth_headers(first))
+    other = client.post("/api/v1/posts/", json=NEW_POST, headers=auth_headers(second))
+
+    assert limited.status_code == 429
+    assert other.status_code == 201
+
+
+def test_unconfigured_scope_is_not_limited(client, make_blog, auth_headers, limits):
+    limits(signup="1/minute")
+    [user_id] = make_blog(posts=1)
+
+    for _ in range(3):
+        response = client.post(
+            "/api/v1/posts/", json=NEW_POST, headers=auth_headers(user_id)
+        )
+        assert response.status_code == 201
+
+
+@pytest.mark.parametrize(
+    ("value", "limit", "period"),
+    [("10/minute", 10, 60), ("100/5 minutes", 100, 300), ("1/day", 1, 86400)],
+)
+def test_parse_rate(value, limit, period):
+    rate = parse_rate(value)
+
+    assert (rate.limit, rate.period) == (limit, period)
+
+
+@pytest.mark.parametrize("value", ["0/minute", "10", "10/fortnight"])
+def test_parse_rate_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_rate(value)
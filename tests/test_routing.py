@@ -0,0 +1,184 @@
+import time
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.response_cache import MemoryCacheBackend, ResponseCache
+from app.db.base import Base
+from app.db.routing import (
+    READ_YOUR_WRITES_COOKIE,
+    READ_YOUR_WRITES_HEADER,
+    REPLICA_OK,
+    ReadYourWritesMiddleware,
+    ReplicaSet,
+    _primary_only,
+    routing_session_class,
+    use_primary,
+)
+from app.models import Post, User
+
+REPLICA_READ = select(Post.title).execution_options(**{REPLICA_OK: True})
+
+
+def sqlite_engine(path) -> Engine:
+    return create_engine(f"sqlite:///{path}")
+
+
+def seed(engine: Engine, title: str) -> None:
+    """복제 지연을 흉내 내도록 DB마다 제목이 다른 게시글을 넣습니다."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User), {"id": 1, "email": "a@example.com", "hashed_password": "x"}
+        )
+        conn.execute(
+            insert(Post), {"id": 1, "title": title, "content": "c", "user_id": 1}
+        )
+
+
+@pytest.fixture
+def primary(tmp_path) -> Iterator[Engine]:
+    engine = sqlite_engine(tmp_path / "primary.db")
+    seed(engine, "primary")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica(tmp_path) -> Iterator[Engine]:
+    engine = sqlite_engine(tmp_path / "replica.db")
+    seed(engine, "replica")
+    yield engine
+    engine.dispose()
+
+
+def make_session(primary: Engine, *replicas: Engine) -> sessionmaker[Session]:
+    return sessionmaker(
+        class_=routing_session_class(ReplicaSet(replicas)),
+        bind=primary,
+        expire_on_commit=False,
+    )
+
+
+def titles(engine: Engine) -> list[str]:
+    with engine.connect() as conn:
+        return list(conn.scalars(select(Post.title).order_by(Post.id)))
+
+
+def test_replica_ok_selects_read_replica(primary, replica):
+    with make_session(primary, replica)() as db:
+        assert db.scalars(REPLICA_READ).all() == ["replica"]
+        # 실행 옵션이 없는 조회는 primary에서 실행합니다.
+        assert db.scalars(select(Post.title)).all() == ["primary"]
+
+
+def test_writes_go_to_primary(primary, replica):
+    with make_session(primary, replica)() as db:
+        db.scalars(REPLICA_READ).all()
+        db.add(Post(id=2, title="new", content="c", user_id=1))
+        db.commit()
+
+    assert titles(primary) == ["primary", "new"]
+    assert titles(replica) == ["replica"]
+
+
+def test_use_primary_pins_replica_ok_reads(primary, replica):
+    with make_session(primary, replica)() as db, use_primary():
+        assert db.scalars(REPLICA_READ).all() == ["primary"]
+
+
+def test_down_replica_falls_back_to_primary(primary, tmp_path):
+    # 없는 디렉터리의 SQLite 파일은 연결 단계에서 OperationalError가 납니다.
+    down = sqlite_engine(tmp_path / "missing" / "replica.db")
+    Session = make_session(primary, down)
+
+    with Session() as db:
+        assert db.scalars(REPLICA_READ).all() == ["primary"]
+        # 실패한 복제본 연결이 세션 트랜잭션에 남지 않아 이후 쓰기도 커밋됩니다.
+        db.add(Post(id=2, title="new", content="c", user_id=1))
+        db.commit()
+
+    assert titles(primary) == ["primary", "new"]
+    assert Session.class_.replicas.choose() is None
+
+
+def test_down_replica_is_skipped_for_next_replica(primary, replica, tmp_path):
+    down = sqlite_engine(tmp_path / "missing" / "replica.db")
+    Session = make_session(primary, down, replica)
+
+    with Session() as db:
+        assert db.scalars(REPLICA_READ).all() == ["replica"]
+    assert Session.class_.replicas.choose() is replica
+
+
+@pytest.fixture
+def ryw_client() -> Iterator[TestClient]:
+    """요청이 primary로 고정되었는지 돌려주는 ReadYourWritesMiddleware 앱입니다."""
+    ryw_app = FastAPI()
+    ryw_app.add_middleware(ReadYourWritesMiddleware)
+
+    @ryw_app.get("/")
+    def read() -> dict[str, bool]:
+        return {"primary": _primary_only.get()}
+
+    @ryw_app.post("/", status_code=201)
+    def write() -> dict[str, bool]:
+        return {"primary": _primary_only.get()}
+
+    with TestClient(ryw_app) as client:
+        yield client
+
+
+def test_reads_use_replica_without_recent_write(ryw_client):
+    assert ryw_client.get("/").json() == {"primary": False}
+
+
+def test_write_is_pinned_and_sets_read_your_writes_marker(ryw_client):
+    response = ryw_client.post("/")
+
+    assert response.json() == {"primary": True}
+    until = int(response.headers[READ_YOUR_WRITES_HEADER])
+    assert until > time.time()
+    assert response.cookies[READ_YOUR_WRITES_COOKIE] == str(until)
+
+
+def test_read_your_writes_cookie_pins_reads_to_primary(ryw_client):
+    ryw_client.post("/")
+
+    # TestClient는 응답 쿠키를 다음 요청에 그대로 보냅니다.
+    assert ryw_client.get("/").json() == {"primary": True}
+
+
+def test_read_your_writes_header_pins_reads_to_primary(ryw_client):
+    until = ryw_client.post("/").headers[READ_YOUR_WRITES_HEADER]
+    ryw_client.cookies.clear()
+
+    assert ryw_client.get("/").json() == {"primary": False}
+    response = ryw_client.get("/", headers={READ_YOUR_WRITES_HEADER: until})
+    assert response.json() == {"primary": True}
+
+
+def test_expired_read_your_writes_marker_is_ignored(ryw_client):
+    expired = str(int(time.time()) - 1)
+
+    response = ryw_client.get("/", headers={READ_YOUR_WRITES_HEADER: expired})
+
+    assert response.json() == {"primary": False}
+
+
+def test_primary_pinned_requests_never_read_replica_cache_entries(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_REPLICA_URLS", ["sqlite:///replica.db"])
+    cache = ResponseCache(MemoryCacheBackend(maxsize=16, ttl=60), ttl=60)
+    request = Request(
+        {"type": "http", "path": "/api/v1/posts/", "query_string": b"", "headers": []}
+    )
+
+    # 다른 클라이언트가 복제 지연 중인 복제본에서 읽은 목록을 캐시에 저장합니다.
+    cache.store(cache.key(request, "posts"), b"[]")
+    with use_primary():
+        assert cache.get(cache.key(request, "posts")) is None
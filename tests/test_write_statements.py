@@ -0,0 +1,177 @@
+import pytest
+from sqlalchemy import select
+
+from app.core.query_diagnostics import track_queries
+from app.crud import comment as crud_comment
+from app.crud import post as crud_post
+from app.crud import user as crud_user
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import Comment, Post, User
+from app.schema.comment import CommentCreate, CommentUpdate
+from app.schema.post import PostCreate, PostUpdate
+from app.schema.user import UserCreate, UserUpdate
+
+new_post = PostCreate(title="t", content="c")
+new_comment = CommentCreate(content="c")
+new_user = UserCreate(email="new@example.com", password="password123")
+
+# (수정 대상 모델, 쓰기 함수, 쓰기 SQL 접두어, 전체 SQL 문 수)
+# 수정 대상 모델이 None이면 쓰기 함수는 게시글 ID(= 작성자 ID)를 받습니다.
+SYNC_WRITES = [
+    pytest.param(
+        None,
+        lambda db, post_id: crud_post.create_post(db, post_id, new_post),
+        "INSERT INTO posts",
+        1,
+        id="create_post",
+    ),
+    pytest.param(
+        Post,
+        lambda db, post: crud_post.update_post(db, post, PostUpdate(title="new")),
+        "UPDATE posts",
+        1,
+        id="update_post",
+    ),
+    pytest.param(
+        None,
+        lambda db, post_id: crud_comment.create_comment(
+            db, post_id, post_id, new_comment
+        ),
+        "INSERT INTO comments",
+        # 게시글 댓글 수 갱신과 알림 작업 등록은 의도된 쓰기입니다.
+        3,
+        id="create_comment",
+    ),
+    pytest.param(
+        Comment,
+        lambda db, comment: crud_comment.update_comment(
+            db, comment, CommentUpdate(content="new")
+        ),
+        "UPDATE comments",
+        1,
+        id="update_comment",
+    ),
+    pytest.param(
+        None,
+        lambda db, post_id: crud_user.create_user(db, new_user),
+        "INSERT INTO users",
+        1,
+        id="create_user",
+    ),
+    pytest.param(
+        User,
+        lambda db, user: crud_user.update_user(
+            db, user, UserUpdate(email="changed@example.com")
+        ),
+        "UPDATE users",
+        1,
+        id="update_user",
+    ),
+]
+
+ASYNC_WRITES = [
+    pytest.param(
+        None,
+        lambda db, post_id: crud_post.create_post_async(db, post_id, new_post),
+        "INSERT INTO posts",
+        1,
+        id="create_post_async",
+    ),
+    pytest.param(
+        Post,
+        lambda db, post: crud_post.update_post_if_permitted_async(
+            db, post.id, PostUpdate(title="new"), post.user_id, is_admin=False
+        ),
+        "UPDATE posts",
+        1,
+        id="update_post_if_permitted_async",
+    ),
+    pytest.param(
+        None,
+        lambda db, post_id: crud_comment.create_comment_async(
+            db, post_id, post_id, new_comment
+        ),
+        "INSERT INTO comments",
+        3,
+        id="create_comment_async",
+    ),
+    pytest.param(
+        Comment,
+        lambda db, comment: crud_comment.update_comment_if_permitted_async(
+            db,
+            comment.post_id,
+            comment.id,
+            CommentUpdate(content="new"),
+            comment.user_id,
+            is_admin=False,
+        ),
+        "UPDATE comments",
+        1,
+        id="update_comment_if_permitted_async",
+    ),
+    pytest.param(
+        None,
+        lambda db, post_id: crud_user.create_user_async(db, new_user),
+        "INSERT INTO users",
+        1,
+        id="create_user_async",
+    ),
+    pytest.param(
+        User,
+        lambda db, user: crud_user.update_user_async(
+            db, user, UserUpdate(email="changed@example.com")
+        ),
+        "UPDATE users",
+        1,
+        id="update_user_async",
+    ),
+]
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def assert_single_write(tracker, write: str, total: int) -> None:
+    """
+    대상 테이블 쓰기가 RETURNING이 붙은 한 문장이고 뒤이어 다시 읽지 않았는지
+    확인합니다.
+    """
+    statements = list(tracker.statements.elements())
+    writes = [s for s in statements if s.startswith(write)]
+    assert len(writes) == 1, statements
+    assert "RETURNING" in writes[0]
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(statements) == total, statements
+
+
+@pytest.mark.parametrize(("model", "write_fn", "write", "total"), SYNC_WRITES)
+def test_write_is_one_returning_statement(make_blog, model, write_fn, write, total):
+    [post_id] = make_blog(posts=1, comments_per_post=1)
+
+    with SessionLocal() as db:
+        target = post_id if model is None else db.scalars(select(model)).one()
+        with track_queries() as tracker:
+            written = write_fn(db, target)
+            assert written.id and written.created_at and written.updated_at
+
+    assert_single_write(tracker, write, total)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(("model", "write_fn", "write", "total"), ASYNC_WRITES)
+async def test_async_write_is_one_returning_statement(
+    make_blog, model, write_fn, write, total
+):
+    [post_id] = make_blog(posts=1, comments_per_post=1)
+
+    async with AsyncSessionLocal() as db:
+        target = post_id if model is None else (await db.scalars(select(model))).one()
+        with track_queries() as tracker:
+            written = await write_fn(db, target)
+            assert written.id and written.created_at and written.updated_at
+
+    # aiosqlite 커넥션은 이벤트 루프에 묶이므로 테스트마다 풀을 비웁니다.
+    await async_engine.dispose()
+    assert_single_write(tracker, write, total)